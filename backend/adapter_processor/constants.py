@@ -27,3 +27,9 @@ class AdapterKeys:
     ADAPTER_NAME = "adapter_name"
     ADAPTER_CREATED_BY = "created_by_email"
     ADAPTER_CONTEXT_WINDOW_SIZE = "context_window_size"
+
+
+class AdapterCacheKeys:
+    # Bumped on changes to an adapter instance, read by the prompt service to
+    # drop the adapters it created from the old config
+    CONFIG_VERSION_PREFIX = "adapter_config_version:"
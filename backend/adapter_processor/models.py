@@ -4,13 +4,17 @@ import uuid
 from typing import Any
 
 from account.models import User
+from adapter_processor.constants import AdapterCacheKeys
 from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
 from django.db import models
 from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from unstract.sdk.adapters.adapterkit import Adapterkit
 from unstract.sdk.adapters.enums import AdapterTypes
 from unstract.sdk.adapters.exceptions import AdapterError
+from utils.cache_service import CacheService
 from utils.exceptions import InvalidEncryptionKey
 from utils.models.base_model import BaseModel
 
@@ -187,3 +191,14 @@ class UserDefaultAdapter(BaseModel):
         null=True,
         related_name="default_x2text_adapter",
     )
+
+
+# Executed every time an adapter instance is saved or deleted.
+@receiver([post_save, post_delete], sender=AdapterInstance)
+def bump_adapter_config_version(sender, instance, **kwargs):
+    """Signal to drop the adapters cached by the prompt service for this
+    adapter instance."""
+    try:
+        CacheService.incr(f"{AdapterCacheKeys.CONFIG_VERSION_PREFIX}{instance.id}")
+    except Exception as e:
+        logger.warning(f"Unable to bump config version of adapter {instance.id}: {e}")
@@ -4,14 +4,18 @@ import uuid
 from typing import Any
 
 from account_v2.models import User
+from adapter_processor_v2.constants import AdapterCacheKeys
 from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
 from django.db import models
 from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from tenant_account_v2.models import OrganizationMember
 from unstract.sdk.adapters.adapterkit import Adapterkit
 from unstract.sdk.adapters.enums import AdapterTypes
 from unstract.sdk.adapters.exceptions import AdapterError
+from utils.cache_service import CacheService
 from utils.exceptions import InvalidEncryptionKey
 from utils.models.base_model import BaseModel
 from utils.models.organization_mixin import (
@@ -206,3 +210,14 @@ class UserDefaultAdapter(BaseModel):
         verbose_name = "Default Adapter for Organization User"
         verbose_name_plural = "Default Adapters for Organization Users"
         db_table = "default_organization_user_adapter"
+
+
+# Executed every time an adapter instance is saved or deleted.
+@receiver([post_save, post_delete], sender=AdapterInstance)
+def bump_adapter_config_version(sender, instance, **kwargs):
+    """Signal to drop the adapters cached by the prompt service for this
+    adapter instance."""
+    try:
+        CacheService.incr(f"{AdapterCacheKeys.CONFIG_VERSION_PREFIX}{instance.id}")
+    except Exception as e:
+        logger.warning(f"Unable to bump config version of adapter {instance.id}: {e}")
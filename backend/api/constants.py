@@ -4,4 +4,5 @@ class ApiExecution:
     FILES_FORM_DATA: str = "files"
     TIMEOUT_FORM_DATA: str = "timeout"
     INCLUDE_METADATA: str = "include_metadata"
+    FORCE_REPROCESS: str = "force_reprocess"
     USE_FILE_HISTORY: str = "use_file_history"  # Undocumented parameter
@@ -5,6 +5,7 @@ from urllib.parse import urlencode
 
 from api.api_key_validator import BaseAPIKeyValidator
 from api.constants import ApiExecution
+from api.dto import SubmittedExecution
 from api.exceptions import (
     ApiKeyCreateException,
     APINotFound,
@@ -15,6 +16,7 @@ from api.key_helper import KeyHelper
 from api.models import APIDeployment, APIKey
 from api.serializers import APIExecutionResponseSerializer
 from api.utils import APIDeploymentUtils
+from celery.result import AsyncResult
 from django.core.files.uploadedfile import UploadedFile
 from django.db import connection
 from rest_framework.request import Request
@@ -22,9 +24,11 @@ from rest_framework.serializers import Serializer
 from rest_framework.utils.serializer_helpers import ReturnDict
 from utils.constants import CeleryQueue
 from workflow_manager.endpoint.destination import DestinationConnector
+from workflow_manager.endpoint.dto import FileHash
 from workflow_manager.endpoint.source import SourceConnector
 from workflow_manager.workflow.dto import ExecutionResponse
 from workflow_manager.workflow.enums import ExecutionStatus
+from workflow_manager.workflow.file_history_helper import FileHistoryHelper
 from workflow_manager.workflow.models.workflow import Workflow
 from workflow_manager.workflow.workflow_helper import WorkflowHelper
 
@@ -146,25 +150,40 @@ class DeploymentHelper(BaseAPIKeyValidator):
         organization_name: str,
         api: APIDeployment,
         file_objs: list[UploadedFile],
-        timeout: int,
         include_metadata: bool = False,
         use_file_history: bool = False,
-    ) -> ReturnDict:
-        """Execute workflow by api.
+        force_reprocess: bool = False,
+    ) -> SubmittedExecution:
+        """Execute workflow by api, without waiting for it to complete.
+
+        Requests whose files were all processed by the current version of the
+        workflow are answered from file history without enqueueing anything.
 
         Args:
             organization_name (str): organization name
             api (APIDeployment): api model object
             file_obj (UploadedFile): input file
+            include_metadata (bool): Include metadata in the result
             use_file_history (bool): Use FileHistory table to return results on already
                 processed files. Defaults to False
+            force_reprocess (bool): Process the files again even if they are in
+                file history. Defaults to False
 
         Returns:
-            ReturnDict: execution status/ result
+            SubmittedExecution: Enqueued execution, its result is returned by
+            `get_execution_result()`
         """
         workflow_id = api.workflow.id
         pipeline_id = api.id
         execution_id = str(uuid.uuid4())
+        execution = SubmittedExecution(
+            workflow_id=workflow_id,
+            execution_id=execution_id,
+            status_api=DeploymentHelper.construct_status_endpoint(
+                api_endpoint=api.api_endpoint, execution_id=execution_id
+            ),
+            include_metadata=include_metadata,
+        )
 
         hash_values_of_files = SourceConnector.add_input_file_to_api_storage(
             workflow_id=workflow_id,
@@ -172,20 +191,126 @@ class DeploymentHelper(BaseAPIKeyValidator):
             file_objs=file_objs,
             use_file_history=use_file_history,
         )
+        if use_file_history and force_reprocess:
+            # Files are processed again, their history is replaced once done
+            for file_hash in hash_values_of_files.values():
+                file_hash.is_executed = False
+        elif use_file_history:
+            execution.cached_result = cls._get_results_from_file_history(
+                workflow=api.workflow, hash_values_of_files=hash_values_of_files
+            )
+            if execution.cached_result is not None:
+                DestinationConnector.delete_api_storage_dir(
+                    workflow_id=workflow_id, execution_id=execution_id
+                )
+                return execution
         try:
-            result = WorkflowHelper.execute_workflow_async(
+            async_result = WorkflowHelper.enqueue_workflow_execution(
                 workflow_id=workflow_id,
                 pipeline_id=pipeline_id,
                 hash_values_of_files=hash_values_of_files,
-                timeout=timeout,
                 execution_id=execution_id,
                 queue=CeleryQueue.CELERY_API_DEPLOYMENTS,
                 use_file_history=use_file_history,
             )
-            result.status_api = DeploymentHelper.construct_status_endpoint(
-                api_endpoint=api.api_endpoint, execution_id=execution_id
+            execution.task_id = async_result.id
+        except Exception as error:
+            # Reported along with clearing the files by `get_execution_result()`
+            logger.error(f"Error while enqueueing execution {execution_id}: {error}")
+            execution.error = str(error)
+        return execution
+
+    @staticmethod
+    def _get_results_from_file_history(
+        workflow: Workflow, hash_values_of_files: dict[str, FileHash]
+    ) -> Optional[list[dict[str, Any]]]:
+        """Get the API results of the files of a request from file history.
+
+        Args:
+            workflow (Workflow): Workflow of the API deployment
+            hash_values_of_files (dict[str, FileHash]): Files of the request
+
+        Returns:
+            Optional[list[dict[str, Any]]]: Results of the files, None unless
+            all of them were processed by the current version of the workflow
+        """
+        if not all(
+            file_hash.is_executed for file_hash in hash_values_of_files.values()
+        ):
+            return None
+        file_histories = FileHistoryHelper.get_current_file_histories(
+            workflow=workflow,
+            cache_keys=[
+                file_hash.file_hash for file_hash in hash_values_of_files.values()
+            ],
+        )
+        results: list[dict[str, Any]] = []
+        for file_name, file_hash in hash_values_of_files.items():
+            file_history = file_histories.get(file_hash.file_hash)
+            if not file_history:
+                return None
+            results.append(
+                DestinationConnector.get_api_result_from_history(
+                    file_name=file_name, file_history=file_history
+                )
             )
-            if include_metadata:
+        return results
+
+    @staticmethod
+    async def wait_for_execution(execution: SubmittedExecution, timeout: int) -> bool:
+        """Waits for an execution submitted by `execute_workflow()` to
+        complete, without blocking a thread.
+
+        Args:
+            execution (SubmittedExecution): Enqueued execution
+            timeout (int): Seconds to wait for completion (-1 : async execution)
+
+        Returns:
+            bool: False if the wait timed out before the execution completed
+        """
+        if not execution.task_id or timeout < 0:
+            # Nothing was enqueued to wait on, or the caller doesn't wait
+            return True
+        return await WorkflowHelper.wait_for_execution_async(
+            execution.execution_id, timeout=timeout
+        )
+
+    @classmethod
+    def get_execution_result(
+        cls, execution: SubmittedExecution, timed_out: bool = False
+    ) -> ReturnDict:
+        """Result of an execution submitted by `execute_workflow()`.
+
+        Args:
+            execution (SubmittedExecution): Enqueued execution
+            timed_out (bool): Whether the caller stopped waiting before the
+                execution completed. Defaults to False
+
+        Returns:
+            ReturnDict: execution status/ result
+        """
+        workflow_id = execution.workflow_id
+        execution_id = execution.execution_id
+        try:
+            if execution.error:
+                raise InvalidAPIRequest(execution.error)
+            if execution.task_id:
+                result = WorkflowHelper.get_execution_response(
+                    workflow_id=workflow_id,
+                    execution_id=execution_id,
+                    async_result=AsyncResult(execution.task_id),
+                    timed_out=timed_out,
+                )
+                result.status_api = execution.status_api
+            else:
+                # Answered from file history, there's no status to check later
+                result = ExecutionResponse(
+                    workflow_id=workflow_id,
+                    execution_id=execution_id,
+                    execution_status=ExecutionStatus.COMPLETED.value,
+                    result=execution.cached_result,
+                )
+            if execution.include_metadata:
                 result.remove_result_metadata_keys(keys_to_remove=["highlight_data"])
             else:
                 result.remove_result_metadata_keys()
@@ -90,6 +90,8 @@ class ExecutionRequestSerializer(Serializer):
         use_file_history (bool): Flag to use FileHistory to save and retrieve
             responses quickly. This is undocumented to the user and can be
             helpful for demos.
+        force_reprocess (bool): Flag to process files again even if they are
+            in FileHistory
     """
 
     timeout = IntegerField(
@@ -97,6 +99,7 @@ class ExecutionRequestSerializer(Serializer):
     )
     include_metadata = BooleanField(default=False)
     use_file_history = BooleanField(default=False)
+    force_reprocess = BooleanField(default=False)
 
 
 class APIDeploymentListSerializer(ModelSerializer):
@@ -1,9 +1,11 @@
 import json
 import logging
+from collections.abc import Callable
 from typing import Any, Optional
 
 from api_v2.constants import ApiExecution
 from api_v2.deployment_helper import DeploymentHelper
+from api_v2.dto import SubmittedExecution
 from api_v2.exceptions import InvalidAPIRequest, NoActiveAPIKeyError
 from api_v2.models import APIDeployment
 from api_v2.postman_collection.dto import PostmanCollection
@@ -13,8 +15,10 @@ from api_v2.serializers import (
     DeploymentResponseSerializer,
     ExecutionRequestSerializer,
 )
+from asgiref.sync import sync_to_async
+from django.db import connection, transaction
 from django.db.models import QuerySet
-from django.http import HttpResponse
+from django.http import HttpRequest, HttpResponse
 from permissions.permission import IsOwner
 from rest_framework import serializers, status, views, viewsets
 from rest_framework.decorators import action
@@ -28,6 +32,62 @@ logger = logging.getLogger(__name__)
 
 
 class DeploymentExecution(views.APIView):
+    # Dispatched on the event loop, so that requests waiting on their execution
+    # don't hold a thread while doing so when served through `backend.asgi`
+    view_is_async = True
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any) -> Callable[..., Any]:
+        # Django can't open ATOMIC_REQUESTS transactions around async views,
+        # `dispatch()` opens them around the synchronous handling instead
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
+
+    async def dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """Handles the request through DRF in a thread, then waits for the
+        execution it submitted, if any, to complete.
+        """
+        self.submitted_execution: Optional[SubmittedExecution] = None
+        self.timeout = -1
+        response = await sync_to_async(self.dispatch_atomically)(
+            request, *args, **kwargs
+        )
+        execution = self.submitted_execution
+        if not execution:
+            return response
+        completed = await DeploymentHelper.wait_for_execution(
+            execution, timeout=self.timeout
+        )
+        return await sync_to_async(self.respond_with_result)(
+            execution, timed_out=not completed
+        )
+
+    def dispatch_atomically(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """DRF's dispatch, in a transaction if ATOMIC_REQUESTS is enabled."""
+        if connection.settings_dict["ATOMIC_REQUESTS"]:
+            with transaction.atomic():
+                return super().dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    def respond_with_result(
+        self, execution: SubmittedExecution, timed_out: bool
+    ) -> HttpResponse:
+        try:
+            result = DeploymentHelper.get_execution_result(
+                execution=execution, timed_out=timed_out
+            )
+            if "error" in result and result["error"]:
+                response_status = status.HTTP_422_UNPROCESSABLE_ENTITY
+            else:
+                response_status = status.HTTP_200_OK
+            response = Response({"message": result}, status=response_status)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        return self.finalize_response(self.request, response, *self.args, **self.kwargs)
+
     def initialize_request(
         self, request: Request, *args: Any, **kwargs: Any
     ) -> Request:
@@ -53,21 +113,21 @@ class DeploymentExecution(views.APIView):
         include_metadata = (
             request.data.get(ApiExecution.INCLUDE_METADATA, "false").lower() == "true"
         )
+        force_reprocess = (
+            request.data.get(ApiExecution.FORCE_REPROCESS, "false").lower() == "true"
+        )
         if not file_objs or len(file_objs) == 0:
             raise InvalidAPIRequest("File shouldn't be empty")
-        response = DeploymentHelper.execute_workflow(
+        # Waited on by `dispatch()`, outside of the thread handling the request
+        self.timeout = timeout
+        self.submitted_execution = DeploymentHelper.execute_workflow(
             organization_name=org_name,
             api=api,
             file_objs=file_objs,
-            timeout=timeout,
             include_metadata=include_metadata,
+            force_reprocess=force_reprocess,
         )
-        if "error" in response and response["error"]:
-            return Response(
-                {"message": response},
-                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            )
-        return Response({"message": response}, status=status.HTTP_200_OK)
+        return Response(status=status.HTTP_202_ACCEPTED)
 
     @DeploymentHelper.validate_api_key
     def get(
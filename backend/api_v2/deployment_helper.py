@@ -4,6 +4,7 @@ from typing import Any, Optional
 from urllib.parse import urlencode
 
 from api_v2.api_key_validator import BaseAPIKeyValidator
+from api_v2.dto import SubmittedExecution
 from api_v2.exceptions import (
     ApiKeyCreateException,
     APINotFound,
@@ -14,14 +15,17 @@ from api_v2.key_helper import KeyHelper
 from api_v2.models import APIDeployment, APIKey
 from api_v2.serializers import APIExecutionResponseSerializer
 from api_v2.utils import APIDeploymentUtils
+from celery.result import AsyncResult
 from django.core.files.uploadedfile import UploadedFile
 from rest_framework.request import Request
 from rest_framework.serializers import Serializer
 from rest_framework.utils.serializer_helpers import ReturnDict
 from workflow_manager.endpoint_v2.destination import DestinationConnector
+from workflow_manager.endpoint_v2.dto import FileHash
 from workflow_manager.endpoint_v2.source import SourceConnector
 from workflow_manager.workflow_v2.dto import ExecutionResponse
 from workflow_manager.workflow_v2.enums import ExecutionStatus
+from workflow_manager.workflow_v2.file_history_helper import FileHistoryHelper
 from workflow_manager.workflow_v2.models.workflow import Workflow
 from workflow_manager.workflow_v2.workflow_helper import WorkflowHelper
 
@@ -129,41 +133,161 @@ class DeploymentHelper(BaseAPIKeyValidator):
         organization_name: str,
         api: APIDeployment,
         file_objs: list[UploadedFile],
-        timeout: int,
         include_metadata: bool = False,
-    ) -> ReturnDict:
-        """Execute workflow by api.
+        force_reprocess: bool = False,
+    ) -> SubmittedExecution:
+        """Execute workflow by api, without waiting for it to complete.
+
+        Requests whose files were all processed by the current version of the
+        workflow are answered from file history without enqueueing anything.
 
         Args:
             organization_name (str): organization name
             api (APIDeployment): api model object
             file_obj (UploadedFile): input file
+            include_metadata (bool): Include metadata in the result
+            force_reprocess (bool): Process the files again even if they are in
+                file history. Defaults to False
 
         Returns:
-            ReturnDict: execution status/ result
+            SubmittedExecution: Enqueued execution, its result is returned by
+            `get_execution_result()`
         """
         workflow_id = api.workflow.id
         pipeline_id = api.id
         execution_id = str(uuid.uuid4())
+        execution = SubmittedExecution(
+            workflow_id=workflow_id,
+            execution_id=execution_id,
+            status_api=DeploymentHelper.construct_status_endpoint(
+                api_endpoint=api.api_endpoint, execution_id=execution_id
+            ),
+            include_metadata=include_metadata,
+        )
 
         hash_values_of_files = SourceConnector.add_input_file_to_api_storage(
             workflow_id=workflow_id,
             execution_id=execution_id,
             file_objs=file_objs,
         )
+        if force_reprocess:
+            # Files are processed again, their history is replaced once done
+            for file_hash in hash_values_of_files.values():
+                file_hash.is_executed = False
+        else:
+            execution.cached_result = cls._get_results_from_file_history(
+                workflow=api.workflow, hash_values_of_files=hash_values_of_files
+            )
+            if execution.cached_result is not None:
+                DestinationConnector.delete_api_storage_dir(
+                    workflow_id=workflow_id, execution_id=execution_id
+                )
+                return execution
         try:
-            result = WorkflowHelper.execute_workflow_async(
+            async_result = WorkflowHelper.enqueue_workflow_execution(
                 workflow_id=workflow_id,
                 pipeline_id=pipeline_id,
                 hash_values_of_files=hash_values_of_files,
-                timeout=timeout,
                 execution_id=execution_id,
-                include_metadata=include_metadata,
             )
-            result.status_api = DeploymentHelper.construct_status_endpoint(
-                api_endpoint=api.api_endpoint, execution_id=execution_id
+            execution.task_id = async_result.id
+        except Exception as error:
+            # Reported along with clearing the files by `get_execution_result()`
+            logger.error(f"Error while enqueueing execution {execution_id}: {error}")
+            execution.error = str(error)
+        return execution
+
+    @staticmethod
+    def _get_results_from_file_history(
+        workflow: Workflow, hash_values_of_files: dict[str, FileHash]
+    ) -> Optional[list[dict[str, Any]]]:
+        """Get the API results of the files of a request from file history.
+
+        Args:
+            workflow (Workflow): Workflow of the API deployment
+            hash_values_of_files (dict[str, FileHash]): Files of the request
+
+        Returns:
+            Optional[list[dict[str, Any]]]: Results of the files, None unless
+            all of them were processed by the current version of the workflow
+        """
+        if not all(
+            file_hash.is_executed for file_hash in hash_values_of_files.values()
+        ):
+            return None
+        file_histories = FileHistoryHelper.get_current_file_histories(
+            workflow=workflow,
+            cache_keys=[
+                file_hash.file_hash for file_hash in hash_values_of_files.values()
+            ],
+        )
+        results: list[dict[str, Any]] = []
+        for file_name, file_hash in hash_values_of_files.items():
+            file_history = file_histories.get(file_hash.file_hash)
+            if not file_history:
+                return None
+            results.append(
+                DestinationConnector.get_api_result_from_history(
+                    file_name=file_name, file_history=file_history
+                )
             )
-            if include_metadata:
+        return results
+
+    @staticmethod
+    async def wait_for_execution(execution: SubmittedExecution, timeout: int) -> bool:
+        """Waits for an execution submitted by `execute_workflow()` to
+        complete, without blocking a thread.
+
+        Args:
+            execution (SubmittedExecution): Enqueued execution
+            timeout (int): Seconds to wait for completion (-1 : async execution)
+
+        Returns:
+            bool: False if the wait timed out before the execution completed
+        """
+        if not execution.task_id or timeout < 0:
+            # Nothing was enqueued to wait on, or the caller doesn't wait
+            return True
+        return await WorkflowHelper.wait_for_execution_async(
+            execution.execution_id, timeout=timeout
+        )
+
+    @classmethod
+    def get_execution_result(
+        cls, execution: SubmittedExecution, timed_out: bool = False
+    ) -> ReturnDict:
+        """Result of an execution submitted by `execute_workflow()`.
+
+        Args:
+            execution (SubmittedExecution): Enqueued execution
+            timed_out (bool): Whether the caller stopped waiting before the
+                execution completed. Defaults to False
+
+        Returns:
+            ReturnDict: execution status/ result
+        """
+        workflow_id = execution.workflow_id
+        execution_id = execution.execution_id
+        try:
+            if execution.error:
+                raise InvalidAPIRequest(execution.error)
+            if execution.task_id:
+                result = WorkflowHelper.get_execution_response(
+                    workflow_id=workflow_id,
+                    execution_id=execution_id,
+                    async_result=AsyncResult(execution.task_id),
+                    timed_out=timed_out,
+                )
+                result.status_api = execution.status_api
+            else:
+                # Answered from file history, there's no status to check later
+                result = ExecutionResponse(
+                    workflow_id=workflow_id,
+                    execution_id=execution_id,
+                    execution_status=ExecutionStatus.COMPLETED.value,
+                    result=execution.cached_result,
+                )
+            if execution.include_metadata:
                 result.remove_result_metadata_keys(keys_to_remove=["highlight_data"])
             else:
                 result.remove_result_metadata_keys()
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class SubmittedExecution:
+    """Execution of an API deployment enqueued by
+    `DeploymentHelper.execute_workflow()`."""
+
+    workflow_id: str
+    execution_id: str
+    status_api: str
+    include_metadata: bool = False
+    task_id: Optional[str] = None
+    error: Optional[str] = None
+    # Results of the files when answered from file history, nothing is enqueued
+    cached_result: Optional[list[dict[str, Any]]] = None
@@ -3,7 +3,7 @@ import os
 from typing import Any
 
 from celery import shared_task
-from utils.log_events import handle_user_logs
+from utils.log_events import handle_user_logs, handle_user_logs_batch
 
 from unstract.core.constants import LogEventArgument, LogProcessingTask
 
@@ -24,10 +24,19 @@ class TaskRegistry:
                 USER_SESSION_ID: The room to be processed.
                 EVENT: The event to be processed Ex: logs:{session_id}.
                 MESSAGE: The message to be processed Ex: execution log.
+                MESSAGES: Messages published together, in place of MESSAGE.
         """
-        log_message = kwargs.get(LogEventArgument.MESSAGE)
         room = kwargs.get(LogEventArgument.USER_SESSION_ID)
         event = kwargs.get(LogEventArgument.EVENT)
+        log_messages = kwargs.get(LogEventArgument.MESSAGES)
+        if log_messages is not None:
+            logger.debug(
+                f"[{os.getpid()}] {len(log_messages)} log messages received "
+                f"for the room {room}"
+            )
+            handle_user_logs_batch(room=room, event=event, messages=log_messages)
+            return
+        log_message = kwargs.get(LogEventArgument.MESSAGE)
         logger.debug(
             f"[{os.getpid()}] Log message received: {log_message} for the room {room}"
         )
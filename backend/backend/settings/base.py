@@ -118,6 +118,34 @@ STRUCTURE_TOOL_IMAGE_NAME = get_required_setting("STRUCTURE_TOOL_IMAGE_NAME")
 STRUCTURE_TOOL_IMAGE_TAG = get_required_setting("STRUCTURE_TOOL_IMAGE_TAG")
 WORKFLOW_DATA_DIR = os.environ.get("WORKFLOW_DATA_DIR")
 API_STORAGE_DIR = os.environ.get("API_STORAGE_DIR")
+# Directory where Django spools large uploads, keeping it on the volume of
+# API_STORAGE_DIR lets API deployment uploads be moved into place without a copy
+FILE_UPLOAD_TEMP_DIR = os.environ.get("FILE_UPLOAD_TEMP_DIR")
+# Chunk size (in bytes) used while streaming files from a source connector
+SOURCE_FILE_READ_CHUNK_SIZE = int(
+    os.environ.get("SOURCE_FILE_READ_CHUNK_SIZE", 4 * 1024 * 1024)
+)
+# Number of threads used to list directories of a source connector
+SOURCE_LISTING_CONCURRENCY = int(os.environ.get("SOURCE_LISTING_CONCURRENCY", 8))
+# Number of upcoming source files downloaded ahead during an execution
+SOURCE_PREFETCH_COUNT = int(os.environ.get("SOURCE_PREFETCH_COUNT", 2))
+# Default number of batches the files of an execution are split into and
+# processed in parallel by celery workers, 1 processes them in a single task
+WORKFLOW_MAX_CONCURRENT_BATCHES = int(
+    os.environ.get("WORKFLOW_MAX_CONCURRENT_BATCHES", 1)
+)
+# Overlap copying a file, running the tools on the previous one and handling
+# the output of the one before it, instead of processing files one at a time
+WORKFLOW_FILE_PIPELINING = CommonUtils.str_to_bool(
+    os.environ.get("WORKFLOW_FILE_PIPELINING", "False")
+)
+# TTL of the (path, size, etag/mtime) -> content hash index of source files
+FILE_FINGERPRINT_INDEX_TTL = int(
+    os.environ.get("FILE_FINGERPRINT_INDEX_TTL", 7 * 24 * 60 * 60)
+)
+# TTL of the compiled tool instances of a workflow reused across executions,
+# caching is disabled when 0
+WORKFLOW_EXECUTION_PLAN_TTL = int(os.environ.get("WORKFLOW_EXECUTION_PLAN_TTL", 3600))
 CACHE_TTL_SEC = os.environ.get("CACHE_TTL_SEC", 10800)
 
 DEFAULT_AUTH_USERNAME = os.environ.get("DEFAULT_AUTH_USERNAME", "unstract")
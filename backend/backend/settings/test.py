@@ -1,3 +1,6 @@
 from backend.settings.base import *  # noqa: F401, F403
 
 DEBUG = True
+
+# Read by the Socket.IO server set up in utils.log_events
+CORS_ALLOWED_ORIGINS: list[str] = []
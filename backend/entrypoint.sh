@@ -6,6 +6,19 @@ if [ "$cmd" = "migrate" ]; then
     .venv/bin/python manage.py migrate
 fi
 
+if [ "$cmd" = "api-deployment" ]; then
+    # Serves API deployment executions through ASGI, so that requests waiting
+    # on their execution to complete don't hold a worker thread
+    exec .venv/bin/gunicorn \
+        --bind 0.0.0.0:8000 \
+        --workers 2 \
+        --worker-class uvicorn.workers.UvicornWorker \
+        --log-level debug \
+        --timeout 600 \
+        --access-logfile - \
+        backend.asgi:application
+fi
+
 # NOTE: Leaving below for reference incase required in the future
 # python manage.py runserver 0.0.0.0:8000 --insecure
 # NOTE updated socket threads
@@ -514,7 +514,8 @@ class MigrationQuery:
                         prompt_grammer, monitor_llm_id, created_by_id,
                         modified_by_id, exclude_failed,
                         single_pass_extraction_mode, challenge_llm_id,
-                        enable_challenge, enable_highlight, created_at, modified_at
+                        enable_challenge, enable_highlight, enable_answer_cache,
+                        created_at, modified_at
                     FROM "{schema}".prompt_studio_core_customtool;
                 """,
                 "dest_query": f"""
@@ -525,10 +526,10 @@ class MigrationQuery:
                         prompt_grammer, monitor_llm_id, created_by_id,
                         modified_by_id, exclude_failed,
                         single_pass_extraction_mode, challenge_llm_id,
-                        enable_challenge,
-                        enable_highlight, created_at, modified_at, organization_id
+                        enable_challenge, enable_highlight, enable_answer_cache,
+                        created_at, modified_at, organization_id
                     ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, {organization_id});
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, {organization_id});
                 """,
                 "dest_table": "custom_tool",
             },
@@ -30,6 +30,8 @@ class ToolStudioPromptKeys:
     ID = "id"
     FILE_NAME = "file_name"
     FILE_HASH = "file_hash"
+    INDEX_MARKERS = "index_markers"
+    INDEXED_AT = "indexed_at"
     TOOL_ID = "tool_id"
     NAME = "name"
     ACTIVE = "active"
@@ -78,6 +80,9 @@ class ToolStudioPromptKeys:
     EXTRACT = "extract"
     TOOL_SETTINGS = "tool_settings"
     ENABLE_CHALLENGE = "enable_challenge"
+    ENABLE_ANSWER_CACHE = "enable_answer_cache"
+    ANSWER_CACHE_BYPASS_HEADER = "X-Answer-Cache-Bypass"
+    FORCE_RUN = "force_run"
     CHALLENGE_LLM = "challenge_llm"
     SINGLE_PASS_EXTRACTION_MODE = "single_pass_extraction_mode"
     SINGLE_PASS_EXTRACTION = "single_pass_extraction"
@@ -94,6 +99,9 @@ class ToolStudioPromptKeys:
     PLATFORM_POSTAMBLE = "platform_postamble"
     SUMMARIZE_AS_SOURCE = "summarize_as_source"
     VARIABLE_MAP = "variable_map"
+    ANSWER_PROMPT = "answer-prompt"
+    PROMPT_KEY = "prompt_key"
+    ERROR = "error"
     RECORD = "record"
 
 
@@ -125,6 +133,14 @@ class IndexingStatus(Enum):
     DOCUMENT_BEING_INDEXED = "Document is being indexed"
 
 
+class AnswerFrameType(Enum):
+    """Types of the frames prompt service streams answers in."""
+
+    ANSWER = "answer"
+    RESULT = "result"
+    ERROR = "error"
+
+
 class DefaultPrompts:
     PREAMBLE = (
         "Your ability to extract and summarize this context accurately "
@@ -1,3 +1,4 @@
+import time
 from typing import Optional
 
 from django.conf import settings
@@ -26,12 +27,33 @@ class DocumentIndexingService:
     @classmethod
     def mark_document_indexed(
         cls, org_id: str, user_id: str, doc_id_key: str, doc_id: str
-    ) -> None:
+    ) -> float:
+        """Marks a document indexed, recording when.
+
+        Returns:
+            float: Time the document was indexed at
+        """
+        indexed_at = time.time()
         CacheService.set_key(
             cls._cache_key(org_id, user_id, doc_id_key),
             doc_id,
             expire=settings.INDEXING_FLAG_TTL,
         )
+        CacheService.set_key(
+            cls._indexed_at_key(org_id, user_id, doc_id_key),
+            indexed_at,
+            expire=settings.INDEXING_FLAG_TTL,
+        )
+        return indexed_at
+
+    @classmethod
+    def get_indexed_at(
+        cls, org_id: str, user_id: str, doc_id_key: str
+    ) -> Optional[float]:
+        indexed_at = CacheService.get_key(
+            cls._indexed_at_key(org_id, user_id, doc_id_key)
+        )
+        return float(indexed_at) if indexed_at else None
 
     @classmethod
     def get_indexed_document_id(
@@ -47,7 +69,12 @@ class DocumentIndexingService:
         cls, org_id: str, user_id: str, doc_id_key: str
     ) -> None:
         CacheService.delete_a_key(cls._cache_key(org_id, user_id, doc_id_key))
+        CacheService.delete_a_key(cls._indexed_at_key(org_id, user_id, doc_id_key))
 
     @classmethod
     def _cache_key(cls, org_id: str, user_id: str, doc_id_key: str) -> str:
         return f"{cls.CACHE_PREFIX}{org_id}:{user_id}:{doc_id_key}"
+
+    @classmethod
+    def _indexed_at_key(cls, org_id: str, user_id: str, doc_id_key: str) -> str:
+        return f"{cls._cache_key(org_id, user_id, doc_id_key)}:indexed_at"
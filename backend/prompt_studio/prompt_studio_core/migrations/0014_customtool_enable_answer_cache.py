@@ -0,0 +1,21 @@
+# Generated by Django 4.2.1 on 2026-10-18 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("prompt_studio_core", "0013_customtool_enable_highlight"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customtool",
+            name="enable_answer_cache",
+            field=models.BooleanField(
+                db_comment="Flag to enable or disable caching of prompt answers",
+                default=True,
+            ),
+        ),
+    ]
@@ -123,6 +123,10 @@ class CustomTool(BaseModel):
     enable_highlight = models.BooleanField(
         db_comment="Flag to enable or disable document highlighting", default=False
     )
+    enable_answer_cache = models.BooleanField(
+        db_comment="Flag to enable or disable caching of prompt answers",
+        default=True,
+    )
 
     # Introduced field to establish M2M relation between users and custom_tool.
     # This will introduce intermediary table which relates both the models.
@@ -279,6 +279,8 @@ class PromptStudioCoreView(viewsets.ModelViewSet):
         id: str = request.data.get(ToolStudioPromptKeys.ID)
         run_id: str = request.data.get(ToolStudioPromptKeys.RUN_ID)
         profile_manager: str = request.data.get(ToolStudioPromptKeys.PROFILE_MANAGER_ID)
+        # Set when the user runs the prompt again, bypassing cached answers
+        force_run = bool(request.data.get(ToolStudioPromptKeys.FORCE_RUN, False))
         if not run_id:
             # Generate a run_id
             run_id = CommonUtils.generate_uuid()
@@ -295,6 +297,7 @@ class PromptStudioCoreView(viewsets.ModelViewSet):
             run_id=run_id,
             profile_manager_id=profile_manager,
             text_processor=text_processor,
+            force_run=force_run,
         )
         return Response(response, status=status.HTTP_200_OK)
 
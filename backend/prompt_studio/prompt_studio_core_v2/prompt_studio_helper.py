@@ -18,7 +18,12 @@ from prompt_studio.prompt_profile_manager_v2.models import ProfileManager
 from prompt_studio.prompt_profile_manager_v2.profile_manager_helper import (
     ProfileManagerHelper,
 )
-from prompt_studio.prompt_studio_core_v2.constants import IndexingStatus, LogLevels
+from prompt_studio.prompt_studio_core_v2.constants import (
+    AnswerFrameType,
+    IndexingStatus,
+    LogLevels,
+    ToolStudioKeys,
+)
 from prompt_studio.prompt_studio_core_v2.constants import (
     ToolStudioPromptKeys as TSPKeys,
 )
@@ -48,12 +53,14 @@ from prompt_studio.prompt_studio_output_manager_v2.output_manager_helper import
     OutputManagerHelper,
 )
 from prompt_studio.prompt_studio_v2.models import ToolStudioPrompt
+from requests.exceptions import RequestException
 from unstract.sdk.constants import LogLevel
 from unstract.sdk.exceptions import IndexingError, SdkError
 from unstract.sdk.index import Index
 from unstract.sdk.prompt import PromptTool
 from unstract.sdk.utils.tool_utils import ToolUtils
 from utils.local_context import StateStore
+from utils.request import HTTPMethod, stream_http_request
 
 from unstract.core.pubsub_helper import LogPublisher
 
@@ -387,6 +394,7 @@ class PromptStudioHelper:
         run_id: str = None,
         profile_manager_id: Optional[str] = None,
         text_processor: Optional[type[Any]] = None,
+        force_run: bool = False,
     ) -> Any:
         """Execute chain/single run of the prompts. Makes a call to prompt
         service and returns the dict of response.
@@ -398,6 +406,8 @@ class PromptStudioHelper:
             document_id (str): UUID of the document uploaded
             id (Optional[str]): ID of the prompt
             profile_manager_id (Optional[str]): UUID of the profile manager
+            force_run (bool): Answers a single prompt again instead of using
+                cached answers, set on an explicit run by the user
 
         Raises:
             AnswerFetchError: Error from prompt-service
@@ -423,6 +433,7 @@ class PromptStudioHelper:
                 run_id=run_id,
                 profile_manager_id=profile_manager_id,
                 text_processor=text_processor,
+                force_run=force_run,
             )
         else:
             return PromptStudioHelper._execute_prompts_in_single_pass(
@@ -448,6 +459,7 @@ class PromptStudioHelper:
         run_id,
         profile_manager_id,
         text_processor: Optional[type[Any]] = None,
+        force_run: bool = False,
     ):
         prompt_instance = PromptStudioHelper._fetch_prompt_from_id(id)
 
@@ -489,6 +501,28 @@ class PromptStudioHelper:
         process_text = None
         if text_processor:
             process_text = text_processor.process
+        # Outputs are saved as soon as their prompts are answered
+        saved_outputs: list[dict[str, Any]] = []
+        saved_prompt_keys: set[str] = set()
+
+        def save_answer(answer: dict[str, Any]) -> None:
+            answered_prompts = [
+                prompt
+                for prompt in prompts
+                if prompt.prompt_key == answer[TSPKeys.PROMPT_KEY]
+            ]
+            saved_outputs.extend(
+                PromptStudioHelper._handle_response(
+                    response=answer,
+                    run_id=run_id,
+                    prompts=answered_prompts,
+                    document_id=document_id,
+                    is_single_pass=False,
+                    profile_manager_id=profile_manager_id,
+                )
+            )
+            saved_prompt_keys.add(answer[TSPKeys.PROMPT_KEY])
+
         try:
             response = PromptStudioHelper._fetch_response(
                 doc_path=doc_path,
@@ -501,11 +535,26 @@ class PromptStudioHelper:
                 profile_manager_id=profile_manager_id,
                 user_id=user_id,
                 process_text=process_text,
+                on_answer=save_answer,
+                force_run=force_run,
             )
-            return PromptStudioHelper._handle_response(
+            if not saved_outputs:
+                return PromptStudioHelper._handle_response(
+                    response=response,
+                    run_id=run_id,
+                    prompts=prompts,
+                    document_id=document_id,
+                    is_single_pass=False,
+                    profile_manager_id=profile_manager_id,
+                )
+            return saved_outputs + PromptStudioHelper._handle_response(
                 response=response,
                 run_id=run_id,
-                prompts=prompts,
+                prompts=[
+                    prompt
+                    for prompt in prompts
+                    if prompt.prompt_key not in saved_prompt_keys
+                ],
                 document_id=document_id,
                 is_single_pass=False,
                 profile_manager_id=profile_manager_id,
@@ -657,6 +706,8 @@ class PromptStudioHelper:
         user_id: str,
         profile_manager_id: Optional[str] = None,
         process_text: Optional[Callable[[str], str]] = None,
+        on_answer: Optional[Callable[[dict[str, Any]], None]] = None,
+        force_run: bool = False,
     ) -> Any:
         """Utility function to invoke prompt service. Used internally.
 
@@ -669,6 +720,10 @@ class PromptStudioHelper:
             document_id (str): UUID of the document
             profile_manager_id (Optional[str]): UUID of the profile manager
             user_id (str): The ID of the user who uploaded the document
+            on_answer (Optional[Callable[[dict[str, Any]], None]]): Called
+                with the output and metadata of each prompt once answered
+            force_run (bool): Answers the prompt again instead of using a
+                cached answer
 
 
         Raises:
@@ -786,6 +841,7 @@ class PromptStudioHelper:
 
         tool_settings = {}
         tool_settings[TSPKeys.ENABLE_CHALLENGE] = tool.enable_challenge
+        tool_settings[TSPKeys.ENABLE_ANSWER_CACHE] = tool.enable_answer_cache
         tool_settings[TSPKeys.CHALLENGE_LLM] = challenge_llm
         tool_settings[TSPKeys.SINGLE_PASS_EXTRACTION_MODE] = (
             tool.single_pass_extraction_mode
@@ -807,29 +863,85 @@ class PromptStudioHelper:
             TSPKeys.RUN_ID: run_id,
             TSPKeys.FILE_NAME: doc_name,
             TSPKeys.FILE_HASH: file_hash,
+            TSPKeys.INDEX_MARKERS: {
+                index_result["output"]: {
+                    TSPKeys.INDEXED_AT: index_result.get("indexed_at")
+                }
+            },
             Common.LOG_EVENTS_ID: StateStore.get(Common.LOG_EVENTS_ID),
         }
 
-        util = PromptIdeBaseTool(log_level=LogLevel.INFO, org_id=org_id)
-
-        responder = PromptTool(
-            tool=util,
-            prompt_host=settings.PROMPT_HOST,
-            prompt_port=settings.PROMPT_PORT,
-        )
-        include_metadata = {TSPKeys.INCLUDE_METADATA: True}
-
-        answer = responder.answer_prompt(payload, include_metadata)
-        # TODO: Make use of dataclasses
-        if answer["status"] == "ERROR":
+        try:
+            return PromptStudioHelper._answer_prompt(
+                payload=payload,
+                org_id=org_id,
+                on_answer=on_answer,
+                bypass_answer_cache=force_run,
+            )
+        except AnswerFetchError as e:
             # TODO: Publish to FE logs from here
-            error_message = answer.get("error", "")
             raise AnswerFetchError(
                 "Error while fetching response for "
-                f"'{prompt.prompt_key}' with '{doc_name}'. {error_message}"
-            )
-        output_response = json.loads(answer["structure_output"])
-        return output_response
+                f"'{prompt.prompt_key}' with '{doc_name}'. {e.detail}"
+            ) from e
+
+    @staticmethod
+    def _answer_prompt(
+        payload: dict[str, Any],
+        org_id: str,
+        on_answer: Optional[Callable[[dict[str, Any]], None]] = None,
+        bypass_answer_cache: bool = False,
+    ) -> dict[str, Any]:
+        """Fetches answers from prompt service, streamed as each prompt is
+        answered.
+
+        Args:
+            payload (dict[str, Any]): Prompts to answer and their settings
+            org_id (str): UUID of the organization
+            on_answer (Optional[Callable[[dict[str, Any]], None]]): Called
+                with the output and metadata of each prompt once answered
+            bypass_answer_cache (bool): Answers the prompts again, refreshing
+                the cached answers used by deployed tools
+
+        Raises:
+            AnswerFetchError: Due to failures in prompt service
+
+        Returns:
+            dict[str, Any]: Output and metadata of all the prompts
+        """
+        util = PromptIdeBaseTool(log_level=LogLevel.INFO, org_id=org_id)
+        platform_key = util.get_env_or_die(ToolStudioKeys.PLATFORM_SERVICE_API_KEY)
+        prompt_host = settings.PROMPT_HOST.rstrip("/")
+        headers = {"Authorization": f"Bearer {platform_key}"}
+        if bypass_answer_cache:
+            headers[TSPKeys.ANSWER_CACHE_BYPASS_HEADER] = "true"
+        try:
+            for frame in stream_http_request(
+                verb=HTTPMethod.POST,
+                url=f"{prompt_host}:{settings.PROMPT_PORT}/{TSPKeys.ANSWER_PROMPT}",
+                data=payload,
+                headers=headers,
+                params={TSPKeys.INCLUDE_METADATA: True},
+            ):
+                frame_type = frame.get(TSPKeys.TYPE)
+                if frame_type == AnswerFrameType.ANSWER.value:
+                    if on_answer:
+                        on_answer(frame)
+                elif frame_type == AnswerFrameType.ERROR.value:
+                    raise AnswerFetchError(frame.get(TSPKeys.ERROR, ""))
+                else:
+                    # Either the result frame or the whole response of a
+                    # prompt service not streaming answers
+                    return frame
+        except RequestException as e:
+            error_message = str(e)
+            if e.response is not None:
+                try:
+                    error_message = e.response.json().get(TSPKeys.ERROR, error_message)
+                except ValueError:
+                    pass
+            raise AnswerFetchError(error_message) from e
+        raise AnswerFetchError("Prompt service ended without a response")
 
     @staticmethod
     def fetch_table_settings_if_enabled(
@@ -928,6 +1040,9 @@ class PromptStudioHelper:
                     return {
                         "status": IndexingStatus.COMPLETED_STATUS.value,
                         "output": indexed_doc_id,
+                        "indexed_at": DocumentIndexingService.get_indexed_at(
+                            org_id=org_id, user_id=user_id, doc_id_key=doc_id_key
+                        ),
                     }
                 # Polling if document is already being indexed
                 if DocumentIndexingService.is_document_indexing(
@@ -962,10 +1077,14 @@ class PromptStudioHelper:
                 profile_manager=profile_manager,
                 doc_id=doc_id,
             )
-            DocumentIndexingService.mark_document_indexed(
+            indexed_at = DocumentIndexingService.mark_document_indexed(
                 org_id=org_id, user_id=user_id, doc_id_key=doc_id_key, doc_id=doc_id
             )
-            return {"status": IndexingStatus.COMPLETED_STATUS.value, "output": doc_id}
+            return {
+                "status": IndexingStatus.COMPLETED_STATUS.value,
+                "output": doc_id,
+                "indexed_at": indexed_at,
+            }
         except (IndexingError, IndexingAPIError, SdkError) as e:
             logger.error(f"Indexing failed : {e} ", stack_info=True, exc_info=True)
             doc_name = os.path.split(file_path)[1]
@@ -1048,6 +1167,7 @@ class PromptStudioHelper:
         tool_settings[TSPKeys.CHUNK_SIZE] = default_profile.chunk_size
         tool_settings[TSPKeys.CHUNK_OVERLAP] = default_profile.chunk_overlap
         tool_settings[TSPKeys.ENABLE_CHALLENGE] = tool.enable_challenge
+        tool_settings[TSPKeys.ENABLE_ANSWER_CACHE] = tool.enable_answer_cache
         tool_settings[TSPKeys.CHALLENGE_LLM] = challenge_llm
 
         for prompt in prompts:
@@ -1072,6 +1192,11 @@ class PromptStudioHelper:
             TSPKeys.RUN_ID: run_id,
             TSPKeys.FILE_HASH: file_hash,
             TSPKeys.FILE_NAME: doc_name,
+            TSPKeys.INDEX_MARKERS: {
+                index_result["output"]: {
+                    TSPKeys.INDEXED_AT: index_result.get("indexed_at")
+                }
+            },
             Common.LOG_EVENTS_ID: StateStore.get(Common.LOG_EVENTS_ID),
         }
 
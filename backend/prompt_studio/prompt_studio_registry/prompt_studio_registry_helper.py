@@ -280,6 +280,7 @@ class PromptStudioRegistryHelper:
             tool.single_pass_extraction_mode
         )
         tool_settings[JsonSchemaKey.ENABLE_HIGHLIGHT] = tool.enable_highlight
+        tool_settings[JsonSchemaKey.ENABLE_ANSWER_CACHE] = tool.enable_answer_cache
         tool_settings[JsonSchemaKey.PLATFORM_POSTAMBLE] = getattr(
             settings, JsonSchemaKey.PLATFORM_POSTAMBLE.upper(), ""
         )
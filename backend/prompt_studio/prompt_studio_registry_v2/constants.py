@@ -96,6 +96,7 @@ class JsonSchemaKey:
     SUMMARIZE_PROMPT = "summarize_prompt"
     SUMMARIZE_AS_SOURCE = "summarize_as_source"
     ENABLE_HIGHLIGHT = "enable_highlight"
+    ENABLE_ANSWER_CACHE = "enable_answer_cache"
     PLATFORM_POSTAMBLE = "platform_postamble"
 
 
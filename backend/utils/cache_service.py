@@ -73,6 +73,20 @@ class CacheService:
     def lrange(key, start_index, end_index) -> list[Any]:
         return redis_cache.lrange(key, start_index, end_index)
 
+    @staticmethod
+    def hmget(key: str, fields: list[str]) -> list[Any]:
+        return redis_cache.hmget(key, fields)
+
+    @staticmethod
+    def hset(key: str, mapping: dict[str, Any], expire: Optional[int] = None) -> None:
+        redis_cache.hset(key, mapping=mapping)
+        if expire:
+            redis_cache.expire(key, expire)
+
+    @staticmethod
+    def incr(key: str) -> int:
+        return int(redis_cache.incr(key))
+
     @staticmethod
     def remove_all_session_keys(
         user_id: Optional[str] = None,
@@ -0,0 +1,160 @@
+"""Notifies the completion of workflow executions over Redis pub/sub.
+
+Callers waiting on an execution are woken up as soon as it completes instead
+of polling the celery result backend.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _get_connection_kwargs() -> dict[str, Any]:
+    return {
+        "host": settings.REDIS_HOST,
+        "port": int(settings.REDIS_PORT),
+        "username": settings.REDIS_USER,
+        "password": settings.REDIS_PASSWORD,
+    }
+
+
+redis_conn = redis.Redis(**_get_connection_kwargs())
+
+
+class ExecutionNotifier:
+    CHANNEL_PREFIX = "execution_completed"
+    # Completion is also recorded under the channel name for this long, for
+    # callers that start waiting after it was published
+    COMPLETION_TTL_SEC = 600
+    # Interval to check on the execution through `is_completed`, in case its
+    # completion was not published
+    POLL_INTERVAL_SEC = 5
+
+    @staticmethod
+    def _get_channel(execution_id: str) -> str:
+        return f"{ExecutionNotifier.CHANNEL_PREFIX}:{execution_id}"
+
+    @staticmethod
+    def notify_completion(execution_id: str, status: str) -> None:
+        """Publishes the completion of an execution.
+
+        Args:
+            execution_id (str): Id of the completed execution
+            status (str): State the execution's task ended in
+        """
+        channel = ExecutionNotifier._get_channel(execution_id)
+        try:
+            redis_conn.set(channel, status, ex=ExecutionNotifier.COMPLETION_TTL_SEC)
+            redis_conn.publish(channel, status)
+        except redis.RedisError as e:
+            # Waiting callers find out through their `is_completed` check
+            logger.error(f"Error notifying completion of execution {execution_id}: {e}")
+
+    @staticmethod
+    def wait_for_completion(
+        execution_id: str,
+        timeout: float,
+        is_completed: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """Blocks until an execution completes or the timeout elapses.
+
+        Args:
+            execution_id (str): Id of the execution to wait on
+            timeout (float): Maximum time to wait in seconds
+            is_completed (Optional[Callable[[], bool]]): Checks if the
+                execution completed, called every `POLL_INTERVAL_SEC` while no
+                notification is received
+
+        Returns:
+            bool: True if the execution completed
+        """
+        channel = ExecutionNotifier._get_channel(execution_id)
+        deadline = time.monotonic() + timeout
+        pubsub = redis_conn.pubsub()
+        try:
+            pubsub.subscribe(channel)
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = pubsub.get_message(
+                    timeout=min(remaining, ExecutionNotifier.POLL_INTERVAL_SEC)
+                )
+                if not message:
+                    if is_completed and is_completed():
+                        return True
+                    continue
+                if message["type"] != "subscribe":
+                    return True
+                # Completion might have been published before subscribing
+                if redis_conn.exists(channel):
+                    return True
+            return bool(redis_conn.exists(channel)) or bool(
+                is_completed and is_completed()
+            )
+        finally:
+            pubsub.close()
+
+    @staticmethod
+    async def wait_for_completion_async(
+        execution_id: str,
+        timeout: float,
+        is_completed: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> bool:
+        """Waits for an execution to complete without blocking a thread, see
+        `wait_for_completion()`.
+
+        A client is created for each call since asyncio connections can't be
+        shared across event loops. If Redis can't be reached, only
+        `is_completed` is checked until the timeout elapses.
+
+        Args:
+            execution_id (str): Id of the execution to wait on
+            timeout (float): Maximum time to wait in seconds
+            is_completed (Optional[Callable[[], Awaitable[bool]]]): Checks if
+                the execution completed, awaited every `POLL_INTERVAL_SEC`
+                while no notification is received
+
+        Returns:
+            bool: True if the execution completed
+        """
+        channel = ExecutionNotifier._get_channel(execution_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        client = aioredis.Redis(**_get_connection_kwargs())
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            while (remaining := deadline - loop.time()) > 0:
+                message = await pubsub.get_message(
+                    timeout=min(remaining, ExecutionNotifier.POLL_INTERVAL_SEC)
+                )
+                if not message:
+                    if is_completed and await is_completed():
+                        return True
+                    continue
+                if message["type"] != "subscribe":
+                    return True
+                # Completion might have been published before subscribing
+                if await client.exists(channel):
+                    return True
+            return bool(await client.exists(channel)) or bool(
+                is_completed and await is_completed()
+            )
+        except aioredis.RedisError as e:
+            logger.error(
+                f"Error waiting on completion of execution {execution_id}: {e}"
+            )
+            while (remaining := deadline - loop.time()) > 0:
+                if is_completed and await is_completed():
+                    return True
+                await asyncio.sleep(min(remaining, ExecutionNotifier.POLL_INTERVAL_SEC))
+            return bool(is_completed and await is_completed())
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
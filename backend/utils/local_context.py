@@ -45,6 +45,23 @@ class StateStore:
         else:
             raise RuntimeError(Exceptions.UNKNOWN_MODE)
 
+    @classmethod
+    def get_all(cls) -> dict[str, Any]:
+        """Gets the state of the current thread, to be carried over to the
+        threads it spawns with `set_all()`."""
+        if cls.mode == ConcurrencyMode.THREAD:
+            return dict(vars(cls.thread_local))
+        else:
+            raise RuntimeError(Exceptions.UNKNOWN_MODE)
+
+    @classmethod
+    def set_all(cls, state: dict[str, Any]) -> None:
+        if cls.mode == ConcurrencyMode.THREAD:
+            for key, val in state.items():
+                cls._set_thread_local(key, val)
+        else:
+            raise RuntimeError(Exceptions.UNKNOWN_MODE)
+
     @classmethod
     def clear(cls, key: str) -> None:
         if cls.mode == ConcurrencyMode.THREAD:
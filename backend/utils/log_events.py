@@ -144,6 +144,25 @@ def _store_execution_log(data: dict[str, Any]) -> None:
         logger.error(f"Error storing execution log: {e}")
 
 
+def _store_execution_logs(messages: list[dict[str, Any]]) -> None:
+    """Store execution logs in database with a single push to the queue
+    Args:
+        messages (list[dict[str, Any]]): Execution logs data
+    """
+    if not ExecutionLogConstants.IS_ENABLED:
+        return
+    try:
+        logs_data = [
+            log_data.to_json()
+            for message in messages
+            if (log_data := _get_validated_log_data(json_data=message))
+        ]
+        if logs_data:
+            redis_conn.rpush(ExecutionLogConstants.LOG_QUEUE_NAME, *logs_data)
+    except Exception as e:
+        logger.error(f"Error storing execution logs: {e}")
+
+
 def _emit_websocket_event(room: str, event: str, data: dict[str, Any]) -> None:
     """Emit websocket event
     Args:
@@ -174,6 +193,23 @@ def handle_user_logs(room: str, event: str, message: dict[str, Any]) -> None:
     _emit_websocket_event(room, event, message)
 
 
+def handle_user_logs_batch(
+    room: str, event: str, messages: list[dict[str, Any]]
+) -> None:
+    """Handle user logs published together by an application
+    Args:
+        messages (list[dict[str, Any]]): log messages in the order published
+    """
+
+    if not room or not event:
+        logger.warning(f"Messages received without room and event: {messages}")
+        return
+
+    _store_execution_logs(messages)
+    for message in messages:
+        _emit_websocket_event(room, event, message)
+
+
 def start_server(django_app: WSGIHandler, namespace: str) -> WSGIHandler:
     django_app = socketio.WSGIApp(sio, django_app, socketio_path=namespace)
     return django_app
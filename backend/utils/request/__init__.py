@@ -1,3 +1,3 @@
-from .request import HTTPMethod, make_http_request
+from .request import HTTPMethod, make_http_request, stream_http_request
 
-__all__ = ["make_http_request", "HTTPMethod"]
+__all__ = ["make_http_request", "stream_http_request", "HTTPMethod"]
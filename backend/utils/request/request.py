@@ -1,4 +1,6 @@
+import json
 import logging
+from collections.abc import Iterator
 from enum import Enum
 from typing import Any, Optional
 
@@ -7,6 +9,8 @@ from requests.exceptions import RequestException
 
 logger = logging.getLogger(__name__)
 
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
 
 class HTTPMethod(str, Enum):
     GET = "GET"
@@ -47,3 +51,35 @@ def make_http_request(
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
         raise e
+
+
+def stream_http_request(
+    verb: HTTPMethod,
+    url: str,
+    data: Optional[dict[str, Any]] = None,
+    headers: Optional[dict[str, Any]] = None,
+    params: Optional[dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """Makes a HTTP request for newline delimited JSON, yielding each line
+    as soon as it's received.
+
+    Servers responding with plain JSON have their response yielded whole.
+    """
+    headers = {**(headers or {}), "Accept": NDJSON_CONTENT_TYPE}
+    try:
+        with pyrequests.request(
+            verb.value, url, json=data, params=params, headers=headers, stream=True
+        ) as response:
+            if not response.ok:
+                # Read while open, for callers to get the error from the body
+                response.content
+            response.raise_for_status()
+            if response.headers.get("content-type") == "application/json":
+                yield response.json()
+                return
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+    except RequestException as e:
+        logger.error(f"HTTP request error: {e}")
+        raise e
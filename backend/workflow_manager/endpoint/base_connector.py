@@ -1,5 +1,5 @@
 import json
-from typing import Any
+from typing import Any, Optional
 
 from django.conf import settings
 from django.db import connection
@@ -15,7 +15,11 @@ class BaseConnector(ExecutionFileHandler):
     """Base class for connectors providing common methods and utilities."""
 
     def __init__(
-        self, workflow_id: str, execution_id: str, organization_id: str
+        self,
+        workflow_id: str,
+        execution_id: str,
+        organization_id: str,
+        execution_sub_dir: Optional[str] = None,
     ) -> None:
         """Initialize the BaseConnector class.
 
@@ -24,7 +28,12 @@ class BaseConnector(ExecutionFileHandler):
         """
         if not (settings.API_STORAGE_DIR and settings.WORKFLOW_DATA_DIR):
             raise ValueError("Missed env API_STORAGE_DIR or WORKFLOW_DATA_DIR")
-        super().__init__(workflow_id, execution_id, organization_id)
+        super().__init__(
+            workflow_id,
+            execution_id,
+            organization_id,
+            execution_sub_dir=execution_sub_dir,
+        )
         # Directory path for storing execution-related files for API
         self.api_storage_dir: str = self.create_execution_dir_path(
             workflow_id, execution_id, organization_id, settings.API_STORAGE_DIR
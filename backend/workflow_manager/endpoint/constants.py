@@ -38,12 +38,15 @@ class WorkflowFileType:
     SOURCE = "SOURCE"
     INFILE = "INFILE"
     METADATA_JSON = "METADATA.json"
+    RESULT_JSON = "RESULT.json"
+    PREFETCH_DIR = "PREFETCH"
 
 
 class SourceKey:
     FILE_EXTENSIONS = "fileExtensions"
     PROCESS_SUB_DIRECTORIES = "processSubDirectories"
     MAX_FILES = "maxFiles"
+    MAX_CONCURRENT_BATCHES = "maxConcurrentBatches"
     FOLDERS = "folders"
 
 
@@ -87,6 +90,8 @@ class FilePattern:
 
 class SourceConstant:
     MAX_RECURSIVE_DEPTH = 10
+    # Bytes of the input file shown in the execution logs
+    INPUT_PREVIEW_SIZE = 500
 
 
 class ApiDeploymentResultStatus:
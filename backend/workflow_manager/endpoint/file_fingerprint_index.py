@@ -0,0 +1,115 @@
+import json
+import logging
+from typing import Any, Optional
+
+from django.conf import settings
+from utils.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+
+class FileFingerprintIndex:
+    """Index of source files' metadata fingerprints and their content hashes.
+
+    A fingerprint is built from the metadata returned while listing the
+    source (size along with etag / mtime / version) and is used to reuse the
+    content hash computed earlier, so that unchanged files need not be
+    downloaded again just to be hashed. The index is maintained per
+    workflow and connector instance.
+    """
+
+    CACHE_PREFIX = "file_fingerprint:"
+    BATCH_SIZE = 1000
+    # Metadata keys that change along with the file content, in order of
+    # preference. Different fsspec implementations report different keys.
+    VERSION_KEYS = [
+        "ETag",
+        "etag",
+        "md5Hash",
+        "md5_checksum",
+        "content_hash",
+        "sha1",
+        "VersionId",
+        "version_id",
+        "generation",
+        "LastModified",
+        "last_modified",
+        "mtime",
+        "modified",
+        "updated",
+        "modifiedTime",
+        "modified_at",
+    ]
+
+    def __init__(
+        self, organization_id: str, workflow_id: str, connector_id: str
+    ) -> None:
+        self.cache_key = (
+            f"{self.CACHE_PREFIX}{organization_id}:{workflow_id}:{connector_id}"
+        )
+
+    @classmethod
+    def get_fingerprint(cls, file_info: dict[str, Any]) -> Optional[str]:
+        """Build a fingerprint for a file from its listing metadata.
+
+        Args:
+            file_info (dict[str, Any]): File details as returned by
+                fsspec's `info()` / `walk(detail=True)`
+
+        Returns:
+            Optional[str]: Fingerprint of the file, None if the metadata
+                has nothing other than the size to identify a version
+        """
+        for key in cls.VERSION_KEYS:
+            version = file_info.get(key)
+            if version:
+                return f"{file_info.get('size')}:{key}:{version}"
+        return None
+
+    def get_file_hashes(self, fingerprints: dict[str, str]) -> dict[str, str]:
+        """Get content hashes of files whose fingerprint is unchanged.
+
+        Args:
+            fingerprints (dict[str, str]): File path to its current fingerprint
+
+        Returns:
+            dict[str, str]: File path to its content hash for the files
+                whose indexed fingerprint matches the current one
+        """
+        file_hashes: dict[str, str] = {}
+        file_paths = list(fingerprints.keys())
+        for start in range(0, len(file_paths), self.BATCH_SIZE):
+            end = start + self.BATCH_SIZE
+            batch = file_paths[start:end]
+            try:
+                entries = CacheService.hmget(self.cache_key, batch)
+            except Exception as e:
+                logger.warning(f"Unable to read file fingerprint index: {e}")
+                return file_hashes
+            for file_path, entry in zip(batch, entries):
+                if not entry:
+                    continue
+                indexed = json.loads(entry)
+                if indexed.get("fingerprint") == fingerprints[file_path]:
+                    file_hashes[file_path] = indexed["file_hash"]
+        return file_hashes
+
+    def update(self, file_hashes: dict[str, tuple[str, str]]) -> None:
+        """Record content hashes against the files' fingerprints.
+
+        Args:
+            file_hashes (dict[str, tuple[str, str]]): File path to a tuple of
+                its fingerprint and content hash
+        """
+        if not file_hashes:
+            return
+        mapping = {
+            file_path: json.dumps({"fingerprint": fingerprint, "file_hash": file_hash})
+            for file_path, (fingerprint, file_hash) in file_hashes.items()
+        }
+        try:
+            CacheService.hset(
+                self.cache_key, mapping, expire=settings.FILE_FINGERPRINT_INDEX_TTL
+            )
+        except Exception as e:
+            logger.warning(f"Unable to update file fingerprint index: {e}")
@@ -2,6 +2,7 @@ import ast
 import base64
 import json
 import logging
+import mmap
 import os
 from typing import Any, Optional
 
@@ -56,14 +57,22 @@ class DestinationConnector(BaseConnector):
         workflow: Workflow,
         execution_id: str,
         execution_service: Optional[WorkflowExecutionServiceHelper] = None,
+        execution_sub_dir: Optional[str] = None,
     ) -> None:
         """Initialize a DestinationConnector object.
 
         Args:
             workflow (Workflow): _description_
+            execution_sub_dir (Optional[str]): Directory under the execution
+                directory used by a batch of a parallel execution.
         """
         organization_id = UserContext.get_organization_identifier()
-        super().__init__(workflow.id, execution_id, organization_id)
+        super().__init__(
+            workflow.id,
+            execution_id,
+            organization_id,
+            execution_sub_dir=execution_sub_dir,
+        )
         self.endpoint = self._get_endpoint_for_workflow(workflow=workflow)
         self.source_endpoint = self._get_source_endpoint_for_workflow(workflow=workflow)
         self.execution_id = execution_id
@@ -163,9 +172,12 @@ class DestinationConnector(BaseConnector):
             if connection_type == WorkflowEndpoint.ConnectionType.API:
                 self._handle_api_result(file_name=file_name, error=error, result=result)
             return
-        file_history = FileHistoryHelper.get_file_history(
-            workflow=workflow, cache_key=file_hash.file_hash
-        )
+        file_history = None
+        # Results of files processed in this run are recorded over any history
+        if file_hash.is_executed:
+            file_history = FileHistoryHelper.get_file_history(
+                workflow=workflow, cache_key=file_hash.file_hash
+            )
         if connection_type == WorkflowEndpoint.ConnectionType.FILESYSTEM:
             self.copy_output_to_output_directory()
         elif connection_type == WorkflowEndpoint.ConnectionType.DATABASE:
@@ -332,6 +344,41 @@ class DestinationConnector(BaseConnector):
         Returns:
             None
         """
+        self.api_results.append(
+            self._make_api_result(
+                file_name=file_name, error=error, result=result, metadata=metadata
+            )
+        )
+
+    @classmethod
+    def get_api_result_from_history(
+        cls, file_name: str, file_history: FileHistory
+    ) -> dict[str, Any]:
+        """Get the API result of a file from its file history record, as an
+        execution reading the file from history would return it.
+
+        Args:
+            file_name (str): The name of the file.
+            file_history (FileHistory): Completed file history record of the file.
+
+        Returns:
+            dict[str, Any]: API result of the file
+        """
+        result = cls.parse_string(file_history.result) if file_history.result else ""
+        metadata = (
+            cls.parse_string(file_history.meta_data) if file_history.meta_data else None
+        )
+        return cls._make_api_result(
+            file_name=file_name, result=result, metadata=metadata
+        )
+
+    @staticmethod
+    def _make_api_result(
+        file_name: str,
+        error: Optional[str] = None,
+        result: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
         api_result: dict[str, Any] = {"file": file_name}
         if error:
             api_result.update(
@@ -350,9 +397,10 @@ class DestinationConnector(BaseConnector):
                 api_result.update(
                     {"status": ApiDeploymentResultStatus.SUCCESS, "result": ""}
                 )
-        self.api_results.append(api_result)
+        return api_result
 
-    def parse_string(self, original_string: str) -> Any:
+    @staticmethod
+    def parse_string(original_string: str) -> Any:
         """Parse the given string, attempting to evaluate it as a Python
         literal.
         ex: a json string to dict method
@@ -398,6 +446,11 @@ class DestinationConnector(BaseConnector):
         metadata: dict[str, Any] = self.get_workflow_metadata()
         output_type = self.get_output_type(metadata)
         result: Optional[Any] = None
+        if output_type == ToolOutputType.JSON:
+            # Skips detecting the type of INFILE and parsing it
+            committed_output = self._get_committed_tool_output()
+            if isinstance(committed_output, (dict, list)):
+                return committed_output
         try:
             # TODO: SDK handles validation; consider removing here.
             mime = magic.Magic()
@@ -421,6 +474,31 @@ class DestinationConnector(BaseConnector):
             logger.error(f"Error while getting result {err}")
         return result
 
+    def _get_committed_tool_output(self) -> Optional[Any]:
+        """Get the output of the last tool from the result file it commits
+        to the execution directory. The file is memory-mapped instead of being
+        read through a buffer.
+
+        Returns:
+            Optional[Any]: Tool output, None if no result was committed.
+        """
+        result_file = os.path.join(self.execution_dir, WorkflowFileType.RESULT_JSON)
+        try:
+            with open(result_file, "rb") as file:
+                # Empty files can't be mapped
+                if not os.fstat(file.fileno()).st_size:
+                    return None
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as result:
+                    tool_result = json.loads(result[:])
+        except FileNotFoundError:
+            return None
+        except ValueError as err:
+            logger.warning(f"Error while reading committed tool result {err}")
+            return None
+        if not isinstance(tool_result, dict):
+            return None
+        return tool_result.get("output")
+
     def get_metadata(
         self, file_history: Optional[FileHistory] = None
     ) -> Optional[dict[str, Any]]:
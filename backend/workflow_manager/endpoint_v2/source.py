@@ -2,15 +2,19 @@ import fnmatch
 import logging
 import os
 import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from hashlib import md5, sha256
 from io import BytesIO
 from itertools import islice
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+from uuid import uuid4
 
 import fsspec
 from connector_processor.constants import ConnectorKeys
 from connector_v2.models import ConnectorInstance
-from django.core.files.uploadedfile import UploadedFile
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
 from unstract.workflow_execution.enums import LogState
 from utils.user_context import UserContext
 from workflow_manager.endpoint_v2.base_connector import BaseConnector
@@ -32,6 +36,7 @@ from workflow_manager.endpoint_v2.exceptions import (
     OrganizationIdNotFound,
     SourceConnectorNotConfigured,
 )
+from workflow_manager.endpoint_v2.file_fingerprint_index import FileFingerprintIndex
 from workflow_manager.endpoint_v2.models import WorkflowEndpoint
 from workflow_manager.workflow_v2.execution import WorkflowExecutionServiceHelper
 from workflow_manager.workflow_v2.file_history_helper import FileHistoryHelper
@@ -61,6 +66,7 @@ class SourceConnector(BaseConnector):
         execution_id: str,
         organization_id: Optional[str] = None,
         execution_service: Optional[WorkflowExecutionServiceHelper] = None,
+        execution_sub_dir: Optional[str] = None,
     ) -> None:
         """Create a SourceConnector.
 
@@ -71,6 +77,9 @@ class SourceConnector(BaseConnector):
             execution_service (Optional[WorkflowExecutionServiceHelper]): Instance of
                 WorkflowExecutionServiceHelper that helps with WF execution.
                 Defaults to None. This is not used in case of execution by API.
+            execution_sub_dir (Optional[str]): Directory under the execution
+                directory used by a batch of a parallel execution.
+                Defaults to None.
 
         Raises:
             OrganizationIdNotFound: _description_
@@ -78,13 +87,25 @@ class SourceConnector(BaseConnector):
         organization_id = organization_id or UserContext.get_organization_identifier()
         if not organization_id:
             raise OrganizationIdNotFound()
-        super().__init__(workflow.id, execution_id, organization_id)
+        super().__init__(
+            workflow.id,
+            execution_id,
+            organization_id,
+            execution_sub_dir=execution_sub_dir,
+        )
         self.endpoint = self._get_endpoint_for_workflow(workflow=workflow)
         self.workflow = workflow
         self.execution_id = execution_id
         self.organization_id = organization_id
         self.hash_value_of_file_content: Optional[str] = None
         self.execution_service = execution_service
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetched_files: dict[str, Future[tuple[str, str, str]]] = {}
+        # Kept at the execution level since files of an execution can be staged
+        # in sub directories of it, see `set_execution_sub_dir()`
+        self._prefetch_dir = os.path.join(
+            self.execution_dir, WorkflowFileType.PREFETCH_DIR
+        )
 
     def _get_endpoint_for_workflow(
         self,
@@ -195,22 +216,21 @@ class SourceConnector(BaseConnector):
                     raise
                 raise InvalidInputDirectory(detail=msg)
 
-        total_files_to_process = 0
-        total_matched_files = {}
-
-        for input_directory in folders_to_process:
-            input_directory = source_fs.get_connector_root_dir(
+        input_directories = [
+            source_fs.get_connector_root_dir(
                 input_dir=input_directory, root_path=root_dir_path
             )
-            logger.debug(f"Listing files from:  {input_directory}")
-            matched_files, count = self._get_matched_files(
-                source_fs_fsspec, input_directory, patterns, recursive, limit
-            )
+            for input_directory in folders_to_process
+        ]
+        logger.debug(f"Listing files from: {', '.join(input_directories)}")
+        total_matched_files, matched_counts = self._get_matched_files(
+            input_directories, patterns, recursive, limit
+        )
+        for input_directory, count in matched_counts.items():
             self.publish_user_sys_log(
                 f"Matched '{count}' files from '{input_directory}'"
             )
-            total_matched_files.update(matched_files)
-            total_files_to_process += count
+        total_files_to_process = len(total_matched_files)
         self.publish_input_output_list_file_logs(
             folders_to_process, total_matched_files, total_files_to_process
         )
@@ -272,48 +292,180 @@ class SourceConnector(BaseConnector):
 
     def _get_matched_files(
         self,
-        source_fs: Any,
-        input_directory: str,
+        input_directories: list[str],
         patterns: list[str],
         recursive: bool,
         limit: int,
-    ) -> tuple[dict[str, FileHash], int]:
-        """Get a dictionary of matched files based on patterns in a directory.
+    ) -> tuple[dict[str, FileHash], dict[str, int]]:
+        """Get a dictionary of matched files based on patterns in directories.
+
+        This method searches for files in the specified `input_directories`
+        that match any of the given `patterns`. The search can be performed
+        recursively if `recursive` is set to True. The number of matched files
+        returned across all directories is limited by `limit`.
 
-        This method searches for files in the specified `input_directory` that
-        match any of the given `patterns`. The search can be performed recursively
-        if `recursive` is set to True. The number of matched files returned is
-        limited by `limit`.
+        Content hashes are reused from the `FileFingerprintIndex` for files whose
+        listing metadata (size, etag / mtime) is unchanged, so only new or
+        modified files are downloaded to be hashed.
 
         Args:
-            source_fs (Any): The file system object used for searching.
-            input_directory (str): The directory to search for files.
+            input_directories (list[str]): The directories to search for files.
             patterns (list[str]): The patterns to match against file names.
             recursive (bool): Whether to perform a recursive search.
             limit (int): The maximum number of matched files to return.
 
         Returns:
-            tuple[dict[str, FileHash], int]: A dictionary of matched file paths
-            and their corresponding FileHash objects, along with the total count
-            of matched files.
+            tuple[dict[str, FileHash], dict[str, int]]: A dictionary of matched
+            file paths and their corresponding FileHash objects, along with the
+            count of matched files from each input directory.
         """
         matched_files: dict[str, FileHash] = {}
-        count = 0
+        matched_counts: dict[str, int] = {
+            input_directory: 0 for input_directory in input_directories
+        }
         max_depth = int(SourceConstant.MAX_RECURSIVE_DEPTH) if recursive else 1
+        fingerprint_index = FileFingerprintIndex(
+            organization_id=self.organization_id,
+            workflow_id=self.workflow_id,
+            connector_id=str(self.endpoint.connector_instance.id),
+        )
 
-        for root, dirs, files in source_fs.walk(input_directory, maxdepth=max_depth):
-            for file in files:
-                if count >= limit:
-                    break
-                if self._should_process_file(file, patterns):
-                    file_path = str(os.path.join(root, file))
+        for input_directory, root, files in self._walk_directories(
+            input_directories, max_depth=max_depth
+        ):
+            if len(matched_files) >= limit:
+                break
+            fingerprints: dict[str, Optional[str]] = {
+                str(os.path.join(root, file)): FileFingerprintIndex.get_fingerprint(
+                    file_info
+                )
+                for file, file_info in files.items()
+                if self._should_process_file(file, patterns)
+            }
+            indexed_hashes = fingerprint_index.get_file_hashes(
+                {path: fp for path, fp in fingerprints.items() if fp}
+            )
+            new_hashes: dict[str, tuple[str, str]] = {}
+            candidates = [
+                (file_path, fingerprint)
+                for file_path, fingerprint in fingerprints.items()
+                if file_path not in matched_files
+            ]
+            # Candidates are taken in windows of the remaining limit so that
+            # file history is looked up in bulk without hashing more files
+            # than needed
+            while candidates and len(matched_files) < limit:
+                remaining = limit - len(matched_files)
+                window, candidates = candidates[:remaining], candidates[remaining:]
+                file_hashes: dict[str, str] = {}
+                for file_path, fingerprint in window:
+                    # Content is downloaded and hashed only when the file's
+                    # fingerprint is missing or has changed since it was indexed
+                    file_hash = indexed_hashes.get(file_path)
+                    if not file_hash:
+                        file_hash = self.get_file_hash(input_file_path=file_path)
+                        if fingerprint:
+                            new_hashes[file_path] = (fingerprint, file_hash)
+                    file_hashes[file_path] = file_hash
+                processed_hashes = FileHistoryHelper.get_processed_cache_keys(
+                    workflow=self.endpoint.workflow,
+                    cache_keys=file_hashes.values(),
+                )
+                for file_path, file_hash in file_hashes.items():
                     if self._is_new_file(
-                        file_path=file_path, workflow=self.endpoint.workflow
+                        file_path=file_path,
+                        file_hash=file_hash,
+                        processed_hashes=processed_hashes,
                     ):
-                        matched_files[file_path] = self._create_file_hash(file_path)
-                        count += 1
+                        matched_files[file_path] = self._create_file_hash(
+                            file_path=file_path, file_hash=file_hash
+                        )
+                        matched_counts[input_directory] += 1
+            fingerprint_index.update(new_hashes)
+
+        return matched_files, matched_counts
+
+    def _walk_directories(
+        self, input_directories: list[str], max_depth: int
+    ) -> Iterator[tuple[str, str, dict[str, Any]]]:
+        """Walk the input directories breadth first, listing them concurrently.
+
+        All directories of a level (across every input directory) are listed
+        by a bounded pool of threads while the listings are yielded in a
+        deterministic order. A level is listed only when the caller asks for
+        it, so the walk stops early once enough files are matched.
+
+        fsspec clients of connectors like SFTP, Google Drive and Box are not
+        thread safe, so each listing thread creates its own file system once
+        and reuses it for every directory it lists.
+
+        Args:
+            input_directories (list[str]): The directories to walk.
+            max_depth (int): Maximum depth to walk, 1 lists only the input
+                directories.
 
-        return matched_files, count
+        Yields:
+            tuple[str, str, dict[str, Any]]: Input directory being walked, the
+            listed directory and the details of the files in it.
+        """
+        level = [
+            (input_directory, input_directory)
+            for input_directory in dict.fromkeys(input_directories)
+        ]
+        visited = {directory for _, directory in level}
+        connector: ConnectorInstance = self.endpoint.connector_instance
+        listing_fs = threading.local()
+
+        def list_directory(
+            directory: str,
+        ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+            if not hasattr(listing_fs, "source_fs"):
+                listing_fs.source_fs = self.get_fsspec(
+                    settings=connector.connector_metadata,
+                    connector_id=connector.connector_id,
+                )
+            return self._list_directory(
+                source_fs=listing_fs.source_fs, directory=directory
+            )
+
+        executor = ThreadPoolExecutor(
+            max_workers=settings.SOURCE_LISTING_CONCURRENCY,
+            thread_name_prefix="source-listing",
+        )
+        try:
+            for depth in range(1, max_depth + 1):
+                if not level:
+                    break
+                listings = executor.map(lambda entry: list_directory(entry[1]), level)
+                next_level: list[tuple[str, str]] = []
+                for (input_directory, _), (root, dirs, files) in zip(level, listings):
+                    yield input_directory, root, files
+                    if depth == max_depth:
+                        continue
+                    for dir_info in dirs.values():
+                        if dir_info["name"] not in visited:
+                            visited.add(dir_info["name"])
+                            next_level.append((input_directory, dir_info["name"]))
+                level = next_level
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _list_directory(
+        self, source_fs: Any, directory: str
+    ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+        """List the immediate sub directories and files of a directory.
+
+        Args:
+            source_fs (Any): The listing thread's file system object.
+            directory (str): Directory to list
+
+        Returns:
+            tuple[str, dict[str, Any], dict[str, Any]]: The listed directory,
+            details of its sub directories and of its files
+        """
+        for root, dirs, files in source_fs.walk(directory, maxdepth=1, detail=True):
+            return root, dirs, files
+        return directory, {}, {}
 
     def _should_process_file(self, file: str, patterns: list[str]) -> bool:
         """Check if the file should be processed based on the patterns."""
@@ -321,15 +473,18 @@ class SourceConnector(BaseConnector):
             fnmatch.fnmatchcase(file.lower(), pattern.lower()) for pattern in patterns
         )
 
-    def _is_new_file(self, file_path: str, workflow: Workflow) -> bool:
-        """Check if the file is new or already processed."""
-        file_content = self.get_file_content(input_file_path=file_path)
-        file_hash = self.get_hash_value(file_content)
-        file_history = FileHistoryHelper.get_file_history(
-            workflow=workflow, cache_key=file_hash
-        )
+    def _is_new_file(
+        self, file_path: str, file_hash: str, processed_hashes: set[str]
+    ) -> bool:
+        """Check if the file is new or already processed.
 
-        if file_history and file_history.is_completed():
+        Args:
+            file_path (str): Path of the file
+            file_hash (str): Hash of the file content
+            processed_hashes (set[str]): Hashes of the files already processed
+                by the workflow, from `FileHistoryHelper.get_processed_cache_keys()`
+        """
+        if file_hash in processed_hashes:
             self.execution_service.publish_log(
                 f"Skipping file {file_path} as it has already been processed. "
                 "Clear the file markers to process it again."
@@ -338,11 +493,9 @@ class SourceConnector(BaseConnector):
 
         return True
 
-    def _create_file_hash(self, file_path: str) -> FileHash:
+    def _create_file_hash(self, file_path: str, file_hash: str) -> FileHash:
         """Create a FileHash object for the matched file."""
         file_name = os.path.basename(file_path)
-        file_content = self.get_file_content(input_file_path=file_path)
-        file_hash = self.get_hash_value(file_content)
         connection_type = self.endpoint.connection_type
 
         return FileHash(
@@ -370,6 +523,28 @@ class SourceConnector(BaseConnector):
             return self.list_file_from_api_storage(file_hashes)
         raise InvalidSourceConnectionType()
 
+    def get_file_batch_count(self, total_files: int) -> int:
+        """Get the number of batches to process the matched files in.
+
+        Batches are processed in parallel by separate workers, which is only
+        supported for filesystem sources. The limit can be configured per
+        workflow, falling back to `WORKFLOW_MAX_CONCURRENT_BATCHES`.
+
+        Args:
+            total_files (int): Number of files matched for the execution
+
+        Returns:
+            int: Number of batches, 1 if the files are to be processed serially
+        """
+        if self.endpoint.connection_type != WorkflowEndpoint.ConnectionType.FILESYSTEM:
+            return 1
+        source_configurations: dict[str, Any] = self.endpoint.configuration or {}
+        max_batches = int(
+            source_configurations.get(SourceKey.MAX_CONCURRENT_BATCHES)
+            or settings.WORKFLOW_MAX_CONCURRENT_BATCHES
+        )
+        return max(1, min(max_batches, total_files))
+
     @classmethod
     def hash_str(cls, string_to_hash: Any, hash_method: str = "sha256") -> str:
         """Computes the hash for a given input string.
@@ -419,6 +594,34 @@ class SourceConnector(BaseConnector):
 
         return bytes(file_content)
 
+    def get_file_hash(
+        self, input_file_path: str, chunk_size: Optional[int] = None
+    ) -> str:
+        """Compute the sha256 of a file in the source by streaming it in chunks.
+
+        Unlike `get_file_content()`, the file is never held in memory as a whole,
+        peak memory is bounded by `chunk_size`.
+
+        Args:
+            input_file_path (str): The path of the input file.
+            chunk_size (Optional[int]): The size of the chunks to read at a time.
+                Defaults to `settings.SOURCE_FILE_READ_CHUNK_SIZE`.
+
+        Returns:
+            str: The hash value of the file content.
+        """
+        chunk_size = chunk_size or settings.SOURCE_FILE_READ_CHUNK_SIZE
+        connector: ConnectorInstance = self.endpoint.connector_instance
+        connector_settings: dict[str, Any] = connector.connector_metadata
+        source_fs = self.get_fsspec(
+            settings=connector_settings, connector_id=connector.connector_id
+        )
+        file_hash = sha256()
+        with source_fs.open(input_file_path, "rb") as remote_file:
+            while chunk := remote_file.read(chunk_size):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
     def get_hash_value(self, file_content: bytes) -> str:
         """Generate a hash value from the file content.
 
@@ -440,9 +643,105 @@ class SourceConnector(BaseConnector):
         shutil.copyfile(source_file_path, infile_path)
         logger.info(f"File copied from {source_file_path} to {infile_path}")
 
+    def _download_file(
+        self, input_file_path: str, destination_path: str
+    ) -> tuple[str, str]:
+        """Stream a file from the source into the volume while hashing it.
+
+        The file is copied chunk by chunk and the hash is computed in the same
+        pass, so that memory is bounded by the chunk size.
+
+        Args:
+            input_file_path (str): The path of the file in the source.
+            destination_path (str): The path to write the file to.
+
+        Returns:
+            tuple[str, str]: The hash value of the file content and a preview
+            of its content.
+        """
+        chunk_size = settings.SOURCE_FILE_READ_CHUNK_SIZE
+        connector: ConnectorInstance = self.endpoint.connector_instance
+        connector_settings: dict[str, Any] = connector.connector_metadata
+        source_fs = self.get_fsspec(
+            settings=connector_settings, connector_id=connector.connector_id
+        )
+        file_hash = sha256()
+        file_preview = bytearray()
+        with source_fs.open(input_file_path, "rb") as remote_file:
+            with open(destination_path, "wb") as local_file:
+                while chunk := remote_file.read(chunk_size):
+                    file_hash.update(chunk)
+                    local_file.write(chunk)
+                    if len(file_preview) < SourceConstant.INPUT_PREVIEW_SIZE:
+                        remaining = SourceConstant.INPUT_PREVIEW_SIZE - len(
+                            file_preview
+                        )
+                        file_preview.extend(chunk[:remaining])
+        return file_hash.hexdigest(), file_preview.decode("utf-8", errors="replace")
+
+    def _prefetch_file(self, input_file_path: str) -> tuple[str, str, str]:
+        """Download a file into the prefetch directory of the execution.
+
+        Args:
+            input_file_path (str): The path of the file in the source.
+
+        Returns:
+            tuple[str, str, str]: Path of the downloaded file, hash value of the
+            file content and a preview of its content.
+        """
+        os.makedirs(self._prefetch_dir, exist_ok=True)
+        prefetched_file_path = os.path.join(
+            self._prefetch_dir, self.hash_str(input_file_path)
+        )
+        file_hash, file_preview = self._download_file(
+            input_file_path=input_file_path, destination_path=prefetched_file_path
+        )
+        return prefetched_file_path, file_hash, file_preview
+
+    def prefetch_files(self, input_file_paths: list[str]) -> None:
+        """Download the upcoming files into the execution volume in background.
+
+        Only the first `SOURCE_PREFETCH_COUNT` files are scheduled, these are
+        picked up by `add_input_from_connector_to_volume()` when it's their
+        turn to be processed. Does nothing for sources other than filesystems.
+
+        Args:
+            input_file_paths (list[str]): Paths of the files to be processed
+                next, in the order of processing.
+        """
+        prefetch_count = settings.SOURCE_PREFETCH_COUNT
+        if (
+            prefetch_count < 1
+            or self.endpoint.connection_type
+            != WorkflowEndpoint.ConnectionType.FILESYSTEM
+        ):
+            return
+        if not self._prefetch_executor:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=prefetch_count, thread_name_prefix="source-prefetch"
+            )
+        for input_file_path in input_file_paths[:prefetch_count]:
+            if input_file_path not in self._prefetched_files:
+                self._prefetched_files[input_file_path] = (
+                    self._prefetch_executor.submit(self._prefetch_file, input_file_path)
+                )
+
+    def shutdown_prefetch(self) -> None:
+        """Stop prefetching and discard the files that are not picked up.
+
+        Waits for in-flight downloads so that the execution directory can be
+        safely cleaned up afterwards.
+        """
+        if self._prefetch_executor:
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+        self._prefetched_files.clear()
+
     def add_input_from_connector_to_volume(self, input_file_path: str) -> str:
         """Add input file to execution directory.
 
+        Uses the file if it was already prefetched, else it's downloaded.
+
         Args:
             input_file_path (str): The path of the input file.
 
@@ -454,24 +753,33 @@ class SourceConnector(BaseConnector):
         """
         source_file_path = os.path.join(self.execution_dir, WorkflowFileType.SOURCE)
         infile_path = os.path.join(self.execution_dir, WorkflowFileType.INFILE)
-        source_file = f"file://{source_file_path}"
 
-        # Get file content and hash value
-        file_content = self.get_file_content(input_file_path)
-        hash_value_of_file_content = self.get_hash_value(file_content)
+        hash_value_of_file_content: Optional[str] = None
+        prefetched_file = self._prefetched_files.pop(input_file_path, None)
+        if prefetched_file:
+            try:
+                prefetched_file_path, hash_value_of_file_content, file_preview = (
+                    prefetched_file.result()
+                )
+                os.replace(prefetched_file_path, source_file_path)
+            except Exception as e:
+                logger.warning(
+                    f"Unable to use prefetched file '{input_file_path}', "
+                    f"downloading it again: {e}"
+                )
+                hash_value_of_file_content = None
+        if not hash_value_of_file_content:
+            hash_value_of_file_content, file_preview = self._download_file(
+                input_file_path=input_file_path, destination_path=source_file_path
+            )
 
         logger.info(
-            f"hash_value_of_file {source_file} is : {hash_value_of_file_content}"
+            f"hash_value_of_file {source_file_path} is : {hash_value_of_file_content}"
         )
 
-        input_log = (
-            file_content[:500].decode("utf-8", errors="replace") + "...(truncated)"
-        )
+        input_log = file_preview + "...(truncated)"
         self.publish_input_file_content(input_file_path, input_log)
 
-        with fsspec.open(source_file, "wb") as local_file:
-            local_file.write(file_content)
-
         # Copy file to infile directory
         self.copy_file_to_infile_dir(source_file_path, infile_path)
 
@@ -553,6 +861,52 @@ class SourceConnector(BaseConnector):
 
         return os.path.basename(input_file_path), file_stream
 
+    @classmethod
+    def _store_uploaded_file(cls, file: UploadedFile, destination_path: str) -> str:
+        """Store an uploaded file at the destination and compute its hash.
+
+        Uploads spooled to disk by Django are moved into place when they are
+        on the same volume (see `FILE_UPLOAD_TEMP_DIR`). Otherwise the upload
+        is streamed chunk by chunk into a temporary file next to the
+        destination while being hashed, and renamed once complete. Memory is
+        bounded by the chunk size irrespective of the upload size.
+
+        Args:
+            file (UploadedFile): File uploaded in the request
+            destination_path (str): Path to store the file at
+
+        Returns:
+            str: sha256 hash of the file content
+        """
+        chunk_size = settings.SOURCE_FILE_READ_CHUNK_SIZE
+        file_hash = sha256()
+        if isinstance(file, TemporaryUploadedFile):
+            try:
+                os.replace(file.temporary_file_path(), destination_path)
+            except OSError:
+                # Spooled on a different volume, fallback to copying it
+                pass
+            else:
+                # Django creates the spooled file readable only by its owner
+                os.chmod(destination_path, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+                with open(destination_path, "rb") as f:
+                    while chunk := f.read(chunk_size):
+                        file_hash.update(chunk)
+                return file_hash.hexdigest()
+
+        temp_path = f"{destination_path}.{uuid4().hex}.part"
+        try:
+            with open(temp_path, "wb") as f:
+                for chunk in file.chunks(chunk_size=chunk_size):
+                    file_hash.update(chunk)
+                    f.write(chunk)
+            os.replace(temp_path, destination_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return file_hash.hexdigest()
+
     @classmethod
     def add_input_file_to_api_storage(
         cls, workflow_id: str, execution_id: str, file_objs: list[UploadedFile]
@@ -575,27 +929,24 @@ class SourceConnector(BaseConnector):
             file_name = file.name
             destination_path = os.path.join(api_storage_dir, file_name)
             os.makedirs(os.path.dirname(destination_path), exist_ok=True)
-            with open(destination_path, "wb") as f:
-                buffer = bytearray()
-                for chunk in file.chunks():
-                    buffer.extend(chunk)
-                f.write(buffer)
-            file_hash = cls.hash_str(buffer)
-            connection_type = WorkflowEndpoint.ConnectionType.API
-            file_history = FileHistoryHelper.get_file_history(
-                workflow=workflow, cache_key=file_hash
-            )
-            is_executed = (
-                True if file_history and file_history.is_completed() else False
+            file_hash = cls._store_uploaded_file(
+                file=file, destination_path=destination_path
             )
+            connection_type = WorkflowEndpoint.ConnectionType.API
             file_hash = FileHash(
                 file_path=destination_path,
                 source_connection_type=connection_type,
                 file_name=file_name,
                 file_hash=file_hash,
-                is_executed=is_executed,
             )
             file_hashes.update({file_name: file_hash})
+
+        processed_hashes = FileHistoryHelper.get_processed_cache_keys(
+            workflow=workflow,
+            cache_keys=[file_hash.file_hash for file_hash in file_hashes.values()],
+        )
+        for file_hash in file_hashes.values():
+            file_hash.is_executed = file_hash.file_hash in processed_hashes
         return file_hashes
 
     @classmethod
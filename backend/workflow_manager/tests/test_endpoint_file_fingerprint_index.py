@@ -0,0 +1,99 @@
+import json
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from workflow_manager.endpoint.file_fingerprint_index import FileFingerprintIndex
+
+MODULE = "workflow_manager.endpoint.file_fingerprint_index"
+
+
+@pytest.fixture
+def cache_service():
+    with mock.patch(f"{MODULE}.CacheService") as cache_service:
+        yield cache_service
+
+
+@pytest.fixture
+def index():
+    return FileFingerprintIndex(
+        organization_id="org", workflow_id="workflow", connector_id="connector"
+    )
+
+
+def indexed(fingerprint: str, file_hash: str) -> str:
+    return json.dumps({"fingerprint": fingerprint, "file_hash": file_hash})
+
+
+def test_cache_key(index):
+    """Test the index is kept per workflow and connector instance."""
+    assert index.cache_key == "file_fingerprint:org:workflow:connector"
+
+
+def test_get_fingerprint_preference():
+    """Test the fingerprint uses the most specific version key."""
+    file_info = {"size": 10, "mtime": 1700000000, "ETag": '"abc"'}
+    assert FileFingerprintIndex.get_fingerprint(file_info) == '10:ETag:"abc"'
+
+
+def test_get_fingerprint_without_version():
+    """Test files identified only by their size have no fingerprint."""
+    assert FileFingerprintIndex.get_fingerprint({"size": 10}) is None
+
+
+def test_get_file_hashes(index, cache_service):
+    """Test only files with an unchanged fingerprint reuse their hash."""
+    cache_service.hmget.return_value = [
+        indexed("fp-a", "hash-a"),
+        indexed("old-fp-b", "hash-b"),
+        None,
+    ]
+
+    file_hashes = index.get_file_hashes({"a": "fp-a", "b": "fp-b", "c": "fp-c"})
+
+    assert file_hashes == {"a": "hash-a"}
+    cache_service.hmget.assert_called_once_with(index.cache_key, ["a", "b", "c"])
+
+
+@mock.patch.object(FileFingerprintIndex, "BATCH_SIZE", 2)
+def test_get_file_hashes_in_batches(index, cache_service):
+    """Test the index is read in batches of BATCH_SIZE files."""
+    cache_service.hmget.side_effect = lambda key, batch: [
+        indexed(f"fp-{path}", f"hash-{path}") for path in batch
+    ]
+
+    file_hashes = index.get_file_hashes({path: f"fp-{path}" for path in "abcde"})
+
+    assert file_hashes == {path: f"hash-{path}" for path in "abcde"}
+    assert [call.args[1] for call in cache_service.hmget.call_args_list] == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+
+
+@mock.patch.object(FileFingerprintIndex, "BATCH_SIZE", 1)
+def test_get_file_hashes_read_failure(index, cache_service):
+    """Test a failing index returns the hashes read so far."""
+    cache_service.hmget.side_effect = [[indexed("fp-a", "hash-a")], Exception]
+
+    file_hashes = index.get_file_hashes({"a": "fp-a", "b": "fp-b"})
+
+    assert file_hashes == {"a": "hash-a"}
+
+
+@override_settings(FILE_FINGERPRINT_INDEX_TTL=60)
+def test_update(index, cache_service):
+    """Test hashes are recorded against fingerprints with the index TTL."""
+    index.update({"a": ("fp-a", "hash-a")})
+
+    cache_service.hset.assert_called_once_with(
+        index.cache_key, {"a": indexed("fp-a", "hash-a")}, expire=60
+    )
+
+
+def test_update_nothing(index, cache_service):
+    """Test nothing is written without hashes to record."""
+    index.update({})
+
+    cache_service.hset.assert_not_called()
@@ -32,6 +32,8 @@ class WorkflowExecutionKey:
     EXECUTION_ID = "execution_id"
     LOG_GUID = "log_guid"
     WITH_LOG = "with_log"
+    # Execution sub directory of a batch in a parallel execution
+    BATCH_DIR_PREFIX = "batch-"
 
 
 class WorkflowErrors:
@@ -44,6 +46,18 @@ class CeleryConfigurations:
     INTERVAL = 2
 
 
+class FilePipelineConstants:
+    # Number of files in flight between the stages of an execution, each of
+    # them is staged in its own execution sub directory
+    DEPTH = 2
+    SLOT_DIR_PREFIX = "slot-"
+
+
+class FileHistoryConstants:
+    # Max cache keys looked up in a single query
+    LOOKUP_BATCH_SIZE = 1000
+
+
 class Tool:
     APIOPS = "apiops"
 
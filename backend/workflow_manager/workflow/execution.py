@@ -35,12 +35,16 @@ class WorkflowExecutionServiceHelper(WorkflowExecutionService):
         mode: tuple[str, str] = WorkflowExecution.Mode.INSTANT,
         workflow_execution: Optional[WorkflowExecution] = None,
         use_file_history: bool = True,
+        execution_sub_dir: Optional[str] = None,
+        execution_plan: Optional[list[ToolInstanceDataClass]] = None,
     ) -> None:
-        tool_instances_as_dto = []
-        for tool_instance in tool_instances:
-            tool_instances_as_dto.append(
+        # A cached plan has the tool instances already compiled
+        tool_instances_as_dto = execution_plan
+        if tool_instances_as_dto is None:
+            tool_instances_as_dto = [
                 self.convert_tool_instance_model_to_data_class(tool_instance)
-            )
+                for tool_instance in tool_instances
+            ]
         workflow_as_dto: WorkflowDto = self.convert_workflow_model_to_data_class(
             workflow=workflow
         )
@@ -56,6 +60,7 @@ class WorkflowExecutionServiceHelper(WorkflowExecutionService):
             tool_instances=tool_instances_as_dto,
             platform_service_api_key=str(platform_key.key),
             ignore_processed_entities=False,
+            execution_sub_dir=execution_sub_dir,
         )
         if not workflow_execution:
             # Use pipline_id for pipelines / API deployment
@@ -1,7 +1,10 @@
 import logging
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+from django.db.models import Max
 from django.db.utils import IntegrityError
+from tool_instance.models import ToolInstance
+from workflow_manager.workflow.constants import FileHistoryConstants
 from workflow_manager.workflow.enums import ExecutionStatus
 from workflow_manager.workflow.models.file_history import FileHistory
 from workflow_manager.workflow.models.workflow import Workflow
@@ -34,6 +37,74 @@ class FileHistoryHelper:
             return None
         return file_history
 
+    @staticmethod
+    def get_processed_cache_keys(
+        workflow: Workflow, cache_keys: Iterable[str]
+    ) -> set[str]:
+        """Get the cache keys that are already processed by a workflow.
+
+        Looks up the keys in bulk with chunked `cache_key__in` queries instead
+        of a query per file.
+
+        Args:
+            workflow (Workflow): The workflow to look up file history for.
+            cache_keys (Iterable[str]): The cache keys (file hashes) to look up.
+
+        Returns:
+            set[str]: The cache keys having a completed file history record.
+        """
+        unique_cache_keys = list({cache_key for cache_key in cache_keys if cache_key})
+        batch_size = FileHistoryConstants.LOOKUP_BATCH_SIZE
+        processed_cache_keys: set[str] = set()
+        for start in range(0, len(unique_cache_keys), batch_size):
+            end = start + batch_size
+            processed_cache_keys.update(
+                FileHistory.objects.filter(
+                    workflow=workflow,
+                    cache_key__in=unique_cache_keys[start:end],
+                    status=ExecutionStatus.COMPLETED.value,
+                ).values_list("cache_key", flat=True)
+            )
+        return processed_cache_keys
+
+    @staticmethod
+    def get_current_file_histories(
+        workflow: Workflow, cache_keys: Iterable[str]
+    ) -> dict[str, FileHistory]:
+        """Get the completed file history records produced by the current
+        version of a workflow.
+
+        Records last written before the last change to the workflow or to
+        any of its tool instances are left out.
+
+        Args:
+            workflow (Workflow): The workflow to look up file history for.
+            cache_keys (Iterable[str]): The cache keys (file hashes) to look up.
+
+        Returns:
+            dict[str, FileHistory]: The matching file history records by their
+            cache key.
+        """
+        changed_at = workflow.modified_at
+        tools_changed_at = ToolInstance.objects.filter(workflow=workflow).aggregate(
+            changed_at=Max("modified_at")
+        )["changed_at"]
+        if tools_changed_at and tools_changed_at > changed_at:
+            changed_at = tools_changed_at
+        unique_cache_keys = list({cache_key for cache_key in cache_keys if cache_key})
+        batch_size = FileHistoryConstants.LOOKUP_BATCH_SIZE
+        file_histories: dict[str, FileHistory] = {}
+        for start in range(0, len(unique_cache_keys), batch_size):
+            end = start + batch_size
+            for file_history in FileHistory.objects.filter(
+                workflow=workflow,
+                cache_key__in=unique_cache_keys[start:end],
+                status=ExecutionStatus.COMPLETED.value,
+                modified_at__gte=changed_at,
+            ):
+                file_histories[file_history.cache_key] = file_history
+        return file_histories
+
     @staticmethod
     def create_file_history(
         cache_key: str,
@@ -44,7 +115,8 @@ class FileHistoryHelper:
         error: Optional[str] = None,
         file_name: Optional[str] = None,
     ) -> FileHistory:
-        """Create a new file history record.
+        """Create a file history record, or replace the one of a file that
+        was processed again.
 
         Args:
             cache_key (str): The cache key for the file.
@@ -53,16 +125,19 @@ class FileHistoryHelper:
             result (Any): The result from the execution.
 
         Returns:
-            FileHistory: The newly created file history record.
+            FileHistory: The created or updated file history record.
         """
         try:
-            file_history: FileHistory = FileHistory.objects.create(
+            file_history: FileHistory
+            file_history, _ = FileHistory.objects.update_or_create(
                 workflow=workflow,
                 cache_key=cache_key,
-                status=status.value,
-                result=str(result),
-                meta_data=str(metadata),
-                error=str(error) if error else "",
+                defaults={
+                    "status": status.value,
+                    "result": str(result),
+                    "meta_data": str(metadata),
+                    "error": str(error) if error else "",
+                },
             )
         except IntegrityError:
             # TODO: Need to find why duplicate insert is coming
@@ -0,0 +1,98 @@
+from unittest import mock
+
+import pytest
+from workflow_manager.workflow.constants import FileHistoryConstants
+from workflow_manager.workflow.enums import ExecutionStatus
+from workflow_manager.workflow.file_history_helper import FileHistoryHelper
+
+MODULE = "workflow_manager.workflow.file_history_helper"
+
+
+@pytest.fixture
+def file_history():
+    with mock.patch(f"{MODULE}.FileHistory") as file_history:
+        # Every looked up key is reported as processed, except "new"
+        file_history.objects.filter.side_effect = lambda **kwargs: mock.Mock(
+            values_list=mock.Mock(
+                return_value=[
+                    key for key in kwargs["cache_key__in"] if not key.startswith("new")
+                ]
+            )
+        )
+        yield file_history
+
+
+def looked_up_batches(file_history) -> list[list[str]]:
+    return [
+        call.kwargs["cache_key__in"]
+        for call in file_history.objects.filter.call_args_list
+    ]
+
+
+@mock.patch.object(FileHistoryConstants, "LOOKUP_BATCH_SIZE", 2)
+def test_get_processed_cache_keys_in_batches(file_history):
+    """Test cache keys are looked up in batches of LOOKUP_BATCH_SIZE."""
+    workflow = mock.Mock()
+    cache_keys = ["a", "b", "c", "d", "new"]
+
+    processed = FileHistoryHelper.get_processed_cache_keys(
+        workflow=workflow, cache_keys=cache_keys
+    )
+
+    assert processed == {"a", "b", "c", "d"}
+    batches = looked_up_batches(file_history)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(key for batch in batches for key in batch) == sorted(cache_keys)
+    for call in file_history.objects.filter.call_args_list:
+        assert call.kwargs["workflow"] is workflow
+        assert call.kwargs["status"] == ExecutionStatus.COMPLETED.value
+
+
+@mock.patch.object(FileHistoryConstants, "LOOKUP_BATCH_SIZE", 2)
+def test_get_processed_cache_keys_unique(file_history):
+    """Test duplicate and empty cache keys are looked up once or not at all."""
+    processed = FileHistoryHelper.get_processed_cache_keys(
+        workflow=mock.Mock(), cache_keys=["a", "", "a", None, "new"]
+    )
+
+    assert processed == {"a"}
+    batches = looked_up_batches(file_history)
+    assert sorted(key for batch in batches for key in batch) == ["a", "new"]
+
+
+def test_get_processed_cache_keys_nothing(file_history):
+    """Test no query is made without cache keys to look up."""
+    processed = FileHistoryHelper.get_processed_cache_keys(
+        workflow=mock.Mock(), cache_keys=[]
+    )
+
+    assert processed == set()
+    file_history.objects.filter.assert_not_called()
+
+
+def test_create_file_history_replaces_record(file_history):
+    """Test a file processed again replaces its file history record."""
+    workflow = mock.Mock()
+    record = mock.Mock()
+    file_history.objects.update_or_create.return_value = (record, False)
+
+    created = FileHistoryHelper.create_file_history(
+        cache_key="a",
+        workflow=workflow,
+        status=ExecutionStatus.COMPLETED,
+        result={"output": 1},
+        metadata=None,
+    )
+
+    assert created is record
+    file_history.objects.update_or_create.assert_called_once_with(
+        workflow=workflow,
+        cache_key="a",
+        defaults={
+            "status": ExecutionStatus.COMPLETED.value,
+            "result": str({"output": 1}),
+            "meta_data": "None",
+            "error": "",
+        },
+    )
+    file_history.objects.create.assert_not_called()
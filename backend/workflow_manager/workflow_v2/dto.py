@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Optional
 
 from celery.result import AsyncResult
+from workflow_manager.endpoint_v2.dto import FileHash
 from workflow_manager.workflow_v2.constants import WorkflowKey
 
 
@@ -66,3 +67,30 @@ class AsyncResultData:
             "status": self.status,
             "result": self.result,
         }
+
+
+@dataclass
+class FileBatchResult:
+    """Outcome of processing a batch of files of an execution."""
+
+    successful_files: int = 0
+    failed_files: int = 0
+    error: Optional[str] = None
+    stopped: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "FileBatchResult":
+        return FileBatchResult(**data)
+
+
+@dataclass
+class StagedFile:
+    """File of an execution copied to the volume, waiting for its next stage."""
+
+    file_number: int
+    file_hash: FileHash
+    file_name: str
+    sub_dir: str
@@ -0,0 +1,88 @@
+import hashlib
+import logging
+from typing import Optional
+
+from django.conf import settings
+from tool_instance_v2.models import ToolInstance
+from unstract.workflow_execution.dto import ToolInstance as ToolInstanceDataClass
+from utils.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionPlanCache:
+    """Cache of the compiled tool instances of workflows.
+
+    Compiling a workflow resolves the tools of its tool instances from the
+    registry, which is the same work for every execution of an unchanged
+    workflow. The compiled tool instances are cached against the IDs, steps
+    and `modified_at` of the tool instances, so editing, adding, removing or
+    reordering a tool makes the next execution compile the workflow again.
+    Tools updated in the registry are picked up once the plan expires after
+    `WORKFLOW_EXECUTION_PLAN_TTL`. Only the resolution is cached, the tool
+    settings and adapter permissions are validated by every execution.
+    """
+
+    CACHE_PREFIX = "workflow_execution_plan:"
+
+    @classmethod
+    def get_cache_key(cls, workflow_id: str, tool_instances: list[ToolInstance]) -> str:
+        versions = ",".join(
+            f"{tool_instance.id}:{tool_instance.step}:"
+            f"{tool_instance.modified_at.isoformat()}"
+            for tool_instance in tool_instances
+        )
+        digest = hashlib.sha256(versions.encode("utf-8")).hexdigest()
+        return f"{cls.CACHE_PREFIX}{workflow_id}:{digest}"
+
+    @classmethod
+    def get_plan(
+        cls, workflow_id: str, tool_instances: list[ToolInstance]
+    ) -> Optional[list[ToolInstanceDataClass]]:
+        """Get the compiled tool instances of a workflow.
+
+        Args:
+            workflow_id (str): ID of the workflow
+            tool_instances (list[ToolInstance]): Current tool instances of
+                the workflow in step order
+
+        Returns:
+            Optional[list[ToolInstanceDataClass]]: Compiled tool instances,
+                None if the workflow has to be compiled
+        """
+        if settings.WORKFLOW_EXECUTION_PLAN_TTL < 1 or not tool_instances:
+            return None
+        try:
+            plan = CacheService.get_key(cls.get_cache_key(workflow_id, tool_instances))
+        except Exception as e:
+            logger.warning(f"Unable to read execution plan of {workflow_id}: {e}")
+            return None
+        if not isinstance(plan, list):
+            return None
+        return plan
+
+    @classmethod
+    def set_plan(
+        cls,
+        workflow_id: str,
+        tool_instances: list[ToolInstance],
+        plan: list[ToolInstanceDataClass],
+    ) -> None:
+        """Cache the compiled tool instances of a workflow.
+
+        Args:
+            workflow_id (str): ID of the workflow
+            tool_instances (list[ToolInstance]): Tool instances the plan is
+                compiled from
+            plan (list[ToolInstanceDataClass]): Compiled tool instances
+        """
+        if settings.WORKFLOW_EXECUTION_PLAN_TTL < 1 or not tool_instances:
+            return
+        try:
+            CacheService.set_key(
+                cls.get_cache_key(workflow_id, tool_instances),
+                plan,
+                expire=settings.WORKFLOW_EXECUTION_PLAN_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Unable to cache execution plan of {workflow_id}: {e}")
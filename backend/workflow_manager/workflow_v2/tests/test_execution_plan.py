@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from workflow_manager.workflow_v2.execution_plan import ExecutionPlanCache
+from workflow_manager.workflow_v2.workflow_helper import WorkflowHelper
+
+MODULE = "workflow_manager.workflow_v2.execution_plan"
+HELPER_MODULE = "workflow_manager.workflow_v2.workflow_helper"
+MODIFIED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PLAN = ["compiled tool instance"]
+
+
+@pytest.fixture
+def cache():
+    cached: dict = {}
+    with mock.patch(f"{MODULE}.CacheService") as cache_service:
+        cache_service.get_key.side_effect = cached.get
+        cache_service.set_key.side_effect = (
+            lambda key, value, expire: cached.__setitem__(key, value)
+        )
+        yield cached
+
+
+def tool_instance(id: str, step: int, modified_at: datetime = MODIFIED_AT):
+    return mock.Mock(id=id, step=step, modified_at=modified_at)
+
+
+def tool_instances() -> list[mock.Mock]:
+    return [tool_instance("a", 1), tool_instance("b", 2)]
+
+
+def test_get_plan_cached(cache):
+    """Test a plan is reused for unchanged tool instances."""
+    ExecutionPlanCache.set_plan("workflow", tool_instances(), PLAN)
+
+    assert ExecutionPlanCache.get_plan("workflow", tool_instances()) == PLAN
+    assert ExecutionPlanCache.get_plan("other", tool_instances()) is None
+
+
+@pytest.mark.parametrize(
+    "changed_tool_instances",
+    [
+        # Edited
+        [tool_instance("a", 1), tool_instance("b", 2, MODIFIED_AT + timedelta(1))],
+        # Reordered
+        [tool_instance("b", 1), tool_instance("a", 2)],
+        # Added
+        [tool_instance("a", 1), tool_instance("b", 2), tool_instance("c", 3)],
+        # Removed
+        [tool_instance("a", 1)],
+        # Replaced
+        [tool_instance("a", 1), tool_instance("c", 2)],
+    ],
+)
+def test_get_plan_invalidated(cache, changed_tool_instances):
+    """Test a plan is not reused once the tool instances change."""
+    ExecutionPlanCache.set_plan("workflow", tool_instances(), PLAN)
+
+    assert ExecutionPlanCache.get_plan("workflow", changed_tool_instances) is None
+
+
+@override_settings(WORKFLOW_EXECUTION_PLAN_TTL=0)
+def test_get_plan_disabled(cache):
+    """Test plans are not cached when disabled."""
+    ExecutionPlanCache.set_plan("workflow", tool_instances(), PLAN)
+
+    assert cache == {}
+    assert ExecutionPlanCache.get_plan("workflow", tool_instances()) is None
+
+
+@mock.patch(f"{HELPER_MODULE}.ExecutionPlanCache.get_plan", return_value=PLAN)
+@mock.patch(f"{HELPER_MODULE}.ToolInstanceHelper.get_tool_instances_by_workflow")
+@mock.patch.object(WorkflowHelper, "validate_tool_instances_meta")
+@mock.patch.object(
+    WorkflowHelper, "build_workflow_execution_service", side_effect=RuntimeError
+)
+def test_run_workflow_validates_cached_plan(
+    build, validate, get_tool_instances, get_plan
+):
+    """Test tool instances are validated even when their plan is cached."""
+    get_tool_instances.return_value = tool_instances()
+
+    with pytest.raises(RuntimeError):
+        WorkflowHelper.run_workflow(workflow=mock.Mock())
+
+    validate.assert_called_once_with(tool_instances=get_tool_instances.return_value)
+    assert build.call_args.kwargs["execution_plan"] == PLAN
@@ -1,40 +1,51 @@
 import json
 import logging
+import math
 import os
+import threading
 import traceback
+from queue import Queue
 from typing import Any, Optional
 from uuid import uuid4
 
 from account_v2.constants import Common
 from api_v2.models import APIDeployment
 from api_v2.utils import APIDeploymentUtils
-from celery import current_task
-from celery import exceptions as celery_exceptions
-from celery import shared_task
+from asgiref.sync import sync_to_async
+from celery import chord, current_task, shared_task, states
 from celery.result import AsyncResult
-from django.db import IntegrityError
+from celery.signals import task_postrun
+from django.conf import settings
+from django.db import IntegrityError, connection
 from pipeline_v2.models import Pipeline
 from pipeline_v2.pipeline_processor import PipelineProcessor
 from rest_framework import serializers
 from tool_instance_v2.constants import ToolInstanceKey
 from tool_instance_v2.models import ToolInstance
 from tool_instance_v2.tool_instance_helper import ToolInstanceHelper
+from unstract.workflow_execution.dto import ToolInstance as ToolInstanceDataClass
 from unstract.workflow_execution.enums import LogComponent, LogLevel, LogState
 from unstract.workflow_execution.exceptions import StopExecution
 from utils.cache_service import CacheService
 from utils.constants import Account
+from utils.execution_notifier import ExecutionNotifier
 from utils.local_context import StateStore
 from utils.user_context import UserContext
 from workflow_manager.endpoint_v2.destination import DestinationConnector
 from workflow_manager.endpoint_v2.dto import FileHash
 from workflow_manager.endpoint_v2.source import SourceConnector
 from workflow_manager.workflow_v2.constants import (
-    CeleryConfigurations,
+    FilePipelineConstants,
     WorkflowErrors,
     WorkflowExecutionKey,
     WorkflowMessages,
 )
-from workflow_manager.workflow_v2.dto import AsyncResultData, ExecutionResponse
+from workflow_manager.workflow_v2.dto import (
+    AsyncResultData,
+    ExecutionResponse,
+    FileBatchResult,
+    StagedFile,
+)
 from workflow_manager.workflow_v2.enums import ExecutionStatus, SchemaEntity, SchemaType
 from workflow_manager.workflow_v2.exceptions import (
     InvalidRequest,
@@ -43,6 +54,7 @@ from workflow_manager.workflow_v2.exceptions import (
     WorkflowExecutionNotExist,
 )
 from workflow_manager.workflow_v2.execution import WorkflowExecutionServiceHelper
+from workflow_manager.workflow_v2.execution_plan import ExecutionPlanCache
 from workflow_manager.workflow_v2.file_history_helper import FileHistoryHelper
 from workflow_manager.workflow_v2.models.execution import WorkflowExecution
 from workflow_manager.workflow_v2.models.workflow import Workflow
@@ -92,6 +104,7 @@ class WorkflowHelper:
         scheduled: bool,
         execution_mode: tuple[str, str],
         workflow_execution: Optional[WorkflowExecution],
+        execution_plan: Optional[list[ToolInstanceDataClass]] = None,
     ) -> WorkflowExecutionServiceHelper:
         workflow_execution_service = WorkflowExecutionServiceHelper(
             organization_id=organization_id,
@@ -102,6 +115,7 @@ class WorkflowHelper:
             scheduled=scheduled,
             mode=execution_mode,
             workflow_execution=workflow_execution,
+            execution_plan=execution_plan,
         )
         workflow_execution_service.build()
         return workflow_execution_service
@@ -113,26 +127,86 @@ class WorkflowHelper:
         destination: DestinationConnector,
         execution_service: WorkflowExecutionServiceHelper,
         single_step: bool,
-        hash_values_of_files: dict[str, FileHash] = {},
+        input_files: dict[str, FileHash],
+        total_files: int,
     ) -> WorkflowExecution:
-        input_files, total_files = source.list_files_from_source(hash_values_of_files)
-        error_message = None
-        successful_files = 0
-        failed_files = 0
-        execution_service.publish_initial_workflow_logs(total_files)
-        execution_service.update_execution(
-            ExecutionStatus.EXECUTING, increment_attempt=True
+        file_batch = WorkflowHelper._number_input_files(
+            workflow, input_files, total_files
         )
+        batch_result = WorkflowHelper.process_file_batch(
+            workflow=workflow,
+            source=source,
+            destination=destination,
+            execution_service=execution_service,
+            file_batch=file_batch,
+            total_files=total_files,
+            single_step=single_step,
+        )
+        WorkflowHelper._complete_file_processing(
+            execution_service, total_files, [batch_result]
+        )
+        return execution_service.get_execution_instance()
+
+    @staticmethod
+    def _number_input_files(
+        workflow: Workflow, input_files: dict[str, FileHash], total_files: int
+    ) -> list[tuple[int, FileHash]]:
+        """Pairs the input files with their 1-based position in the execution
+        and marks the ones meant for manual review.
+        """
+        q_file_no_list = None
         if total_files > 0:
             q_file_no_list = WorkflowUtil.get_q_no_list(workflow, total_files)
-
-        for index, (file_path, file_hash) in enumerate(input_files.items()):
+        numbered_files = []
+        for index, file_hash in enumerate(input_files.values()):
             file_number = index + 1
             file_hash = WorkflowUtil.add_file_destination_filehash(
                 file_number,
                 q_file_no_list,
                 file_hash,
             )
+            numbered_files.append((file_number, file_hash))
+        return numbered_files
+
+    @staticmethod
+    def process_file_batch(
+        workflow: Workflow,
+        source: SourceConnector,
+        destination: DestinationConnector,
+        execution_service: WorkflowExecutionServiceHelper,
+        file_batch: list[tuple[int, FileHash]],
+        total_files: int,
+        single_step: bool,
+    ) -> FileBatchResult:
+        """Processes the given files one after the other.
+
+        Args:
+            file_batch (list[tuple[int, FileHash]]): Files to process along with
+                their 1-based position in the execution
+            total_files (int): Total number of files in the execution
+
+        Returns:
+            FileBatchResult: Count of successful and failed files
+        """
+        if (
+            settings.WORKFLOW_FILE_PIPELINING
+            and not single_step
+            and len(file_batch) > 1
+        ):
+            return WorkflowHelper._process_file_batch_pipelined(
+                workflow=workflow,
+                source=source,
+                destination=destination,
+                execution_service=execution_service,
+                file_batch=file_batch,
+                total_files=total_files,
+            )
+        batch_result = FileBatchResult()
+        file_paths = [file_hash.file_path for _, file_hash in file_batch]
+
+        for index, (file_number, file_hash) in enumerate(file_batch, start=1):
+            # Read ahead the upcoming files while this one is being processed
+            source.prefetch_files(file_paths[index:])
             try:
                 error = WorkflowHelper.process_file(
                     current_file_idx=file_number,
@@ -146,21 +220,39 @@ class WorkflowHelper:
                     file_hash=file_hash,
                 )
                 if error:
-                    failed_files += 1
+                    batch_result.failed_files += 1
                 else:
-                    successful_files += 1
+                    batch_result.successful_files += 1
             except StopExecution as e:
                 execution_service.update_execution(
                     ExecutionStatus.STOPPED, error=str(e)
                 )
+                batch_result.stopped = True
                 break
             except Exception as e:
-                failed_files += 1
-                error_message = f"Error processing file '{file_path}'. {e}"
-                logger.error(error_message, stack_info=True, exc_info=True)
+                batch_result.failed_files += 1
+                batch_result.error = (
+                    f"Error processing file '{file_hash.file_path}'. {e}"
+                )
+                logger.error(batch_result.error, stack_info=True, exc_info=True)
                 execution_service.publish_log(
-                    message=error_message, level=LogLevel.ERROR
+                    message=batch_result.error, level=LogLevel.ERROR
                 )
+        return batch_result
+
+    @staticmethod
+    def _complete_file_processing(
+        execution_service: WorkflowExecutionServiceHelper,
+        total_files: int,
+        batch_results: list[FileBatchResult],
+    ) -> None:
+        """Updates the execution status from the outcome of its file batches
+        and publishes the final logs.
+        """
+        successful_files = sum(result.successful_files for result in batch_results)
+        failed_files = sum(result.failed_files for result in batch_results)
+        errors = [result.error for result in batch_results if result.error]
+        error_message = errors[-1] if errors else None
         if failed_files and failed_files >= total_files:
             execution_service.update_execution(
                 ExecutionStatus.ERROR, error=error_message
@@ -173,7 +265,239 @@ class WorkflowHelper:
             successful_files=successful_files,
             failed_files=failed_files,
         )
-        return execution_service.get_execution_instance()
+
+    @staticmethod
+    def dispatch_file_batches(
+        workflow: Workflow,
+        execution_service: WorkflowExecutionServiceHelper,
+        input_files: dict[str, FileHash],
+        total_files: int,
+        batch_count: int,
+    ) -> None:
+        """Splits the input files into batches that are processed in parallel
+        by celery workers.
+
+        The batches are grouped in a chord whose callback
+        `complete_file_batches()` aggregates their results into the execution.
+
+        Args:
+            input_files (dict[str, FileHash]): Files matched for the execution
+            total_files (int): Number of files matched
+            batch_count (int): Number of batches to split the files into
+        """
+        numbered_files = WorkflowHelper._number_input_files(
+            workflow, input_files, total_files
+        )
+        batch_size = math.ceil(total_files / batch_count)
+        file_batches: list[list[tuple[int, FileHash]]] = []
+        for start in range(0, total_files, batch_size):
+            end = start + batch_size
+            file_batches.append(numbered_files[start:end])
+        organization_id = execution_service.organization_id
+        workflow_id = str(workflow.id)
+        execution_id = execution_service.execution_id
+        pipeline_id = execution_service.pipeline_id
+        execution_service.publish_log(
+            f"Processing {total_files} files in {len(file_batches)} parallel batches"
+        )
+        batch_tasks = [
+            WorkflowHelper.execute_file_batch.s(
+                organization_id,
+                workflow_id,
+                execution_id,
+                f"{WorkflowExecutionKey.BATCH_DIR_PREFIX}{batch_number}",
+                [
+                    (file_number, file_hash.to_json())
+                    for file_number, file_hash in file_batch
+                ],
+                total_files,
+                pipeline_id=pipeline_id,
+            )
+            for batch_number, file_batch in enumerate(file_batches, start=1)
+        ]
+        chord(batch_tasks)(
+            WorkflowHelper.complete_file_batches.s(
+                organization_id,
+                workflow_id,
+                execution_id,
+                total_files,
+                pipeline_id=pipeline_id,
+            )
+        )
+        logger.info(
+            f"Execution '{execution_id}' dispatched as {len(file_batches)} batches"
+        )
+
+    @staticmethod
+    def _process_file_batch_pipelined(
+        workflow: Workflow,
+        source: SourceConnector,
+        destination: DestinationConnector,
+        execution_service: WorkflowExecutionServiceHelper,
+        file_batch: list[tuple[int, FileHash]],
+        total_files: int,
+    ) -> FileBatchResult:
+        """Processes the given files with their stages overlapped.
+
+        While a file is run through the tools in a background thread, the next
+        file is copied to the volume and the output of the previous one is
+        handled. Outputs are handled in the order of the files. Every file in
+        flight is staged in its own execution sub directory, the source,
+        destination and tools are pointed to it for their stage. The tools are
+        run on an execution service of their own, with the thread local state
+        of the calling thread.
+
+        Args:
+            file_batch (list[tuple[int, FileHash]]): Files to process along with
+                their 1-based position in the execution
+            total_files (int): Total number of files in the execution
+
+        Returns:
+            FileBatchResult: Count of successful and failed files
+        """
+        batch_result = FileBatchResult()
+        file_paths = [file_hash.file_path for _, file_hash in file_batch]
+        base_sub_dir = execution_service.execution_sub_dir
+        slot_dirs = [
+            os.path.join(
+                base_sub_dir or "", f"{FilePipelineConstants.SLOT_DIR_PREFIX}{slot}"
+            )
+            for slot in range(1, FilePipelineConstants.DEPTH + 1)
+        ]
+        tool_queue: Queue[Optional[StagedFile]] = Queue(maxsize=1)
+        output_queue: Queue[tuple[StagedFile, Optional[str], Optional[Exception]]] = (
+            Queue()
+        )
+        stop_event = threading.Event()
+        # Built here since the tool stage is pointed to a different sub
+        # directory than the one the output stage handles
+        tool_execution_service = WorkflowExecutionServiceHelper(
+            organization_id=execution_service.organization_id,
+            workflow=workflow,
+            tool_instances=[],
+            pipeline_id=execution_service.pipeline_id,
+            workflow_execution=execution_service.get_execution_instance(),
+            execution_sub_dir=base_sub_dir,
+            execution_plan=execution_service.tool_instances,
+        )
+        tool_execution_service.build_workflow()
+        state = StateStore.get_all()
+
+        def run_tool_stage() -> None:
+            StateStore.set_all(state)
+            try:
+                run_tools()
+            finally:
+                # Connections opened by this thread are not closed otherwise
+                connection.close()
+
+        def run_tools() -> None:
+            while True:
+                staged_file = tool_queue.get()
+                if staged_file is None:
+                    return
+                error: Optional[str] = None
+                stage_error: Optional[Exception] = None
+                if stop_event.is_set():
+                    stage_error = StopExecution("Execution stopped")
+                else:
+                    tool_execution_service.set_execution_sub_dir(staged_file.sub_dir)
+                    try:
+                        error = WorkflowHelper._run_tools_for_file(
+                            current_file_idx=staged_file.file_number,
+                            total_files=total_files,
+                            input_file=staged_file.file_hash.file_path,
+                            file_name=staged_file.file_name,
+                            execution_service=tool_execution_service,
+                            single_step=False,
+                            file_hash=staged_file.file_hash,
+                        )
+                    except Exception as e:
+                        stage_error = e
+                        if isinstance(e, StopExecution):
+                            stop_event.set()
+                output_queue.put((staged_file, error, stage_error))
+
+        def handle_output_stage() -> None:
+            staged_file, error, stage_error = output_queue.get()
+            if isinstance(stage_error, StopExecution):
+                if not batch_result.stopped:
+                    execution_service.update_execution(
+                        ExecutionStatus.STOPPED, error=str(stage_error)
+                    )
+                batch_result.stopped = True
+                return
+            try:
+                if stage_error:
+                    raise stage_error
+                destination.set_execution_sub_dir(staged_file.sub_dir)
+                WorkflowHelper._handle_file_output(
+                    file_name=staged_file.file_name,
+                    input_file=staged_file.file_hash.file_path,
+                    workflow=workflow,
+                    destination=destination,
+                    execution_service=execution_service,
+                    file_hash=staged_file.file_hash,
+                    error=error,
+                )
+                if error:
+                    batch_result.failed_files += 1
+                else:
+                    batch_result.successful_files += 1
+            except Exception as e:
+                batch_result.failed_files += 1
+                batch_result.error = (
+                    f"Error processing file '{staged_file.file_hash.file_path}'. {e}"
+                )
+                logger.error(batch_result.error, stack_info=True, exc_info=True)
+                execution_service.publish_log(
+                    message=batch_result.error, level=LogLevel.ERROR
+                )
+
+        tool_stage = threading.Thread(
+            target=run_tool_stage, name="workflow-tool-stage", daemon=True
+        )
+        tool_stage.start()
+        files_in_flight = 0
+        staged_files = 0
+        try:
+            for index, (file_number, file_hash) in enumerate(file_batch, start=1):
+                if files_in_flight >= FilePipelineConstants.DEPTH:
+                    handle_output_stage()
+                    files_in_flight -= 1
+                if batch_result.stopped:
+                    break
+                source.prefetch_files(file_paths[index:])
+                # Slot of the file staged DEPTH files earlier, which is done by now
+                sub_dir = slot_dirs[staged_files % FilePipelineConstants.DEPTH]
+                source.set_execution_sub_dir(sub_dir)
+                try:
+                    file_name = source.add_file_to_volume(
+                        input_file_path=file_hash.file_path, file_hash=file_hash
+                    )
+                except Exception as e:
+                    batch_result.failed_files += 1
+                    batch_result.error = (
+                        f"Error processing file '{file_hash.file_path}'. {e}"
+                    )
+                    logger.error(batch_result.error, stack_info=True, exc_info=True)
+                    execution_service.publish_log(
+                        message=batch_result.error, level=LogLevel.ERROR
+                    )
+                    continue
+                tool_queue.put(StagedFile(file_number, file_hash, file_name, sub_dir))
+                files_in_flight += 1
+                staged_files += 1
+            while files_in_flight and not batch_result.stopped:
+                handle_output_stage()
+                files_in_flight -= 1
+        finally:
+            stop_event.set()
+            tool_queue.put(None)
+            tool_stage.join()
+            source.set_execution_sub_dir(base_sub_dir)
+            destination.set_execution_sub_dir(base_sub_dir)
+        return batch_result
 
     @staticmethod
     def process_file(
@@ -187,10 +511,40 @@ class WorkflowHelper:
         single_step: bool,
         file_hash: FileHash,
     ) -> Optional[str]:
-        error: Optional[str] = None
         file_name = source.add_file_to_volume(
             input_file_path=input_file, file_hash=file_hash
         )
+        error = WorkflowHelper._run_tools_for_file(
+            current_file_idx=current_file_idx,
+            total_files=total_files,
+            input_file=input_file,
+            file_name=file_name,
+            execution_service=execution_service,
+            single_step=single_step,
+            file_hash=file_hash,
+        )
+        WorkflowHelper._handle_file_output(
+            file_name=file_name,
+            input_file=input_file,
+            workflow=workflow,
+            destination=destination,
+            execution_service=execution_service,
+            file_hash=file_hash,
+            error=error,
+        )
+        return error
+
+    @staticmethod
+    def _run_tools_for_file(
+        current_file_idx: int,
+        total_files: int,
+        input_file: str,
+        file_name: str,
+        execution_service: WorkflowExecutionServiceHelper,
+        single_step: bool,
+        file_hash: FileHash,
+    ) -> Optional[str]:
+        error: Optional[str] = None
         try:
             execution_service.initiate_tool_execution(
                 current_file_idx, total_files, file_name, single_step
@@ -209,6 +563,18 @@ class WorkflowHelper:
         except Exception as e:
             error = f"Error processing file '{os.path.basename(input_file)}'. {str(e)}"
             execution_service.publish_log(error, level=LogLevel.ERROR)
+        return error
+
+    @staticmethod
+    def _handle_file_output(
+        file_name: str,
+        input_file: str,
+        workflow: Workflow,
+        destination: DestinationConnector,
+        execution_service: WorkflowExecutionServiceHelper,
+        file_hash: FileHash,
+        error: Optional[str],
+    ) -> None:
         execution_service.publish_update_log(
             LogState.RUNNING,
             f"Processing output for {file_name}",
@@ -226,7 +592,6 @@ class WorkflowHelper:
             f"{file_name}'s output is processed successfully",
             LogComponent.DESTINATION,
         )
-        return error
 
     @staticmethod
     def validate_tool_instances_meta(
@@ -256,7 +621,10 @@ class WorkflowHelper:
             )
         )
 
+        # Settings and adapter permissions are checked on every run, a cached
+        # plan only saves resolving the tools from the registry
         WorkflowHelper.validate_tool_instances_meta(tool_instances=tool_instances)
+        execution_plan = ExecutionPlanCache.get_plan(workflow.id, tool_instances)
         execution_mode = execution_mode or WorkflowExecution.Mode.INSTANT
         execution_service = WorkflowHelper.build_workflow_execution_service(
             organization_id=organization_id,
@@ -267,7 +635,12 @@ class WorkflowHelper:
             scheduled=scheduled,
             execution_mode=execution_mode,
             workflow_execution=workflow_execution,
+            execution_plan=execution_plan,
         )
+        if execution_plan is None:
+            ExecutionPlanCache.set_plan(
+                workflow.id, tool_instances, execution_service.tool_instances
+            )
         execution_id = execution_service.execution_id
         source = SourceConnector(
             organization_id=organization_id,
@@ -284,14 +657,41 @@ class WorkflowHelper:
         source.validate()
         destination.validate()
         # Execution Process
+        is_dispatched = False
         try:
+            input_files, total_files = source.list_files_from_source(
+                hash_values_of_files
+            )
+            execution_service.publish_initial_workflow_logs(total_files)
+            execution_service.update_execution(
+                ExecutionStatus.EXECUTING, increment_attempt=True
+            )
+            batch_count = 1 if single_step else source.get_file_batch_count(total_files)
+            if batch_count > 1:
+                WorkflowHelper.dispatch_file_batches(
+                    workflow=workflow,
+                    execution_service=execution_service,
+                    input_files=input_files,
+                    total_files=total_files,
+                    batch_count=batch_count,
+                )
+                is_dispatched = True
+                workflow_execution = execution_service.get_execution_instance()
+                return ExecutionResponse(
+                    str(workflow.id),
+                    str(workflow_execution.id),
+                    workflow_execution.status,
+                    log_id=str(execution_service.execution_log_id),
+                    mode=workflow_execution.execution_mode,
+                )
             workflow_execution = WorkflowHelper.process_input_files(
                 workflow,
                 source,
                 destination,
                 execution_service,
                 single_step=single_step,
-                hash_values_of_files=hash_values_of_files,
+                input_files=input_files,
+                total_files=total_files,
             )
             WorkflowHelper._update_pipeline_status(
                 pipeline_id=pipeline_id, workflow_execution=workflow_execution
@@ -316,7 +716,11 @@ class WorkflowHelper:
             )
             raise
         finally:
-            destination.delete_execution_directory()
+            source.shutdown_prefetch()
+            # Batches clean up after themselves, the execution directory is
+            # removed by `complete_file_batches()` once all of them are done
+            if not is_dispatched:
+                destination.delete_execution_directory()
 
     @staticmethod
     def _update_pipeline_status(
@@ -383,6 +787,154 @@ class WorkflowHelper:
             result=task.result,
         )
 
+    @staticmethod
+    def enqueue_workflow_execution(
+        workflow_id: str,
+        execution_id: str,
+        hash_values_of_files: dict[str, FileHash],
+        pipeline_id: Optional[str] = None,
+        queue: Optional[str] = None,
+    ) -> AsyncResult:
+        """Adds a workflow to the queue for execution without waiting for it.
+
+        It's waited on with `wait_for_execution()`, after which
+        `get_execution_response()` returns its outcome.
+
+        Args:
+            workflow_id (str): workflowId
+            execution_id (str): Execution ID
+            hash_values_of_files (dict[str, FileHash]): Files to process
+            pipeline_id (Optional[str], optional): Optional pipeline. Defaults to None.
+            queue (Optional[str]): Name of the celery queue to push into
+
+        Returns:
+            AsyncResult: Result of the enqueued task
+        """
+        file_hash_in_str = {
+            key: value.to_json() for key, value in hash_values_of_files.items()
+        }
+        org_schema = UserContext.get_organization_identifier()
+        log_events_id = StateStore.get(Common.LOG_EVENTS_ID)
+        async_execution = WorkflowHelper.execute_bin.apply_async(
+            args=[
+                org_schema,  # schema_name
+                workflow_id,  # workflow_id
+                execution_id,  # execution_id
+                file_hash_in_str,  # hash_values_of_files
+            ],
+            kwargs={
+                "scheduled": False,
+                "execution_mode": None,
+                "pipeline_id": pipeline_id,
+                "log_events_id": log_events_id,
+            },
+            queue=queue,
+        )
+        logger.info(
+            f"Job '{async_execution}' has been enqueued for "
+            f"execution_id '{execution_id}'"
+        )
+        return async_execution
+
+    @staticmethod
+    def get_execution_response(
+        workflow_id: str,
+        execution_id: str,
+        async_result: AsyncResult,
+        timed_out: bool = False,
+    ) -> ExecutionResponse:
+        """Builds the response of an execution enqueued by
+        `enqueue_workflow_execution()`.
+
+        Args:
+            workflow_id (str): workflowId
+            execution_id (str): Execution ID
+            async_result (AsyncResult): Result of the enqueued task
+            timed_out (bool): Whether the caller stopped waiting before the
+                execution completed. Defaults to False
+
+        Returns:
+            ExecutionResponse: Existing status of execution
+        """
+        if timed_out:
+            return ExecutionResponse(
+                workflow_id,
+                execution_id,
+                async_result.status,
+                message=WorkflowMessages.CELERY_TIMEOUT_MESSAGE,
+            )
+        task = AsyncResultData(async_result=async_result)
+        celery_result = task.to_dict()
+        task_result = celery_result.get("result")
+        workflow_execution = WorkflowExecution.objects.get(id=execution_id)
+        return ExecutionResponse(
+            workflow_id,
+            execution_id,
+            workflow_execution.status,
+            result=task_result,
+        )
+
+    @staticmethod
+    def wait_for_execution(execution_id: str, timeout: int) -> bool:
+        """Waits for an execution enqueued by `enqueue_workflow_execution()`
+        to complete.
+
+        The execution's status is checked periodically as well, in case its
+        completion notification was missed.
+
+        Args:
+            execution_id (str): Execution ID
+            timeout (int): Seconds to wait for completion
+
+        Returns:
+            bool: True if the execution completed
+        """
+        return ExecutionNotifier.wait_for_completion(
+            execution_id,
+            timeout=timeout,
+            is_completed=lambda: WorkflowHelper.is_execution_completed(execution_id),
+        )
+
+    @staticmethod
+    async def wait_for_execution_async(execution_id: str, timeout: int) -> bool:
+        """Waits for an execution enqueued by `enqueue_workflow_execution()`
+        to complete without blocking a thread, see `wait_for_execution()`.
+
+        Args:
+            execution_id (str): Execution ID
+            timeout (int): Seconds to wait for completion
+
+        Returns:
+            bool: True if the execution completed
+        """
+        is_execution_completed = sync_to_async(WorkflowHelper.is_execution_completed)
+        return await ExecutionNotifier.wait_for_completion_async(
+            execution_id,
+            timeout=timeout,
+            is_completed=lambda: is_execution_completed(execution_id),
+        )
+
+    @staticmethod
+    def is_execution_completed(execution_id: str) -> bool:
+        """Checks if an execution ended, going by its status.
+
+        Args:
+            execution_id (str): Execution ID
+
+        Returns:
+            bool: True if the execution completed, stopped or failed
+        """
+        execution_status = (
+            WorkflowExecution.objects.filter(id=execution_id)
+            .values_list("status", flat=True)
+            .first()
+        )
+        return execution_status in [
+            ExecutionStatus.COMPLETED.value,
+            ExecutionStatus.STOPPED.value,
+            ExecutionStatus.ERROR.value,
+        ]
+
     @staticmethod
     def execute_workflow_async(
         workflow_id: str,
@@ -397,59 +949,26 @@ class WorkflowHelper:
         Args:
             workflow_id (str): workflowId
             execution_id (str): Execution ID
-            timeout (int):  Celery timeout (timeout -1 : async execution)
+            timeout (int):  Seconds to wait for completion (-1 : async execution)
             pipeline_id (Optional[str], optional): Optional pipeline. Defaults to None.
+            queue (Optional[str]): Name of the celery queue to push into
 
         Returns:
             ExecutionResponse: Existing status of execution
         """
         try:
-            file_hash_in_str = {
-                key: value.to_json() for key, value in hash_values_of_files.items()
-            }
-            org_schema = UserContext.get_organization_identifier()
-            log_events_id = StateStore.get(Common.LOG_EVENTS_ID)
-            async_execution = WorkflowHelper.execute_bin.apply_async(
-                args=[
-                    org_schema,  # schema_name
-                    workflow_id,  # workflow_id
-                    execution_id,  # execution_id
-                    file_hash_in_str,  # hash_values_of_files
-                ],
-                kwargs={
-                    "scheduled": False,
-                    "execution_mode": None,
-                    "pipeline_id": pipeline_id,
-                    "log_events_id": log_events_id,
-                },
+            async_execution = WorkflowHelper.enqueue_workflow_execution(
+                workflow_id=workflow_id,
+                execution_id=execution_id,
+                hash_values_of_files=hash_values_of_files,
+                pipeline_id=pipeline_id,
                 queue=queue,
             )
-            logger.info(
-                f"Job '{async_execution}' has been enqueued for "
-                f"execution_id '{execution_id}'"
-            )
-            if timeout > -1:
-                async_execution.wait(
-                    timeout=timeout,
-                    interval=CeleryConfigurations.INTERVAL,
-                )
-            task = AsyncResultData(async_result=async_execution)
-            celery_result = task.to_dict()
-            task_result = celery_result.get("result")
-            workflow_execution = WorkflowExecution.objects.get(id=execution_id)
-            execution_response = ExecutionResponse(
-                workflow_id,
-                execution_id,
-                workflow_execution.status,
-                result=task_result,
+            timed_out = timeout > -1 and not WorkflowHelper.wait_for_execution(
+                execution_id, timeout=timeout
             )
-            return execution_response
-        except celery_exceptions.TimeoutError:
-            return ExecutionResponse(
-                workflow_id,
-                execution_id,
-                async_execution.status,
-                message=WorkflowMessages.CELERY_TIMEOUT_MESSAGE,
+            return WorkflowHelper.get_execution_response(
+                workflow_id, execution_id, async_execution, timed_out=timed_out
             )
         except Exception as error:
             WorkflowExecutionServiceHelper.update_execution_err(
@@ -596,6 +1115,165 @@ class WorkflowHelper:
             raise
         return execution_response.result
 
+    @staticmethod
+    @shared_task(name="async_execute_file_batch", acks_late=True)
+    def execute_file_batch(
+        schema_name: str,
+        workflow_id: str,
+        execution_id: str,
+        batch_id: str,
+        file_batch: list[tuple[int, dict[str, Any]]],
+        total_files: int,
+        pipeline_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Processes a batch of files of an execution dispatched by
+        `dispatch_file_batches()`.
+
+        Args:
+            schema_name (str): schema name to get Data
+            workflow_id (str): Workflow Id
+            execution_id (str): Id of the execution
+            batch_id (str): Id of the batch, names its execution sub directory
+            file_batch (list[tuple[int, dict[str, Any]]]): Serialized FileHash
+                of the files along with their position in the execution
+            total_files (int): Total number of files in the execution
+            pipeline_id (Optional[str], optional): Id of pipeline. Defaults to None
+
+        Returns:
+            dict[str, Any]: Serialized FileBatchResult of the batch
+        """
+        numbered_files = [
+            (file_number, FileHash.from_json(file_hash))
+            for file_number, file_hash in file_batch
+        ]
+        # Set organization in state store for execution
+        StateStore.set(Account.ORGANIZATION_ID, schema_name)
+        try:
+            batch_result = WorkflowHelper._run_file_batch(
+                organization_id=schema_name,
+                workflow_id=workflow_id,
+                execution_id=execution_id,
+                batch_id=batch_id,
+                file_batch=numbered_files,
+                total_files=total_files,
+                pipeline_id=pipeline_id,
+            )
+        except Exception as error:
+            # Failing the task would prevent the chord callback from running
+            logger.error(
+                f"Error executing {batch_id} of execution {execution_id}: "
+                f"{traceback.format_exc()}"
+            )
+            batch_result = FileBatchResult(
+                failed_files=len(numbered_files), error=str(error)
+            )
+        return batch_result.to_dict()
+
+    @staticmethod
+    def _run_file_batch(
+        organization_id: str,
+        workflow_id: str,
+        execution_id: str,
+        batch_id: str,
+        file_batch: list[tuple[int, FileHash]],
+        total_files: int,
+        pipeline_id: Optional[str] = None,
+    ) -> FileBatchResult:
+        workflow = Workflow.objects.get(id=workflow_id)
+        workflow_execution = WorkflowExecution.objects.get(pk=execution_id)
+        tool_instances: list[ToolInstance] = (
+            ToolInstanceHelper.get_tool_instances_by_workflow(
+                workflow.id, ToolInstanceKey.STEP
+            )
+        )
+        execution_service = WorkflowExecutionServiceHelper(
+            organization_id=organization_id,
+            workflow=workflow,
+            tool_instances=tool_instances,
+            pipeline_id=pipeline_id,
+            workflow_execution=workflow_execution,
+            execution_sub_dir=batch_id,
+            execution_plan=ExecutionPlanCache.get_plan(workflow.id, tool_instances),
+        )
+        # Execution is already built and running, only its tools are set up
+        execution_service.build_workflow()
+        source = SourceConnector(
+            organization_id=organization_id,
+            workflow=workflow,
+            execution_id=execution_id,
+            execution_service=execution_service,
+            execution_sub_dir=batch_id,
+        )
+        destination = DestinationConnector(
+            workflow=workflow,
+            execution_id=execution_id,
+            execution_service=execution_service,
+            execution_sub_dir=batch_id,
+        )
+        try:
+            return WorkflowHelper.process_file_batch(
+                workflow=workflow,
+                source=source,
+                destination=destination,
+                execution_service=execution_service,
+                file_batch=file_batch,
+                total_files=total_files,
+                single_step=False,
+            )
+        finally:
+            source.shutdown_prefetch()
+            destination.delete_execution_directory()
+
+    @staticmethod
+    @shared_task(name="async_complete_file_batches", acks_late=True)
+    def complete_file_batches(
+        batch_results: list[dict[str, Any]],
+        schema_name: str,
+        workflow_id: str,
+        execution_id: str,
+        total_files: int,
+        pipeline_id: Optional[str] = None,
+    ) -> None:
+        """Chord callback of `dispatch_file_batches()`, aggregates the results
+        of all batches into the execution.
+
+        Args:
+            batch_results (list[dict[str, Any]]): Serialized FileBatchResult of
+                each batch
+            schema_name (str): schema name to get Data
+            workflow_id (str): Workflow Id
+            execution_id (str): Id of the execution
+            total_files (int): Total number of files in the execution
+            pipeline_id (Optional[str], optional): Id of pipeline. Defaults to None
+        """
+        # Set organization in state store for execution
+        StateStore.set(Account.ORGANIZATION_ID, schema_name)
+        workflow = Workflow.objects.get(id=workflow_id)
+        execution_service = WorkflowExecutionServiceHelper(
+            organization_id=schema_name,
+            workflow=workflow,
+            tool_instances=[],
+            pipeline_id=pipeline_id,
+            workflow_execution=WorkflowExecution.objects.get(pk=execution_id),
+        )
+        destination = DestinationConnector(
+            workflow=workflow,
+            execution_id=execution_id,
+            execution_service=execution_service,
+        )
+        try:
+            WorkflowHelper._complete_file_processing(
+                execution_service,
+                total_files,
+                [FileBatchResult.from_dict(result) for result in batch_results],
+            )
+        finally:
+            destination.delete_execution_directory()
+        WorkflowHelper._update_pipeline_status(
+            pipeline_id=pipeline_id,
+            workflow_execution=execution_service.get_execution_instance(),
+        )
+
     @staticmethod
     def complete_execution(
         workflow: Workflow,
@@ -908,3 +1586,24 @@ class WorkflowSchemaHelper:
         with open(schema_path, encoding="utf-8") as file:
             schema = json.load(file)
         return schema  # type: ignore
+
+
+@task_postrun.connect
+def notify_execution_completion(
+    task_id: str,
+    task: Any,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    state: Optional[str] = None,
+    **_: Any,
+) -> None:
+    """Notifies callers waiting on an execution through `ExecutionNotifier`
+    once its task is done.
+
+    Runs after the task result is stored in the result backend, so that it
+    can be read as soon as the notification is received.
+    """
+    if task.name != WorkflowHelper.execute_bin.name or state == states.RETRY:
+        return
+    execution_id = kwargs.get("execution_id") or args[2]
+    ExecutionNotifier.notify_completion(str(execution_id), status=str(state))
@@ -390,7 +390,7 @@ function PromptCard({
         handleIsRunLoading(selectedDoc?.document_id, profile?.profile_id, true);
 
         const startTime = Date.now();
-        handleRunApiRequest(docId, profile?.profile_id)
+        handleRunApiRequest(docId, profile?.profile_id, true)
           .then((res) => {
             const data = res?.data || [];
             const value = data[0]?.output;
@@ -440,7 +440,7 @@ function PromptCard({
         null
       );
       const startTime = Date.now();
-      handleRunApiRequest(docId, profileManagerId)
+      handleRunApiRequest(docId, profileManagerId, true)
         .then((res) => {
           const data = res?.data || [];
           const value = data[0]?.output;
@@ -614,7 +614,13 @@ function PromptCard({
     });
   };
 
-  const handleRunApiRequest = async (docId, profileManagerId) => {
+  // Prompts run on the selected document are answered again, while the other
+  // documents covered by the run can use cached answers
+  const handleRunApiRequest = async (
+    docId,
+    profileManagerId,
+    forceRun = false
+  ) => {
     const promptId = promptDetailsState?.prompt_id;
     const runId = generateUUID();
     const maxWaitTime = 30 * 1000; // 30 seconds
@@ -630,6 +636,7 @@ function PromptCard({
       let url = `/api/v1/unstract/${sessionDetails?.orgId}/prompt-studio/fetch_response/${details?.tool_id}`;
       if (!isSimplePromptStudio) {
         body["run_id"] = runId;
+        body["force_run"] = forceRun;
       } else {
         body["sps_id"] = details?.tool_id;
         url = promptRunApiSps;
@@ -0,0 +1,186 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar
+
+from redis.exceptions import RedisError
+from unstract.prompt_service.config import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+AdapterT = TypeVar("AdapterT")
+
+
+@dataclass
+class CachedAdapter:
+    adapter: Any
+    version: str
+    expires_at: float
+    close: Optional[Callable[[Any], None]] = None
+    # Prompts using the adapter, it's closed once evicted and unused
+    users: int = 0
+    evicted: bool = False
+
+    def release(self) -> None:
+        if not self.close:
+            return
+        try:
+            self.close(self.adapter)
+        except Exception as e:
+            logger.warning(f"Failed to close cached adapter: {e}")
+
+
+class AdapterCache:
+    """Initialized adapters shared by the prompts and requests of a process.
+
+    Creating an adapter fetches and decrypts its config from the platform
+    service and opens new clients, so adapters are created once per platform
+    key, adapter instance and config version, and reused for `ttl` seconds.
+    The backend bumps the config version of an adapter instance in Redis
+    whenever it's edited or deleted, dropping the adapters created from the
+    old config. The least recently used entries are dropped beyond
+    `max_size` adapters.
+
+    Adapters record usage with the kwargs they're created with, so they're
+    cached per run. Expired adapters are swept on every use, closing the
+    clients of runs that are over instead of keeping them until evicted.
+    """
+
+    # Same key as the one bumped by the backend on adapter changes
+    VERSION_KEY_PREFIX = "adapter_config_version:"
+
+    def __init__(self, ttl: int, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._adapters: OrderedDict[tuple[Any, ...], CachedAdapter] = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = get_redis_client()
+
+    @staticmethod
+    def from_env() -> Optional["AdapterCache"]:
+        """Creates the cache unless disabled with `ADAPTER_CACHE_TTL`."""
+        ttl = int(os.environ.get("ADAPTER_CACHE_TTL", 300))
+        if ttl < 1:
+            return None
+        return AdapterCache(
+            ttl=ttl, max_size=int(os.environ.get("ADAPTER_CACHE_SIZE", 128))
+        )
+
+    @contextmanager
+    def use(
+        self,
+        platform_key: str,
+        adapter_instance_id: str,
+        scope: tuple[Any, ...],
+        create: Callable[[], AdapterT],
+        close: Optional[Callable[[AdapterT], None]] = None,
+    ) -> Iterator[AdapterT]:
+        """Gets a cached adapter, creating it on a miss.
+
+        Adapters evicted while in use are closed once their last user is
+        done with them.
+
+        Args:
+            platform_key (str): Platform key of the request, identifies the
+                organization of the adapter
+            adapter_instance_id (str): ID of the adapter instance
+            scope (tuple[Any, ...]): Anything else the adapter is created
+                with, e.g. its kind and usage kwargs
+            create (Callable[[], AdapterT]): Creates the adapter
+            close (Optional[Callable[[AdapterT], None]]): Releases the
+                clients of an adapter dropped from the cache
+
+        Yields:
+            Iterator[AdapterT]: Adapter to use within the context
+        """
+        key = (platform_key, adapter_instance_id, *scope)
+        version = self.get_version(adapter_instance_id)
+        unused: list[CachedAdapter] = []
+        with self._lock:
+            unused.extend(self._evict_expired())
+            cached = self._adapters.get(key)
+            if cached and cached.version != version:
+                unused.extend(self._evict(key))
+                cached = None
+            if cached:
+                self._adapters.move_to_end(key)
+                cached.users += 1
+        if not cached:
+            logger.debug(f"Creating adapter {adapter_instance_id} for {scope}")
+            cached = CachedAdapter(
+                adapter=create(),
+                version=version,
+                expires_at=time.monotonic() + self.ttl,
+                close=close,
+                users=1,
+            )
+            with self._lock:
+                # Another prompt might have created it meanwhile
+                if key in self._adapters:
+                    unused.extend(self._evict(key))
+                self._adapters[key] = cached
+                while len(self._adapters) > self.max_size:
+                    unused.extend(self._evict(next(iter(self._adapters))))
+        for adapter in unused:
+            adapter.release()
+        try:
+            yield cached.adapter
+        finally:
+            with self._lock:
+                cached.users -= 1
+                is_released = cached.evicted and not cached.users
+            if is_released:
+                cached.release()
+
+    def get_version(self, adapter_instance_id: str) -> str:
+        """Gets the config version of an adapter instance, bumped by the
+        backend when it's edited.
+
+        Args:
+            adapter_instance_id (str): ID of the adapter instance
+
+        Returns:
+            str: Version of the config, empty if it was never changed or can't
+                be read, in which case only the TTL expires the adapter
+        """
+        if not self._redis:
+            return ""
+        try:
+            version = self._redis.get(f"{self.VERSION_KEY_PREFIX}{adapter_instance_id}")
+        except RedisError as e:
+            logger.warning(
+                f"Unable to read version of adapter {adapter_instance_id}: {e}"
+            )
+            return ""
+        return version.decode("utf-8") if version else ""
+
+    def _evict_expired(self) -> list[CachedAdapter]:
+        """Drops the expired adapters, called with the lock held.
+
+        Returns:
+            list[CachedAdapter]: Expired adapters that can be closed right away
+        """
+        now = time.monotonic()
+        expired = [
+            key for key, cached in self._adapters.items() if cached.expires_at < now
+        ]
+        unused: list[CachedAdapter] = []
+        for key in expired:
+            unused.extend(self._evict(key))
+        return unused
+
+    def _evict(self, key: tuple[Any, ...]) -> list[CachedAdapter]:
+        """Drops an adapter, called with the lock held.
+
+        Returns:
+            list[CachedAdapter]: The adapter if it's unused and can be closed
+                right away, otherwise its last user closes it
+        """
+        cached = self._adapters.pop(key)
+        cached.evicted = True
+        return [] if cached.users else [cached]
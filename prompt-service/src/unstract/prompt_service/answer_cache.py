@@ -0,0 +1,141 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+from unstract.prompt_service.adapter_cache import AdapterCache
+from unstract.prompt_service.config import get_redis_client
+from unstract.prompt_service.constants import PromptServiceContants as PSKeys
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerCache:
+    """Answers of prompts by a hash of everything they are answered from.
+
+    The key covers the indexed document, the prompt after its variables are
+    replaced, its settings and adapters along with their config versions,
+    and the tool settings. A prompt run again with nothing changed gets its
+    previous answer without calling the LLM, while changed prompts and
+    prompts depending on changed answers are answered again. Entries expire
+    after `ttl` seconds.
+    """
+
+    CACHE_PREFIX = "prompt_answer:"
+
+    def __init__(self, ttl: int) -> None:
+        self.ttl = ttl
+        self._redis = get_redis_client()
+
+    @staticmethod
+    def from_env() -> Optional["AnswerCache"]:
+        """Creates the cache unless disabled with `ANSWER_CACHE_TTL`."""
+        ttl = int(os.environ.get("ANSWER_CACHE_TTL", 86400))
+        if ttl < 1:
+            return None
+        return AnswerCache(ttl=ttl)
+
+    @staticmethod
+    def is_enabled_for(tool_settings: dict[str, Any], output: dict[str, Any]) -> bool:
+        """Checks if answers of a prompt can be cached.
+
+        Tools can opt out with `enable_answer_cache`. Table and record prompts
+        are answered by plugins and evaluated prompts get results besides
+        their answer, so neither is cached.
+        """
+        if not tool_settings.get(PSKeys.ENABLE_ANSWER_CACHE, True):
+            return False
+        if output[PSKeys.TYPE] in {PSKeys.TABLE, PSKeys.RECORD}:
+            return False
+        eval_settings = output.get(PSKeys.EVAL_SETTINGS) or {}
+        return not eval_settings.get(PSKeys.EVAL_SETTINGS_EVALUATE)
+
+    def get_cache_key(
+        self, doc_id: str, output: dict[str, Any], tool_settings: dict[str, Any]
+    ) -> str:
+        """Hashes the inputs of a prompt into a cache key.
+
+        Args:
+            doc_id (str): ID of the indexed document
+            output (dict[str, Any]): Prompt with `promptx` replaced
+            tool_settings (dict[str, Any]): Settings of the tool
+
+        Returns:
+            str: Cache key
+        """
+        inputs = {
+            "doc_id": doc_id,
+            PSKeys.OUTPUTS: output,
+            PSKeys.TOOL_SETTINGS: tool_settings,
+            "adapter_versions": self._get_adapter_versions(output, tool_settings),
+        }
+        canonical = json.dumps(inputs, sort_keys=True, default=str)
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{self.CACHE_PREFIX}{digest}"
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Gets a cached answer.
+
+        Returns:
+            Optional[dict[str, Any]]: Answer and the prompt's metadata, None on
+                a miss
+        """
+        if not self._redis:
+            return None
+        try:
+            cached = self._redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Unable to read cached answer: {e}")
+            return None
+        if not cached:
+            return None
+        try:
+            answer: dict[str, Any] = json.loads(cached)
+        except ValueError:
+            return None
+        return answer
+
+    def set(self, key: str, answer: dict[str, Any]) -> None:
+        if not self._redis:
+            return
+        try:
+            self._redis.set(key, json.dumps(answer, default=str), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Unable to cache answer: {e}")
+
+    def _get_adapter_versions(
+        self, output: dict[str, Any], tool_settings: dict[str, Any]
+    ) -> dict[str, str]:
+        """Gets the config versions of the prompt's adapters, bumped by the
+        backend when they're edited."""
+        adapter_instance_ids = sorted(
+            {
+                str(adapter_instance_id)
+                for adapter_instance_id in (
+                    output.get(PSKeys.LLM),
+                    output.get(PSKeys.EMBEDDING),
+                    output.get(PSKeys.VECTOR_DB),
+                    output.get(PSKeys.X2TEXT_ADAPTER),
+                    tool_settings.get(PSKeys.CHALLENGE_LLM),
+                )
+                if adapter_instance_id
+            }
+        )
+        if not self._redis or not adapter_instance_ids:
+            return {}
+        try:
+            versions = self._redis.mget(
+                [
+                    f"{AdapterCache.VERSION_KEY_PREFIX}{adapter_instance_id}"
+                    for adapter_instance_id in adapter_instance_ids
+                ]
+            )
+        except RedisError as e:
+            logger.warning(f"Unable to read versions of adapters: {e}")
+            return {}
+        return {
+            adapter_instance_id: version.decode("utf-8") if version else ""
+            for adapter_instance_id, version in zip(adapter_instance_ids, versions)
+        }
@@ -0,0 +1,101 @@
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from flask import json
+from unstract.prompt_service.constants import PromptServiceContants as PSKeys
+from unstract.prompt_service.exceptions import APIError
+
+
+class AnswerStream:
+    """Answers of a request streamed as newline delimited JSON.
+
+    Each prompt is written as an `answer` frame with its output and metadata
+    as soon as it's answered, in the order prompts finish. The response
+    otherwise returned for the request follows as a `result` frame, with
+    the usage of the run in its metadata, or an `error` frame if the request
+    failed.
+    """
+
+    MIMETYPE = "application/x-ndjson"
+    # Types of frames
+    ANSWER = "answer"
+    RESULT = "result"
+    ERROR = "error"
+
+    def __init__(self) -> None:
+        # Frames to write, errors of the request are logged before they're
+        # written and None ends the stream
+        self._frames: queue.Queue[Any] = queue.Queue()
+
+    def put_answer(
+        self, prompt_key: str, output: dict[str, Any], metadata: dict[str, Any]
+    ) -> None:
+        """Writes the answer of a prompt.
+
+        Args:
+            prompt_key (str): Name of the prompt
+            output (dict[str, Any]): Structured output of the prompt, along
+                with its evaluation if any
+            metadata (dict[str, Any]): Metadata of the prompt, shaped like
+                the metadata of the request
+        """
+        self._frames.put(
+            {
+                PSKeys.TYPE: self.ANSWER,
+                PSKeys.PROMPT_KEY: prompt_key,
+                PSKeys.OUTPUT: output,
+                PSKeys.METADATA: metadata,
+            }
+        )
+
+    def stream(
+        self,
+        answer_prompts: Callable[[], Any],
+        log_error: Callable[[Exception], None],
+    ) -> Iterator[str]:
+        """Answers the prompts on another thread, writing frames as they're
+        put.
+
+        Args:
+            answer_prompts (Callable[[], Any]): Answers the prompts, returns
+                the response of the request
+            log_error (Callable[[Exception], None]): Logs an error of the
+                request, called within the request context
+
+        Yields:
+            Iterator[str]: Lines of JSON
+        """
+
+        def produce() -> None:
+            try:
+                self._frames.put(self._get_result_frame(answer_prompts()))
+            except Exception as e:
+                self._frames.put(e)
+            self._frames.put(None)
+
+        threading.Thread(target=produce, name="answer-stream", daemon=True).start()
+        while True:
+            frame = self._frames.get()
+            if frame is None:
+                return
+            if isinstance(frame, Exception):
+                log_error(frame)
+                frame = self._get_error_frame(frame)
+            yield json.dumps(frame) + "\n"
+
+    def _get_result_frame(self, response: Any) -> dict[str, Any]:
+        if isinstance(response, Exception):
+            return self._get_error_frame(response)
+        return {
+            PSKeys.TYPE: self.RESULT,
+            PSKeys.OUTPUT: response[PSKeys.OUTPUT],
+            PSKeys.METADATA: response[PSKeys.METADATA],
+        }
+
+    @staticmethod
+    def _get_error_frame(error: Exception) -> dict[str, Any]:
+        if not isinstance(error, APIError):
+            error = APIError()
+        return {PSKeys.TYPE: AnswerStream.ERROR, **error.to_dict()}
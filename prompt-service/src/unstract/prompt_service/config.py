@@ -1,10 +1,12 @@
 import logging
 from logging.config import dictConfig
 from os import environ as env
+from typing import Optional
 
 from dotenv import load_dotenv
 from flask import Flask
 from peewee import PostgresqlDatabase
+from redis import Redis
 from unstract.prompt_service.constants import LogLevel
 
 load_dotenv()
@@ -38,6 +40,26 @@ def get_env_or_die(env_key: str) -> str:
     return env_value
 
 
+def get_redis_client() -> Optional[Redis]:
+    """Creates a client of the Redis shared with the backend, None if it's
+    not configured."""
+    redis_host = env.get("REDIS_HOST")
+    redis_port = env.get("REDIS_PORT")
+    if not redis_host or not redis_port:
+        logging.getLogger(__name__).warning("REDIS_HOST or REDIS_PORT is not set")
+        return None
+    redis_password = env.get("REDIS_PASSWORD") or None
+    if redis_password and redis_password.lower() == "none":
+        redis_password = None
+    return Redis(
+        host=redis_host,
+        port=int(redis_port),
+        username=env.get("REDIS_USER") or None,
+        password=redis_password,
+        db=int(env.get("REDIS_DB") or 0),
+    )
+
+
 def create_app() -> Flask:
     app = Flask("prompt-service")
     log_level = env.get("LOG_LEVEL", LogLevel.WARN)
@@ -68,6 +68,13 @@ class PromptServiceContants:
     VARIABLE_MAP = "variable_map"
     RECORD = "record"
     TEXT = "text"
+    INDEX_MARKERS = "index_markers"
+    INDEXED_AT = "indexed_at"
+    ENABLE_ANSWER_CACHE = "enable_answer_cache"
+    ANSWER_CACHE_BYPASS_HEADER = "X-Answer-Cache-Bypass"
+    PROMPT_KEY = "prompt_key"
+    EVALUATION_SUFFIX = "__evaluation"
+    QUERY_EMBEDDING_CACHE = "query_embedding_cache"
 
 
 class LogLevel(Enum):
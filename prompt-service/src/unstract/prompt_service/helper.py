@@ -7,6 +7,7 @@ from typing import Any, Optional
 
 from dotenv import load_dotenv
 from flask import Flask, current_app, json
+from llama_index.core.schema import NodeWithScore
 from unstract.prompt_service.authentication_middleware import AuthenticationMiddleware
 from unstract.prompt_service.config import db
 from unstract.prompt_service.constants import DBTableV2, FeatureFlag
@@ -93,6 +94,18 @@ def get_cleaned_context(context: str) -> str:
     return context
 
 
+def merge_nodes(retrieved_nodes: list[list[NodeWithScore]]) -> list[NodeWithScore]:
+    """Merges the nodes retrieved for several queries, keeping the best
+    score of each node and ordering them by score."""
+    nodes: dict[str, NodeWithScore] = {}
+    for node in (node for query_nodes in retrieved_nodes for node in query_nodes):
+        merged = nodes.get(node.node_id)
+        if not merged or (node.score or 0) > (merged.score or 0):
+            nodes[node.node_id] = node
+    # Sorting is stable, nodes with the same score stay in retrieval order
+    return sorted(nodes.values(), key=lambda node: node.score or 0, reverse=True)
+
+
 def initialize_plugin_endpoints(app: Flask) -> None:
     """Enables plugins if available."""
     single_pass_extration_plugin: dict[str, Any] = plugins.get(
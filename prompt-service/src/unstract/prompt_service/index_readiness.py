@@ -0,0 +1,91 @@
+import os
+import time
+from collections.abc import Callable
+from typing import Any, Optional, TypeVar
+
+from flask import current_app
+from unstract.prompt_service.constants import PromptServiceContants as PSKeys
+
+RetrievedT = TypeVar("RetrievedT")
+
+
+class IndexReadiness:
+    """Tells an empty retrieval of a document apart from a vector DB that
+    hasn't caught up with its indexing yet.
+
+    Callers record when each document of a request was indexed in
+    `index_markers`, by doc ID. Empty retrievals are retried with bounded
+    exponential backoff only within `consistency_window` seconds of
+    indexing, while writes could still be in flight. Documents indexed
+    before that are empty and returned right away. Documents without a
+    marker are retried once after `legacy_retry_delay` seconds, as for
+    callers that don't record markers.
+    """
+
+    def __init__(
+        self,
+        index_markers: dict[str, dict[str, Any]],
+        consistency_window: float,
+        initial_delay: float,
+        legacy_retry_delay: float = 2,
+    ) -> None:
+        self.index_markers = index_markers
+        self.consistency_window = consistency_window
+        self.initial_delay = initial_delay
+        self.legacy_retry_delay = legacy_retry_delay
+
+    @staticmethod
+    def from_payload(payload: dict[str, Any]) -> "IndexReadiness":
+        return IndexReadiness(
+            index_markers=payload.get(PSKeys.INDEX_MARKERS) or {},
+            consistency_window=float(
+                os.environ.get("INDEX_CONSISTENCY_WINDOW_SECONDS", 10)
+            ),
+            initial_delay=float(os.environ.get("INDEX_RETRY_INITIAL_DELAY", 0.25)),
+        )
+
+    def retrieve(self, doc_id: str, retrieve: Callable[[], RetrievedT]) -> RetrievedT:
+        """Retrieves from a document, retrying while the retrieval is empty
+        and writes to the index could be in flight.
+
+        Args:
+            doc_id (str): ID of the document in the vector DB
+            retrieve (Callable[[], RetrievedT]): Retrieves from the document
+
+        Returns:
+            RetrievedT: Last result of `retrieve`
+        """
+        retrieved = retrieve()
+        if retrieved:
+            return retrieved
+        indexed_at = self._get_indexed_at(doc_id)
+        if indexed_at is None:
+            # UN-1288 For Pinecone, we are seeing an inconsistent case where
+            # query with doc_id fails even though indexing just happened.
+            # Without knowing when the document was indexed, it's retried once.
+            time.sleep(self.legacy_retry_delay)
+            return retrieve()
+
+        deadline = indexed_at + self.consistency_window
+        delay = self.initial_delay
+        while not retrieved and time.time() < deadline:
+            current_app.logger.info(
+                f"Retrieved nothing from {doc_id} indexed "
+                f"{time.time() - indexed_at:.1f}s ago, retrying in {delay}s"
+            )
+            time.sleep(min(delay, max(0, deadline - time.time())))
+            retrieved = retrieve()
+            delay *= 2
+        return retrieved
+
+    def _get_indexed_at(self, doc_id: str) -> Optional[float]:
+        marker = self.index_markers.get(doc_id)
+        if not isinstance(marker, dict):
+            return None
+        indexed_at = marker.get(PSKeys.INDEXED_AT)
+        if indexed_at is None:
+            return None
+        try:
+            return float(indexed_at)
+        except (TypeError, ValueError):
+            return None
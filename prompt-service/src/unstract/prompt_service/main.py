@@ -1,11 +1,21 @@
-import time
+import copy
+import os
+import threading
 import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from enum import Enum
 from json import JSONDecodeError
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
-from flask import json, jsonify, request
+from flask import Response, json, jsonify, request, stream_with_context
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
 from llama_index.core.vector_stores import ExactMatchFilter, MetadataFilters
+from unstract.prompt_service.adapter_cache import AdapterCache
+from unstract.prompt_service.answer_cache import AnswerCache
+from unstract.prompt_service.answer_stream import AnswerStream
 from unstract.prompt_service.authentication_middleware import AuthenticationMiddleware
 from unstract.prompt_service.config import create_app, db
 from unstract.prompt_service.constants import PromptServiceContants as PSKeys
@@ -16,12 +26,19 @@ from unstract.prompt_service.helper import (
     extract_table,
     extract_variable,
     get_cleaned_context,
+    merge_nodes,
     plugin_loader,
     plugins,
     query_usage_metadata,
     run_completion,
 )
+from unstract.prompt_service.index_readiness import IndexReadiness
+from unstract.prompt_service.prompt_graph import PromptGraph
 from unstract.prompt_service.prompt_ide_base_tool import PromptServiceBaseTool
+from unstract.prompt_service.query_embedding_cache import (
+    QueryEmbeddingCache,
+    QueryEmbeddingUsage,
+)
 from unstract.prompt_service.variable_extractor.base import VariableExtractor
 from unstract.sdk.constants import LogLevel
 from unstract.sdk.embedding import Embedding
@@ -35,6 +52,11 @@ from unstract.core.pubsub_helper import LogPublisher
 
 USE_UNSTRACT_PROMPT = True
 MAX_RETRIES = 3
+# Prompts of a request answered at a time, overall and per LLM adapter
+MAX_PARALLEL_PROMPTS = int(os.environ.get("MAX_PARALLEL_PROMPTS", 4))
+MAX_PARALLEL_PROMPTS_PER_LLM = int(os.environ.get("MAX_PARALLEL_PROMPTS_PER_LLM", 2))
+# Subquestions of a prompt retrieved at a time
+MAX_PARALLEL_RETRIEVALS = int(os.environ.get("MAX_PARALLEL_RETRIEVALS", 8))
 
 NO_CONTEXT_ERROR = (
     "Couldn't fetch context from vector DB. "
@@ -46,6 +68,11 @@ NO_CONTEXT_ERROR = (
 app = create_app()
 # Load plugins
 plugin_loader(app)
+# Prompts run concurrently share the connection of the log publisher
+_publish_lock = threading.Lock()
+adapter_cache = AdapterCache.from_env()
+answer_cache = AnswerCache.from_env()
+query_embedding_cache = QueryEmbeddingCache.from_env()
 
 
 @app.before_request
@@ -79,9 +106,36 @@ def _publish_log(
     state: Enum,
     message: str,
 ) -> None:
-    LogPublisher.publish(
-        log_events_id,
-        LogPublisher.log_prompt(component, level.value, state.value, message),
+    with _publish_lock:
+        LogPublisher.publish(
+            log_events_id,
+            LogPublisher.log_prompt(component, level.value, state.value, message),
+        )
+
+
+def _get_adapter(
+    adapters: ExitStack,
+    platform_key: str,
+    adapter_instance_id: str,
+    scope: tuple[Any, ...],
+    create: Callable[[], Any],
+    close: Optional[Callable[[Any], None]] = None,
+) -> Any:
+    """Gets an adapter from the adapter cache if enabled, released along
+    with `adapters`."""
+    if not adapter_cache:
+        adapter = create()
+        if close:
+            adapters.callback(close, adapter)
+        return adapter
+    return adapters.enter_context(
+        adapter_cache.use(
+            platform_key=platform_key,
+            adapter_instance_id=adapter_instance_id,
+            scope=scope,
+            create=create,
+            close=close,
+        )
     )
 
 
@@ -108,6 +162,57 @@ def prompt_processor() -> Any:
     payload: dict[Any, Any] = request.json
     if not payload:
         raise NoPayloadError
+    # Cached answers are not read, only refreshed, when bypassed
+    bypass_answer_cache = request.headers.get(
+        PSKeys.ANSWER_CACHE_BYPASS_HEADER, ""
+    ).lower() in {"1", "true"}
+    # Answers are streamed to clients accepting NDJSON over JSON
+    is_streamed = (
+        request.accept_mimetypes.best_match(["application/json", AnswerStream.MIMETYPE])
+        == AnswerStream.MIMETYPE
+    )
+    if not is_streamed:
+        return answer_prompts(platform_key, payload, bypass_answer_cache)
+
+    answer_stream = AnswerStream()
+
+    def answer_prompts_in_context() -> Any:
+        try:
+            with app.app_context():
+                return answer_prompts(
+                    platform_key, payload, bypass_answer_cache, answer_stream
+                )
+        finally:
+            if not db.is_closed():
+                db.close()
+
+    return Response(
+        stream_with_context(
+            answer_stream.stream(answer_prompts_in_context, log_error=log_exceptions)
+        ),
+        mimetype=AnswerStream.MIMETYPE,
+    )
+
+
+def answer_prompts(
+    platform_key: str,
+    payload: dict[Any, Any],
+    bypass_answer_cache: bool = False,
+    answer_stream: Optional[AnswerStream] = None,
+) -> Any:
+    """Answers the prompts of a request.
+
+    Args:
+        platform_key (str): Platform key of the request
+        payload (dict[Any, Any]): Prompts to answer and their settings
+        bypass_answer_cache (bool): Answers every prompt again, refreshing
+            the answer cache
+        answer_stream (Optional[AnswerStream]): Stream to write each answer
+            to as soon as its prompt is answered
+
+    Returns:
+        Any: Structured output and metadata of the prompts
+    """
     tool_settings = payload.get(PSKeys.TOOL_SETTINGS, {})
     outputs = payload.get(PSKeys.OUTPUTS, [])
     tool_id: str = payload.get(PSKeys.TOOL_ID, "")
@@ -115,6 +220,10 @@ def prompt_processor() -> Any:
     file_hash = payload.get(PSKeys.FILE_HASH)
     doc_name = str(payload.get(PSKeys.FILE_NAME, ""))
     log_events_id: str = payload.get(PSKeys.LOG_EVENTS_ID, "")
+    index_readiness = IndexReadiness.from_payload(payload)
+    answer_cache_hits: list[str] = []
+    answer_cache_misses: list[str] = []
+    query_embedding_usage = QueryEmbeddingUsage()
     structured_output: dict[str, Any] = {}
     metadata: dict[str, Any] = {
         PSKeys.RUN_ID: run_id,
@@ -132,7 +241,27 @@ def prompt_processor() -> Any:
 
     for output in outputs:  # type:ignore
         variable_names.append(output[PSKeys.NAME])
-    for output in outputs:  # type:ignore
+    # Table and record prompts end the request, later prompts are not run
+    table_index: Optional[int] = next(
+        (
+            index
+            for index, output in enumerate(outputs)
+            if output[PSKeys.TYPE] in {PSKeys.TABLE, PSKeys.RECORD}
+        ),
+        None,
+    )
+    if table_index is not None:
+        outputs = outputs[: table_index + 1]
+
+    def run_prompt(prompt_index: int) -> Optional[Any]:
+        output = outputs[prompt_index]
+        # Answers of the prompts before this one, independent prompts might
+        # still be running
+        answered = {
+            name: structured_output[name]
+            for name in variable_names[:prompt_index]
+            if name in structured_output
+        }
         prompt_name = output[PSKeys.NAME]
         promptx = output[PSKeys.PROMPT]
         chunk_size = output[PSKeys.CHUNK_SIZE]
@@ -172,7 +301,7 @@ def prompt_processor() -> Any:
             # Executed incase of structured tool and
             # APIs where we do not set the variable map
             promptx = VariableExtractor.execute_variable_replacement(
-                prompt=promptx, variable_map=structured_output
+                prompt=promptx, variable_map=answered
             )
             app.logger.info(f"[{tool_id}] Prompt after variable replacement: {promptx}")
             _publish_log(
@@ -206,7 +335,7 @@ def prompt_processor() -> Any:
         # The variables are in the form %variable_name%
 
         output[PSKeys.PROMPTX] = extract_variable(
-            structured_output, variable_names, output, promptx
+            answered, variable_names, output, promptx
         )
 
         doc_id = index.generate_index_key(
@@ -229,30 +358,81 @@ def prompt_processor() -> Any:
             "Retrieved document ID",
         )
 
+        answer_cache_key: Optional[str] = None
+        if answer_cache and AnswerCache.is_enabled_for(tool_settings, output):
+            answer_cache_key = answer_cache.get_cache_key(
+                doc_id=doc_id, output=output, tool_settings=tool_settings
+            )
+            cached_answer = (
+                None if bypass_answer_cache else answer_cache.get(answer_cache_key)
+            )
+            if cached_answer:
+                answer_cache_hits.append(prompt_name)
+                structured_output[prompt_name] = cached_answer[PSKeys.OUTPUT]
+                for key, value in cached_answer[PSKeys.METADATA].items():
+                    metadata.setdefault(key, {})[prompt_name] = value
+                _publish_log(
+                    log_events_id,
+                    {
+                        "tool_id": tool_id,
+                        "prompt_key": prompt_name,
+                        "doc_name": doc_name,
+                    },
+                    LogLevel.DEBUG,
+                    RunLevel.RUN,
+                    "Fetched answer from cache",
+                )
+                return None
+            answer_cache_misses.append(prompt_name)
+
+        # Usage is recorded with the kwargs adapters are created with, so
+        # adapters are shared only by prompts of the same run and closed by
+        # the cache once the run's adapters expire
+        adapters = ExitStack()
         try:
             usage_kwargs = {"run_id": run_id}
             adapter_instance_id = output[PSKeys.LLM]
-            llm = LLM(
-                tool=util,
-                adapter_instance_id=adapter_instance_id,
-                usage_kwargs={
-                    **usage_kwargs,
-                    PSKeys.LLM_USAGE_REASON: PSKeys.EXTRACTION,
-                },
+            llm = _get_adapter(
+                adapters,
+                platform_key,
+                adapter_instance_id,
+                scope=(PSKeys.LLM, run_id, PSKeys.EXTRACTION),
+                create=lambda: LLM(
+                    tool=util,
+                    adapter_instance_id=adapter_instance_id,
+                    usage_kwargs={
+                        **usage_kwargs,
+                        PSKeys.LLM_USAGE_REASON: PSKeys.EXTRACTION,
+                    },
+                ),
             )
 
-            embedding = Embedding(
-                tool=util,
-                adapter_instance_id=output[PSKeys.EMBEDDING],
-                usage_kwargs=usage_kwargs.copy(),
+            embedding = _get_adapter(
+                adapters,
+                platform_key,
+                output[PSKeys.EMBEDDING],
+                scope=(PSKeys.EMBEDDING, run_id),
+                create=lambda: Embedding(
+                    tool=util,
+                    adapter_instance_id=output[PSKeys.EMBEDDING],
+                    usage_kwargs=usage_kwargs.copy(),
+                ),
             )
 
-            vector_db = VectorDB(
-                tool=util,
-                adapter_instance_id=output[PSKeys.VECTOR_DB],
-                embedding=embedding,
+            vector_db = _get_adapter(
+                adapters,
+                platform_key,
+                output[PSKeys.VECTOR_DB],
+                scope=(PSKeys.VECTOR_DB, output[PSKeys.EMBEDDING], run_id),
+                create=lambda: VectorDB(
+                    tool=util,
+                    adapter_instance_id=output[PSKeys.VECTOR_DB],
+                    embedding=embedding,
+                ),
+                close=lambda vector_db: vector_db.close(),
             )
         except SdkError as e:
+            adapters.close()
             msg = f"Couldn't fetch adapter. {e}"
             app.logger.error(msg)
             _publish_log(
@@ -270,19 +450,14 @@ def prompt_processor() -> Any:
 
         if output[PSKeys.TYPE] == PSKeys.TABLE or output[PSKeys.TYPE] == PSKeys.RECORD:
             try:
-                structured_output = extract_table(
+                extract_table(
                     output=output,
                     plugins=plugins,
                     structured_output=structured_output,
                     llm=llm,
                     enforce_type=output[PSKeys.TYPE],
                 )
-                metadata = query_usage_metadata(token=platform_key, metadata=metadata)
-                response = {
-                    PSKeys.METADATA: metadata,
-                    PSKeys.OUTPUT: structured_output,
-                }
-                return response
+                return None
             except APIError as api_error:
                 app.logger.error(
                     "Failed to extract table for the prompt %s: %s",
@@ -301,51 +476,43 @@ def prompt_processor() -> Any:
                     "Error while extracting table for the prompt",
                 )
                 raise api_error
+            finally:
+                adapters.close()
 
+        # Answers from empty contexts, failed parses and failed challenges are
+        # not cached, so that the next run answers them again
+        is_answer_cacheable = True
         try:
             context = ""
             if output[PSKeys.CHUNK_SIZE] == 0:
                 # We can do this only for chunkless indexes
-                context: Optional[str] = index.query_index(
-                    embedding_instance_id=output[PSKeys.EMBEDDING],
-                    vector_db_instance_id=output[PSKeys.VECTOR_DB],
-                    doc_id=doc_id,
-                    usage_kwargs=usage_kwargs,
-                )
-                if not context:
-                    # UN-1288 For Pinecone, we are seeing an inconsistent case where
-                    # query with doc_id fails even though indexing just happened.
-                    # This causes the following retrieve to return no text.
-                    # To rule out any lag on the Pinecone vector DB write,
-                    # the following sleep is added.
-                    # Note: This will not fix the issue. Since this issue is
-                    # inconsistent, and not reproducible easily,
-                    # this is just a safety net.
-                    time.sleep(2)
-                    context: Optional[str] = index.query_index(
+                context: Optional[str] = index_readiness.retrieve(
+                    doc_id,
+                    lambda: index.query_index(
                         embedding_instance_id=output[PSKeys.EMBEDDING],
                         vector_db_instance_id=output[PSKeys.VECTOR_DB],
                         doc_id=doc_id,
                         usage_kwargs=usage_kwargs,
+                    ),
+                )
+                if context is None:
+                    # TODO: Obtain user set name for vector DB
+                    msg = NO_CONTEXT_ERROR
+                    app.logger.error(
+                        f"{msg} {output[PSKeys.VECTOR_DB]} for doc_id {doc_id}"
                     )
-                    if context is None:
-                        # TODO: Obtain user set name for vector DB
-                        msg = NO_CONTEXT_ERROR
-                        app.logger.error(
-                            f"{msg} {output[PSKeys.VECTOR_DB]} for doc_id {doc_id}"
-                        )
-                        _publish_log(
-                            log_events_id,
-                            {
-                                "tool_id": tool_id,
-                                "prompt_key": prompt_name,
-                                "doc_name": doc_name,
-                            },
-                            LogLevel.ERROR,
-                            RunLevel.RUN,
-                            msg,
-                        )
-                        raise APIError(message=msg)
+                    _publish_log(
+                        log_events_id,
+                        {
+                            "tool_id": tool_id,
+                            "prompt_key": prompt_name,
+                            "doc_name": doc_name,
+                        },
+                        LogLevel.ERROR,
+                        RunLevel.RUN,
+                        msg,
+                    )
+                    raise APIError(message=msg)
                 # TODO: Use vectorDB name when available
                 _publish_log(
                     log_events_id,
@@ -408,6 +575,9 @@ def prompt_processor() -> Any:
                         vector_index=vector_index,
                         retrieval_type=retrieval_strategy,
                         metadata=metadata,
+                        index_readiness=index_readiness,
+                        embedding=embedding,
+                        query_embedding_usage=query_embedding_usage,
                     )
                     metadata[PSKeys.CONTEXT][output[PSKeys.NAME]] = get_cleaned_context(
                         context
@@ -469,6 +639,7 @@ def prompt_processor() -> Any:
                             LogLevel.ERROR,
                         )
                         structured_output[output[PSKeys.NAME]] = None
+                        is_answer_cacheable = False
             elif output[PSKeys.TYPE] == PSKeys.EMAIL:
                 if answer.lower() == "na":
                     structured_output[output[PSKeys.NAME]] = None
@@ -539,6 +710,7 @@ def prompt_processor() -> Any:
                                 LogLevel.ERROR,
                             )
                             structured_output[output[PSKeys.NAME]] = {}
+                            is_answer_cacheable = False
 
             else:
                 structured_output[output[PSKeys.NAME]] = answer
@@ -566,13 +738,19 @@ def prompt_processor() -> Any:
                             RunLevel.CHALLENGE,
                             "Challenging response",
                         )
-                        challenge_llm = LLM(
-                            tool=util,
-                            adapter_instance_id=tool_settings[PSKeys.CHALLENGE_LLM],
-                            usage_kwargs={
-                                **usage_kwargs,
-                                PSKeys.LLM_USAGE_REASON: PSKeys.CHALLENGE,
-                            },
+                        challenge_llm = _get_adapter(
+                            adapters,
+                            platform_key,
+                            tool_settings[PSKeys.CHALLENGE_LLM],
+                            scope=(PSKeys.LLM, run_id, PSKeys.CHALLENGE),
+                            create=lambda: LLM(
+                                tool=util,
+                                adapter_instance_id=tool_settings[PSKeys.CHALLENGE_LLM],
+                                usage_kwargs={
+                                    **usage_kwargs,
+                                    PSKeys.LLM_USAGE_REASON: PSKeys.CHALLENGE,
+                                },
+                            ),
                         )
                         challenge = challenge_plugin["entrypoint_cls"](
                             llm=llm,
@@ -610,6 +788,7 @@ def prompt_processor() -> Any:
                         RunLevel.CHALLENGE,
                         "Error while challenging response",
                     )
+                    is_answer_cacheable = False
 
             #
             # Evaluate the prompt.
@@ -676,7 +855,96 @@ def prompt_processor() -> Any:
                         f"No eval plugin found to evaluate prompt: {output[PSKeys.NAME]}"  # noqa: E501
                     )
         finally:
-            vector_db.close()
+            adapters.close()
+
+        # Nothing retrieved could be the vector DB not having caught up yet
+        if not (context and context.strip()):
+            is_answer_cacheable = False
+        if answer_cache and answer_cache_key and is_answer_cacheable:
+            answer_cache.set(
+                answer_cache_key,
+                {
+                    PSKeys.OUTPUT: structured_output.get(prompt_name),
+                    PSKeys.METADATA: _get_prompt_metadata(metadata, prompt_name),
+                },
+            )
+        return None
+
+    def run_prompt_in_context(prompt_index: int) -> Optional[Any]:
+        try:
+            with app.app_context():
+                response = run_prompt(prompt_index)
+        finally:
+            if not db.is_closed():
+                db.close()
+        if answer_stream and response is None:
+            put_answer(outputs[prompt_index][PSKeys.NAME])
+        return response
+
+    def put_answer(prompt_name: str) -> None:
+        output_keys = {prompt_name, f"{prompt_name}{PSKeys.EVALUATION_SUFFIX}"}
+        # Copied since later prompts might still read the answer unsanitized
+        output = copy.deepcopy(
+            {
+                key: value
+                for key, value in list(structured_output.items())
+                if key in output_keys
+            }
+        )
+        if table_index is None:
+            _sanitize_null_values(output)
+        answer_stream.put_answer(
+            prompt_key=prompt_name,
+            output=output,
+            metadata={
+                PSKeys.RUN_ID: run_id,
+                PSKeys.FILE_NAME: doc_name,
+                PSKeys.CONTEXT: {},
+                **{
+                    key: {prompt_name: value}
+                    for key, value in _get_prompt_metadata(
+                        metadata, prompt_name
+                    ).items()
+                },
+            },
+        )
+
+    prompt_graph = PromptGraph(outputs=outputs)
+    response = prompt_graph.run(
+        run_prompt=run_prompt_in_context,
+        max_workers=MAX_PARALLEL_PROMPTS,
+        max_workers_per_llm=MAX_PARALLEL_PROMPTS_PER_LLM,
+    )
+    if answer_cache:
+        _publish_log(
+            log_events_id,
+            {"tool_id": tool_id, "run_id": run_id, "doc_name": doc_name},
+            LogLevel.INFO,
+            RunLevel.RUN,
+            f"Answer cache: {len(answer_cache_hits)} hit(s), "
+            f"{len(answer_cache_misses)} miss(es)",
+        )
+    if query_embedding_cache:
+        # Queries found in the cache are not embedded and have no usage of
+        # their own
+        metadata[PSKeys.QUERY_EMBEDDING_CACHE] = query_embedding_usage.to_dict()
+    if response is not None:
+        return response
+    # Prompts finish in any order, answers are listed in the order of prompts
+    structured_output = _order_by_prompts(structured_output, variable_names)
+    for key in (PSKeys.CONTEXT, PSKeys.EPILOGUE):
+        if isinstance(metadata.get(key), dict):
+            metadata[key] = _order_by_prompts(metadata[key], variable_names)
+    if table_index is not None:
+        # We do not support summary and eval for table.
+        # Hence returning the result
+        metadata = query_usage_metadata(token=platform_key, metadata=metadata)
+        response = {
+            PSKeys.METADATA: metadata,
+            PSKeys.OUTPUT: structured_output,
+        }
+        return response
+
     _publish_log(
         log_events_id,
         {"tool_id": tool_id, "doc_name": doc_name},
@@ -684,6 +952,30 @@ def prompt_processor() -> Any:
         RunLevel.RUN,
         "Sanitizing null values",
     )
+    _sanitize_null_values(structured_output)
+
+    _publish_log(
+        log_events_id,
+        {"tool_id": tool_id, "doc_name": doc_name},
+        LogLevel.INFO,
+        RunLevel.RUN,
+        "Execution complete",
+    )
+    metadata = query_usage_metadata(token=platform_key, metadata=metadata)
+    response = {PSKeys.METADATA: metadata, PSKeys.OUTPUT: structured_output}
+    return response
+
+
+def _get_prompt_metadata(metadata: dict[str, Any], prompt_name: str) -> dict[str, Any]:
+    """Gets the metadata of a prompt, kept by prompt name under each key."""
+    return {
+        key: value[prompt_name]
+        for key, value in list(metadata.items())
+        if isinstance(value, dict) and prompt_name in value
+    }
+
+
+def _sanitize_null_values(structured_output: dict[str, Any]) -> None:
     for k, v in structured_output.items():
         if isinstance(v, str) and v.lower() == "na":
             structured_output[k] = None
@@ -700,16 +992,13 @@ def prompt_processor() -> Any:
                 if isinstance(v1, str) and v1.lower() == "na":
                     v[k1] = None
 
-    _publish_log(
-        log_events_id,
-        {"tool_id": tool_id, "doc_name": doc_name},
-        LogLevel.INFO,
-        RunLevel.RUN,
-        "Execution complete",
-    )
-    metadata = query_usage_metadata(token=platform_key, metadata=metadata)
-    response = {PSKeys.METADATA: metadata, PSKeys.OUTPUT: structured_output}
-    return response
+
+def _order_by_prompts(
+    values: dict[str, Any], prompt_names: list[str]
+) -> dict[str, Any]:
+    ordered = {name: values[name] for name in prompt_names if name in values}
+    ordered.update(values)
+    return ordered
 
 
 def run_retrieval(  # type:ignore
@@ -720,6 +1009,9 @@ def run_retrieval(  # type:ignore
     vector_index,
     retrieval_type: str,
     metadata: dict[str, Any],
+    index_readiness: Optional[IndexReadiness] = None,
+    embedding: Optional[Embedding] = None,
+    query_embedding_usage: Optional[QueryEmbeddingUsage] = None,
 ) -> tuple[str, str]:
     context: str = ""
     prompt = output[PSKeys.PROMPTX]
@@ -753,35 +1045,44 @@ def run_retrieval(  # type:ignore
             llm=llm,
             prompt=subq_prompt,
         )
-        subquestion_list = subquestions.split(",")
-        raw_retrieved_context = ""
-        for each_subq in subquestion_list:
-            retrieved_context = _retrieve_context(
-                output, doc_id, vector_index, each_subq
+        subquestion_list = list(
+            dict.fromkeys(
+                subquestion.strip()
+                for subquestion in subquestions.split(",")
+                if subquestion.strip()
             )
-            # Not adding the potential for pinecode serverless
-            # inconsistency issue owing to risk of infinte loop
-            # and inablity to diffrentiate genuine cases of
-            # empty context.
-            raw_retrieved_context = "\f\n".join(
-                [raw_retrieved_context, retrieved_context]
+        )
+        retriever = _get_retriever(output, doc_id, vector_index)
+        # Each subquestion is embedded and queried on its own thread. Not
+        # adding the potential for pinecode serverless inconsistency issue
+        # owing to risk of infinte loop and inablity to diffrentiate genuine
+        # cases of empty context.
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_PARALLEL_RETRIEVALS, len(subquestion_list)))
+        ) as executor:
+            retrieved_nodes = list(
+                executor.map(
+                    lambda subquestion: _retrieve_nodes(
+                        retriever,
+                        _get_query_bundle(
+                            output, subquestion, embedding, query_embedding_usage
+                        ),
+                    ),
+                    subquestion_list,
+                )
             )
-        context = _remove_duplicate_nodes(raw_retrieved_context)
+        context = "\f\n".join(
+            node.get_content() for node in merge_nodes(retrieved_nodes)
+        )
 
     if retrieval_type == PSKeys.SIMPLE:
 
-        context = _retrieve_context(output, doc_id, vector_index, prompt)
-
-        if not context:
-            # UN-1288 For Pinecone, we are seeing an inconsistent case where
-            # query with doc_id fails even though indexing just happened.
-            # This causes the following retrieve to return no text.
-            # To rule out any lag on the Pinecone vector DB write,
-            # the following sleep is added
-            # Note: This will not fix the issue. Since this issue is inconsistent
-            # and not reproducible easily, this is just a safety net.
-            time.sleep(2)
-            context = _retrieve_context(output, doc_id, vector_index, prompt)
+        if not index_readiness:
+            index_readiness = IndexReadiness.from_payload({})
+        query = _get_query_bundle(output, prompt, embedding, query_embedding_usage)
+        context = index_readiness.retrieve(
+            doc_id, lambda: _retrieve_context(output, doc_id, vector_index, query)
+        )
 
     answer = construct_and_run_prompt(  # type:ignore
         tool_settings=tool_settings,
@@ -795,14 +1096,16 @@ def run_retrieval(  # type:ignore
     return (answer, context)
 
 
-def _remove_duplicate_nodes(retrieved_context: str) -> str:
-    context_set: set[str] = set(retrieved_context.split("\f\n"))
-    fomatted_context = "\f\n".join(context_set)
-    return fomatted_context
+def _retrieve_context(output, doc_id, vector_index, answer) -> str:
+    retriever = _get_retriever(output, doc_id, vector_index)
+    text = ""
+    for node in _retrieve_nodes(retriever, answer):
+        text += node.get_content() + "\f\n"
+    return text
 
 
-def _retrieve_context(output, doc_id, vector_index, answer) -> str:
-    retriever = vector_index.as_retriever(
+def _get_retriever(output, doc_id, vector_index) -> BaseRetriever:
+    return vector_index.as_retriever(
         similarity_top_k=output[PSKeys.SIMILARITY_TOP_K],
         filters=MetadataFilters(
             filters=[
@@ -813,19 +1116,43 @@ def _retrieve_context(output, doc_id, vector_index, answer) -> str:
             ],
         ),
     )
-    nodes = retriever.retrieve(answer)
-    text = ""
-    for node in nodes:
+
+
+def _get_query_bundle(
+    output: dict[str, Any],
+    query: str,
+    embedding: Optional[Embedding],
+    query_embedding_usage: Optional[QueryEmbeddingUsage],
+) -> Union[str, QueryBundle]:
+    """Embeds a retrieval query through the query embedding cache if enabled,
+    otherwise the retriever embeds it."""
+    if not query_embedding_cache or not embedding:
+        return query
+    query_embedding, is_hit = query_embedding_cache.get_embedding(
+        adapter_instance_id=output[PSKeys.EMBEDDING],
+        query=query,
+        embed=embedding.get_query_embedding,
+    )
+    if query_embedding_usage:
+        query_embedding_usage.add(is_hit)
+    return QueryBundle(query_str=query, embedding=query_embedding)
+
+
+def _retrieve_nodes(
+    retriever: BaseRetriever, query: Union[str, QueryBundle]
+) -> list[NodeWithScore]:
+    nodes: list[NodeWithScore] = []
+    for node in retriever.retrieve(query):
         # ToDo: May have to fine-tune this value for node score or keep it
         # configurable at the adapter level
         if node.score > 0:
-            text += node.get_content() + "\f\n"
+            nodes.append(node)
         else:
             app.logger.info(
                 "Node score is less than 0. "
                 f"Ignored: {node.node_id} with score {node.score}"
             )
-    return text
+    return nodes
 
 
 def log_exceptions(e: HTTPException):
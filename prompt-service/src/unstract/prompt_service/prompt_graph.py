@@ -0,0 +1,153 @@
+import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+
+from unstract.prompt_service.constants import PromptServiceContants as PSKeys
+from unstract.prompt_service.variable_extractor.constants import (
+    VariableConstants,
+    VariableType,
+)
+from unstract.prompt_service.variable_extractor.prompt_variable_service import (
+    VariableService,
+)
+
+# Limits the prompts answered at a time by each LLM adapter, per process
+_llm_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_llm_semaphores_lock = threading.Lock()
+
+
+class PromptGraph:
+    """Dependencies between the prompts of a request, to run independent
+    prompts concurrently.
+
+    A prompt depends on the earlier prompts it refers to, as `{{name}}` or
+    `%name%`. References to later prompts are not dependencies since they
+    were never answered before the prompt, keeping the results the same as
+    when prompts are run one after the other.
+    """
+
+    def __init__(self, outputs: list[dict[str, Any]]) -> None:
+        self.outputs = outputs
+        # Indices of the prompts each prompt depends on
+        self.parents: list[list[int]] = []
+        indices: dict[str, int] = {}
+        for index, output in enumerate(outputs):
+            names = self.get_referenced_names(output[PSKeys.PROMPT])
+            self.parents.append(
+                sorted(indices[name] for name in names if name in indices)
+            )
+            indices.setdefault(output[PSKeys.NAME], index)
+
+    def get_referenced_names(self, prompt: str) -> set[str]:
+        """Get the names of the prompts a prompt refers to.
+
+        Args:
+            prompt (str): Prompt before its variables are replaced
+
+        Returns:
+            set[str]: Names of the prompts referred to
+        """
+        names: set[str] = set()
+        for variable in VariableService.extract_variables_from_prompt(prompt=prompt):
+            variable_type = VariableService.identify_variable_type(variable=variable)
+            if variable_type == VariableType.DYNAMIC:
+                names.update(
+                    re.findall(VariableConstants.DYNAMIC_VARIABLE_DATA_REGEX, variable)
+                )
+            else:
+                names.add(variable)
+        for output in self.outputs:
+            if f"%{output[PSKeys.NAME]}%" in prompt:
+                names.add(output[PSKeys.NAME])
+        return names
+
+    def run(
+        self,
+        run_prompt: Callable[[int], Optional[Any]],
+        max_workers: int,
+        max_workers_per_llm: int,
+    ) -> Optional[Any]:
+        """Runs every prompt once the prompts it depends on are answered.
+
+        No prompts are started once one fails or returns a response. Those
+        already running are waited for.
+
+        Args:
+            run_prompt (Callable[[int], Optional[Any]]): Runs the prompt at an
+                index, returns a response to end the request with, if any
+            max_workers (int): Prompts run at a time
+            max_workers_per_llm (int): Prompts run at a time per LLM adapter
+
+        Returns:
+            Optional[Any]: Response of the first prompt in order that returned
+                one, None if every prompt is answered
+
+        Raises:
+            Exception: Error of the first prompt in order that failed
+        """
+        children: list[list[int]] = [[] for _ in self.outputs]
+        pending_parents: list[int] = []
+        for index, parents in enumerate(self.parents):
+            pending_parents.append(len(parents))
+            for parent in parents:
+                children[parent].append(index)
+
+        responses: dict[int, Any] = {}
+        errors: dict[int, Exception] = {}
+        futures: dict[Future[Optional[Any]], int] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="prompt"
+        ) as executor:
+
+            def submit(index: int) -> None:
+                future = executor.submit(
+                    self._run_limited, run_prompt, index, max_workers_per_llm
+                )
+                futures[future] = index
+
+            for index, parents in enumerate(self.parents):
+                if not parents:
+                    submit(index)
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        errors[index] = e
+                        continue
+                    if response is not None:
+                        responses[index] = response
+                        continue
+                    for child in children[index]:
+                        pending_parents[child] -= 1
+                        if not pending_parents[child] and not (errors or responses):
+                            submit(child)
+
+        first_failed = min(errors, default=None)
+        first_responded = min(responses, default=None)
+        if first_failed is not None and (
+            first_responded is None or first_failed < first_responded
+        ):
+            raise errors[first_failed]
+        if first_responded is not None:
+            return responses[first_responded]
+        return None
+
+    def _run_limited(
+        self,
+        run_prompt: Callable[[int], Optional[Any]],
+        index: int,
+        max_workers_per_llm: int,
+    ) -> Optional[Any]:
+        adapter_instance_id = str(self.outputs[index].get(PSKeys.LLM, ""))
+        with _llm_semaphores_lock:
+            semaphore = _llm_semaphores.setdefault(
+                adapter_instance_id,
+                threading.BoundedSemaphore(max(1, max_workers_per_llm)),
+            )
+        with semaphore:
+            return run_prompt(index)
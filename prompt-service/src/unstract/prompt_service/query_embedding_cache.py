@@ -0,0 +1,151 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+from unstract.prompt_service.adapter_cache import AdapterCache
+from unstract.prompt_service.config import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingUsage:
+    """Queries of a request found in the query embedding cache or
+    embedded, reported along with the usage of the request."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def add(self, is_hit: bool) -> None:
+        with self._lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def to_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+
+class QueryEmbeddingCache:
+    """Embeddings of retrieval queries, shared across documents.
+
+    Prompts are mostly the same for every document a tool runs on, so their
+    embeddings are cached by embedding adapter instance, its config version
+    and the query with its whitespace normalized. The `max_size` most
+    recently used embeddings are kept in the process, in front of Redis
+    where they're shared across processes for `ttl` seconds.
+    """
+
+    CACHE_PREFIX = "query_embedding:"
+
+    def __init__(self, ttl: int, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._embeddings: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = get_redis_client()
+
+    @staticmethod
+    def from_env() -> Optional["QueryEmbeddingCache"]:
+        """Creates the cache unless disabled with
+        `QUERY_EMBEDDING_CACHE_TTL`."""
+        ttl = int(os.environ.get("QUERY_EMBEDDING_CACHE_TTL", 86400))
+        if ttl < 1:
+            return None
+        return QueryEmbeddingCache(
+            ttl=ttl, max_size=int(os.environ.get("QUERY_EMBEDDING_CACHE_SIZE", 1024))
+        )
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(query.split())
+
+    def get_embedding(
+        self,
+        adapter_instance_id: str,
+        query: str,
+        embed: Callable[[str], list[float]],
+    ) -> tuple[list[float], bool]:
+        """Gets the embedding of a query, embedding it on a miss.
+
+        Args:
+            adapter_instance_id (str): ID of the embedding adapter instance
+            query (str): Query to embed
+            embed (Callable[[str], list[float]]): Embeds the normalized query
+
+        Returns:
+            tuple[list[float], bool]: Embedding of the query and whether it
+                was cached
+        """
+        query = self.normalize(query)
+        key = self.get_cache_key(adapter_instance_id, query)
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is not None:
+                self._embeddings.move_to_end(key)
+                return embedding, True
+        embedding = self._get_shared(key)
+        is_hit = embedding is not None
+        if not is_hit:
+            embedding = embed(query)
+            self._set_shared(key, embedding)
+        with self._lock:
+            self._embeddings[key] = embedding
+            self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_size:
+                self._embeddings.popitem(last=False)
+        return embedding, is_hit
+
+    def get_cache_key(self, adapter_instance_id: str, query: str) -> str:
+        """Hashes a normalized query into a cache key, along with the config
+        version of its embedding adapter."""
+        inputs = [adapter_instance_id, self._get_version(adapter_instance_id), query]
+        digest = hashlib.sha256(json.dumps(inputs).encode("utf-8")).hexdigest()
+        return f"{self.CACHE_PREFIX}{digest}"
+
+    def _get_version(self, adapter_instance_id: str) -> str:
+        if not self._redis:
+            return ""
+        try:
+            version = self._redis.get(
+                f"{AdapterCache.VERSION_KEY_PREFIX}{adapter_instance_id}"
+            )
+        except RedisError as e:
+            logger.warning(
+                f"Unable to read version of adapter {adapter_instance_id}: {e}"
+            )
+            return ""
+        return version.decode("utf-8") if version else ""
+
+    def _get_shared(self, key: str) -> Optional[list[float]]:
+        if not self._redis:
+            return None
+        try:
+            cached = self._redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Unable to read cached query embedding: {e}")
+            return None
+        if not cached:
+            return None
+        try:
+            embedding: Any = json.loads(cached)
+        except ValueError:
+            return None
+        return embedding if isinstance(embedding, list) else None
+
+    def _set_shared(self, key: str, embedding: list[float]) -> None:
+        if not self._redis:
+            return
+        try:
+            self._redis.set(key, json.dumps(embedding), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Unable to cache query embedding: {e}")
@@ -0,0 +1,89 @@
+import unittest
+from unittest import mock
+
+from unstract.prompt_service.adapter_cache import AdapterCache
+
+NOW = 1_000.0
+
+
+class AdapterCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.versions: dict[str, bytes] = {}
+        self.redis = mock.MagicMock()
+        self.redis.get.side_effect = lambda key: self.versions.get(key)
+        patcher = mock.patch(
+            "unstract.prompt_service.adapter_cache.get_redis_client",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.now = NOW
+        patcher = mock.patch(
+            "unstract.prompt_service.adapter_cache.time.monotonic",
+            side_effect=lambda: self.now,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = AdapterCache(ttl=60, max_size=4)
+        self.close = mock.Mock()
+
+    def use(self, run_id: str, adapter_instance_id: str = "llm-1") -> mock.Mock:
+        with self.cache.use(
+            platform_key="key",
+            adapter_instance_id=adapter_instance_id,
+            scope=("llm", run_id),
+            create=mock.Mock,
+            close=self.close,
+        ) as adapter:
+            return adapter
+
+    def test_adapter_reused(self):
+        adapter = self.use("run-1")
+
+        self.assertIs(self.use("run-1"), adapter)
+        self.assertIsNot(self.use("run-2"), adapter)
+        self.assertIsNot(self.use("run-1", adapter_instance_id="llm-2"), adapter)
+        self.close.assert_not_called()
+
+    def test_edited_adapter_created_again(self):
+        adapter = self.use("run-1")
+        self.versions[f"{AdapterCache.VERSION_KEY_PREFIX}llm-1"] = b"2"
+
+        self.assertIsNot(self.use("run-1"), adapter)
+        self.close.assert_called_once_with(adapter)
+
+    def test_expired_adapters_swept_on_use(self):
+        ended_run = self.use("run-1")
+        self.now += 30
+        ongoing_run = self.use("run-2")
+        self.now += 31
+
+        # Adapters of other runs are closed as well once expired
+        self.use("run-3", adapter_instance_id="llm-2")
+        self.close.assert_called_once_with(ended_run)
+        self.assertIs(self.use("run-2"), ongoing_run)
+
+    def test_adapter_in_use_closed_by_last_user(self):
+        with self.cache.use(
+            platform_key="key",
+            adapter_instance_id="llm-1",
+            scope=("llm", "run-1"),
+            create=mock.Mock,
+            close=self.close,
+        ) as adapter:
+            self.now += 61
+            self.use("run-2")
+            self.close.assert_not_called()
+        self.close.assert_called_once_with(adapter)
+
+    def test_least_recently_used_dropped(self):
+        adapters = [self.use(f"run-{index}") for index in range(4)]
+        self.use("run-0")
+
+        self.use("run-4")
+        self.close.assert_called_once_with(adapters[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
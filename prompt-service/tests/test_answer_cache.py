@@ -0,0 +1,128 @@
+import copy
+import unittest
+from typing import Any
+from unittest import mock
+
+from redis.exceptions import RedisError
+from unstract.prompt_service.adapter_cache import AdapterCache
+from unstract.prompt_service.answer_cache import AnswerCache
+from unstract.prompt_service.constants import PromptServiceContants as PSKeys
+
+OUTPUT: dict[str, Any] = {
+    PSKeys.NAME: "date",
+    PSKeys.PROMPT: "What is the date?",
+    PSKeys.TYPE: "text",
+    PSKeys.LLM: "llm-1",
+    PSKeys.EMBEDDING: "embedding-1",
+    PSKeys.VECTOR_DB: "vector-db-1",
+    PSKeys.X2TEXT_ADAPTER: "x2text-1",
+}
+TOOL_SETTINGS: dict[str, Any] = {PSKeys.ENABLE_CHALLENGE: False}
+
+
+class AnswerCacheKeyTests(unittest.TestCase):
+    def setUp(self):
+        self.redis = mock.MagicMock()
+        self.versions: dict[str, bytes] = {}
+        self.redis.mget.side_effect = lambda keys: [
+            self.versions.get(key) for key in keys
+        ]
+        patcher = mock.patch(
+            "unstract.prompt_service.answer_cache.get_redis_client",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = AnswerCache(ttl=60)
+
+    def get_key(
+        self,
+        doc_id: str = "doc",
+        output: dict[str, Any] = OUTPUT,
+        tool_settings: dict[str, Any] = TOOL_SETTINGS,
+    ) -> str:
+        return self.cache.get_cache_key(
+            doc_id=doc_id, output=output, tool_settings=tool_settings
+        )
+
+    def test_same_inputs_same_key(self):
+        key = self.get_key()
+
+        self.assertTrue(key.startswith(AnswerCache.CACHE_PREFIX))
+        self.assertEqual(self.get_key(output=copy.deepcopy(OUTPUT)), key)
+        # Order of the settings does not matter
+        self.assertEqual(self.get_key(output=dict(reversed(OUTPUT.items()))), key)
+
+    def test_key_changes_with_inputs(self):
+        key = self.get_key()
+
+        self.assertNotEqual(self.get_key(doc_id="other"), key)
+        self.assertNotEqual(
+            self.get_key(output={**OUTPUT, PSKeys.PROMPT: "What is the total?"}), key
+        )
+        self.assertNotEqual(self.get_key(output={**OUTPUT, PSKeys.LLM: "llm-2"}), key)
+        self.assertNotEqual(
+            self.get_key(tool_settings={PSKeys.ENABLE_CHALLENGE: True}), key
+        )
+
+    def test_key_changes_with_adapter_versions(self):
+        key = self.get_key()
+
+        self.versions[f"{AdapterCache.VERSION_KEY_PREFIX}embedding-1"] = b"2"
+        edited_key = self.get_key()
+        self.assertNotEqual(edited_key, key)
+        self.assertEqual(self.get_key(), edited_key)
+
+        challenged = {PSKeys.CHALLENGE_LLM: "challenge-llm"}
+        challenged_key = self.get_key(tool_settings=challenged)
+        self.versions[f"{AdapterCache.VERSION_KEY_PREFIX}challenge-llm"] = b"3"
+        self.assertNotEqual(self.get_key(tool_settings=challenged), challenged_key)
+
+    def test_adapter_versions_read_once(self):
+        self.get_key()
+
+        self.redis.mget.assert_called_once_with(
+            [
+                f"{AdapterCache.VERSION_KEY_PREFIX}{adapter_instance_id}"
+                for adapter_instance_id in (
+                    "embedding-1",
+                    "llm-1",
+                    "vector-db-1",
+                    "x2text-1",
+                )
+            ]
+        )
+
+    def test_key_without_adapter_versions(self):
+        self.redis.mget.side_effect = RedisError("Connection refused")
+
+        self.assertEqual(self.get_key(), self.get_key())
+        self.assertEqual(self.cache._get_adapter_versions(OUTPUT, TOOL_SETTINGS), {})
+
+
+class AnswerCacheEnabledTests(unittest.TestCase):
+    def test_enabled(self):
+        self.assertTrue(AnswerCache.is_enabled_for({}, OUTPUT))
+        self.assertTrue(
+            AnswerCache.is_enabled_for({PSKeys.ENABLE_ANSWER_CACHE: True}, OUTPUT)
+        )
+
+    def test_disabled_by_tool(self):
+        self.assertFalse(
+            AnswerCache.is_enabled_for({PSKeys.ENABLE_ANSWER_CACHE: False}, OUTPUT)
+        )
+
+    def test_disabled_for_tables_records_and_evaluations(self):
+        for prompt_type in (PSKeys.TABLE, PSKeys.RECORD):
+            self.assertFalse(
+                AnswerCache.is_enabled_for({}, {**OUTPUT, PSKeys.TYPE: prompt_type})
+            )
+        evaluated = {
+            **OUTPUT,
+            PSKeys.EVAL_SETTINGS: {PSKeys.EVAL_SETTINGS_EVALUATE: True},
+        }
+        self.assertFalse(AnswerCache.is_enabled_for({}, evaluated))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest import mock
+
+from flask import Flask
+from unstract.prompt_service.constants import PromptServiceContants as PSKeys
+from unstract.prompt_service.index_readiness import IndexReadiness
+
+NOW = 1_000_000.0
+
+
+class IndexReadinessTests(unittest.TestCase):
+    def setUp(self):
+        app_context = Flask(__name__).app_context()
+        app_context.push()
+        self.addCleanup(app_context.pop)
+
+        # Sleeping moves the clock forward instead of waiting
+        self.now = NOW
+        self.sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        for name, side_effect in (("time", lambda: self.now), ("sleep", sleep)):
+            patcher = mock.patch(
+                f"unstract.prompt_service.index_readiness.time.{name}",
+                side_effect=side_effect,
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def readiness(self, indexed_ago: float = 0) -> IndexReadiness:
+        return IndexReadiness(
+            index_markers={"doc": {PSKeys.INDEXED_AT: NOW - indexed_ago}},
+            consistency_window=10,
+            initial_delay=0.25,
+        )
+
+    def test_retrieved_without_retries(self):
+        retrieve = mock.Mock(return_value=["chunk"])
+
+        self.assertEqual(self.readiness().retrieve("doc", retrieve), ["chunk"])
+        retrieve.assert_called_once()
+        self.assertEqual(self.sleeps, [])
+
+    def test_retried_with_backoff(self):
+        retrieve = mock.Mock(side_effect=[[], [], [], ["chunk"]])
+
+        self.assertEqual(self.readiness().retrieve("doc", retrieve), ["chunk"])
+        self.assertEqual(retrieve.call_count, 4)
+        self.assertEqual(self.sleeps, [0.25, 0.5, 1])
+
+    def test_retries_end_with_consistency_window(self):
+        retrieve = mock.Mock(return_value=[])
+
+        self.assertEqual(self.readiness(indexed_ago=8).retrieve("doc", retrieve), [])
+        # The last delay is cut short at the end of the window
+        self.assertEqual(self.sleeps, [0.25, 0.5, 1, 0.25])
+        self.assertEqual(self.now, NOW + 2)
+
+    def test_not_retried_after_consistency_window(self):
+        retrieve = mock.Mock(return_value=[])
+
+        self.assertEqual(self.readiness(indexed_ago=10).retrieve("doc", retrieve), [])
+        retrieve.assert_called_once()
+        self.assertEqual(self.sleeps, [])
+
+    def test_retried_once_without_marker(self):
+        retrieve = mock.Mock(side_effect=[[], []])
+        readiness = IndexReadiness(
+            index_markers={"doc": {PSKeys.INDEXED_AT: "invalid"}},
+            consistency_window=10,
+            initial_delay=0.25,
+        )
+
+        self.assertEqual(readiness.retrieve("other", retrieve), [])
+        self.assertEqual(retrieve.call_count, 2)
+        self.assertEqual(self.sleeps, [readiness.legacy_retry_delay])
+
+        retrieve.reset_mock(side_effect=True)
+        retrieve.side_effect = [[], ["chunk"]]
+        self.assertEqual(readiness.retrieve("doc", retrieve), ["chunk"])
+        self.assertEqual(retrieve.call_count, 2)
+
+    def test_retried_once_without_indexed_at(self):
+        for marker in ({PSKeys.INDEXED_AT: None}, {}):
+            self.sleeps.clear()
+            retrieve = mock.Mock(side_effect=[[], ["chunk"]])
+            readiness = IndexReadiness(
+                index_markers={"doc": marker},
+                consistency_window=10,
+                initial_delay=0.25,
+            )
+
+            self.assertEqual(readiness.retrieve("doc", retrieve), ["chunk"])
+            self.assertEqual(retrieve.call_count, 2)
+            self.assertEqual(self.sleeps, [readiness.legacy_retry_delay])
+
+    def test_from_payload(self):
+        markers = {"doc": {PSKeys.INDEXED_AT: NOW}}
+        with mock.patch.dict(
+            "os.environ",
+            {
+                "INDEX_CONSISTENCY_WINDOW_SECONDS": "5",
+                "INDEX_RETRY_INITIAL_DELAY": "0.5",
+            },
+        ):
+            readiness = IndexReadiness.from_payload({PSKeys.INDEX_MARKERS: markers})
+
+        self.assertEqual(readiness.index_markers, markers)
+        self.assertEqual(readiness.consistency_window, 5)
+        self.assertEqual(readiness.initial_delay, 0.5)
+        self.assertEqual(IndexReadiness.from_payload({}).index_markers, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
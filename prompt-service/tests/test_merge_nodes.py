@@ -0,0 +1,56 @@
+import unittest
+from typing import Optional
+
+from llama_index.core.schema import NodeWithScore, TextNode
+from unstract.prompt_service.helper import merge_nodes
+
+
+def node(node_id: str, score: Optional[float]) -> NodeWithScore:
+    return NodeWithScore(node=TextNode(id_=node_id, text=node_id), score=score)
+
+
+def merged(retrieved_nodes: list[list[NodeWithScore]]) -> list[tuple[str, float]]:
+    return [(node.node_id, node.score) for node in merge_nodes(retrieved_nodes)]
+
+
+class MergeNodesTests(unittest.TestCase):
+    def test_ordered_by_score(self):
+        self.assertEqual(
+            merged([[node("a", 0.5), node("b", 0.9)], [node("c", 0.7)]]),
+            [("b", 0.9), ("c", 0.7), ("a", 0.5)],
+        )
+
+    def test_duplicates_keep_best_score(self):
+        self.assertEqual(
+            merged(
+                [
+                    [node("a", 0.5), node("b", 0.6)],
+                    [node("a", 0.8), node("b", 0.4)],
+                ]
+            ),
+            [("a", 0.8), ("b", 0.6)],
+        )
+
+    def test_equal_scores_keep_retrieval_order(self):
+        self.assertEqual(
+            merged([[node("b", 0.5)], [node("a", 0.5), node("b", 0.5)]]),
+            [("b", 0.5), ("a", 0.5)],
+        )
+
+    def test_missing_scores_come_last(self):
+        self.assertEqual(
+            merged([[node("a", None), node("b", 0.1)], [node("a", 0.2)]]),
+            [("a", 0.2), ("b", 0.1)],
+        )
+        self.assertEqual(
+            merged([[node("a", None)], [node("b", 0.1)]]),
+            [("b", 0.1), ("a", None)],
+        )
+
+    def test_nothing_retrieved(self):
+        self.assertEqual(merge_nodes([]), [])
+        self.assertEqual(merge_nodes([[], []]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+import threading
+import unittest
+from typing import Any, Optional
+
+from unstract.prompt_service.prompt_graph import PromptGraph
+
+# Seconds to wait for prompts expected to run concurrently
+TIMEOUT = 5
+
+
+def prompt(name: str, text: str, llm: str = "llm") -> dict[str, Any]:
+    return {"name": name, "prompt": text, "llm": llm}
+
+
+class PromptGraphDependencyTests(unittest.TestCase):
+    def test_parents_from_references(self):
+        graph = PromptGraph(
+            [
+                prompt("a", "What is the date?"),
+                prompt("b", "Who signed on {{a}}?"),
+                prompt("c", "Where did %b% sign on {{a}}?"),
+            ]
+        )
+
+        self.assertEqual(graph.parents, [[], [0], [0, 1]])
+
+    def test_later_references_are_not_parents(self):
+        graph = PromptGraph(
+            [
+                prompt("a", "Use {{b}} and %c%"),
+                prompt("b", "What is the date?"),
+                prompt("c", "Who signed on {{b}}?"),
+            ]
+        )
+
+        self.assertEqual(graph.parents, [[], [], [1]])
+
+    def test_unknown_references_are_ignored(self):
+        graph = PromptGraph([prompt("a", "Use {{custom}}"), prompt("b", "{{a}}")])
+
+        self.assertEqual(graph.parents, [[], [0]])
+
+
+class PromptGraphRunTests(unittest.TestCase):
+    def run_graph(
+        self,
+        prompts: list[dict[str, Any]],
+        run_prompt,
+        max_workers: int = 4,
+        max_workers_per_llm: int = 4,
+    ) -> Optional[Any]:
+        return PromptGraph(prompts).run(
+            run_prompt, max_workers=max_workers, max_workers_per_llm=max_workers_per_llm
+        )
+
+    def test_parents_are_answered_first(self):
+        answered: list[int] = []
+        lock = threading.Lock()
+
+        def run_prompt(index: int) -> None:
+            with lock:
+                answered.append(index)
+
+        response = self.run_graph(
+            [
+                prompt("a", "What is the date?", llm="order"),
+                prompt("b", "Who signed on {{a}}?", llm="order"),
+                prompt("c", "Where did %b% sign?", llm="order"),
+                prompt("d", "What is the total?", llm="order"),
+            ],
+            run_prompt,
+        )
+
+        self.assertIsNone(response)
+        self.assertEqual(sorted(answered), [0, 1, 2, 3])
+        self.assertLess(answered.index(0), answered.index(1))
+        self.assertLess(answered.index(1), answered.index(2))
+
+    def test_independent_prompts_run_concurrently(self):
+        # Passes only if both prompts are running at the same time
+        barrier = threading.Barrier(2, timeout=TIMEOUT)
+
+        def run_prompt(index: int) -> None:
+            barrier.wait()
+
+        self.run_graph(
+            [
+                prompt("a", "What is the date?", llm="concurrent"),
+                prompt("b", "What is the total?", llm="concurrent"),
+            ],
+            run_prompt,
+        )
+
+    def test_prompts_per_llm_are_limited(self):
+        running: dict[str, int] = {"limited": 0, "other": 0}
+        max_running: dict[str, int] = {"limited": 0, "other": 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(2, timeout=TIMEOUT)
+        prompts = [
+            prompt("a", "What is the date?", llm="limited"),
+            prompt("b", "What is the total?", llm="limited"),
+            prompt("c", "Who signed?", llm="other"),
+        ]
+
+        def run_prompt(index: int) -> None:
+            llm = prompts[index]["llm"]
+            with lock:
+                running[llm] += 1
+                max_running[llm] = max(max_running[llm], running[llm])
+            if index != 1:
+                # The first prompt of each LLM runs alongside the other's
+                barrier.wait()
+            with lock:
+                running[llm] -= 1
+
+        self.run_graph(prompts, run_prompt, max_workers_per_llm=1)
+
+        self.assertEqual(max_running["limited"], 1)
+
+    def test_first_error_in_order_is_raised(self):
+        started = threading.Event()
+        answered: list[int] = []
+
+        def run_prompt(index: int) -> None:
+            if index == 0:
+                # Fails after the later prompt has failed
+                started.wait(TIMEOUT)
+                raise ValueError("first")
+            if index == 1:
+                started.set()
+                raise ValueError("second")
+            answered.append(index)
+
+        with self.assertRaisesRegex(ValueError, "first"):
+            self.run_graph(
+                [
+                    prompt("a", "What is the date?", llm="error"),
+                    prompt("b", "What is the total?", llm="error"),
+                    prompt("c", "Who signed on {{a}}?", llm="error"),
+                ],
+                run_prompt,
+            )
+        # Prompts depending on a failed prompt are not run
+        self.assertEqual(answered, [])
+
+    def test_no_prompts_start_after_an_error(self):
+        answered: list[int] = []
+
+        def run_prompt(index: int) -> None:
+            if index == 0:
+                raise ValueError("failed")
+            answered.append(index)
+
+        with self.assertRaises(ValueError):
+            self.run_graph(
+                [
+                    prompt("a", "What is the date?", llm="stop"),
+                    prompt("b", "Who signed on {{a}}?", llm="stop"),
+                    prompt("c", "Where did %b% sign?", llm="stop"),
+                ],
+                run_prompt,
+                max_workers=1,
+            )
+        self.assertEqual(answered, [])
+
+    def test_first_response_in_order_is_returned(self):
+        started = threading.Event()
+
+        def run_prompt(index: int) -> Optional[str]:
+            if index == 0:
+                started.wait(TIMEOUT)
+                return "table"
+            if index == 1:
+                started.set()
+                return "record"
+            return None
+
+        response = self.run_graph(
+            [
+                prompt("a", "Extract the table", llm="response"),
+                prompt("b", "Extract the record", llm="response"),
+                prompt("c", "Who signed on {{a}}?", llm="response"),
+            ],
+            run_prompt,
+        )
+
+        self.assertEqual(response, "table")
+
+    def test_error_before_response_is_raised(self):
+        def run_prompt(index: int) -> Optional[str]:
+            if index == 0:
+                raise ValueError("failed")
+            return "record"
+
+        with self.assertRaisesRegex(ValueError, "failed"):
+            self.run_graph(
+                [
+                    prompt("a", "What is the date?", llm="mixed"),
+                    prompt("b", "Extract the record", llm="mixed"),
+                ],
+                run_prompt,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from typing import Any, Optional
+from unittest import mock
+
+from redis.exceptions import RedisError
+from unstract.prompt_service.adapter_cache import AdapterCache
+from unstract.prompt_service.query_embedding_cache import (
+    QueryEmbeddingCache,
+    QueryEmbeddingUsage,
+)
+
+VERSION_KEY = f"{AdapterCache.VERSION_KEY_PREFIX}embedding-1"
+
+
+class QueryEmbeddingCacheTests(unittest.TestCase):
+    def setUp(self):
+        # Redis shared by the caches of every process
+        self.shared: dict[str, bytes] = {}
+        self.redis = mock.MagicMock()
+        self.redis.get.side_effect = self.shared.get
+
+        def set_shared(key: str, value: Any, ex: Optional[int] = None) -> None:
+            self.shared[key] = (
+                value.encode("utf-8") if isinstance(value, str) else value
+            )
+
+        self.redis.set.side_effect = set_shared
+        patcher = mock.patch(
+            "unstract.prompt_service.query_embedding_cache.get_redis_client",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = QueryEmbeddingCache(ttl=60, max_size=2)
+        self.embed = mock.Mock(side_effect=lambda query: [float(len(query))])
+
+    def get_embedding(
+        self, query: str, adapter_instance_id: str = "embedding-1"
+    ) -> tuple[list[float], bool]:
+        return self.cache.get_embedding(
+            adapter_instance_id=adapter_instance_id, query=query, embed=self.embed
+        )
+
+    def test_key_normalizes_whitespace(self):
+        self.assertEqual(
+            QueryEmbeddingCache.normalize("  What is\n the\tdate? "),
+            "What is the date?",
+        )
+
+        self.assertEqual(self.get_embedding("What is the date?"), ([17.0], False))
+        self.assertEqual(self.get_embedding(" What  is the\ndate? "), ([17.0], True))
+        self.embed.assert_called_once_with("What is the date?")
+
+    def test_key_changes_with_adapter(self):
+        key = self.cache.get_cache_key("embedding-1", "What is the date?")
+
+        self.assertTrue(key.startswith(QueryEmbeddingCache.CACHE_PREFIX))
+        self.assertEqual(
+            self.cache.get_cache_key("embedding-1", "What is the date?"), key
+        )
+        self.assertNotEqual(
+            self.cache.get_cache_key("embedding-2", "What is the date?"), key
+        )
+        self.assertNotEqual(
+            self.cache.get_cache_key("embedding-1", "What is the total?"), key
+        )
+
+    def test_key_changes_with_adapter_version(self):
+        key = self.cache.get_cache_key("embedding-1", "What is the date?")
+
+        self.shared[VERSION_KEY] = b"2"
+        self.assertNotEqual(
+            self.cache.get_cache_key("embedding-1", "What is the date?"), key
+        )
+
+    def test_key_without_adapter_version(self):
+        key = self.cache.get_cache_key("embedding-1", "What is the date?")
+        self.redis.get.side_effect = RedisError("Connection refused")
+
+        self.assertEqual(
+            self.cache.get_cache_key("embedding-1", "What is the date?"), key
+        )
+
+    def test_embedding_shared_across_processes(self):
+        self.get_embedding("What is the date?")
+        other_process_cache = QueryEmbeddingCache(ttl=60, max_size=2)
+
+        embedding, is_hit = other_process_cache.get_embedding(
+            adapter_instance_id="embedding-1",
+            query="What is the date?",
+            embed=self.embed,
+        )
+
+        self.assertEqual((embedding, is_hit), ([17.0], True))
+        self.embed.assert_called_once()
+
+    def test_edited_adapter_embeds_again(self):
+        self.get_embedding("What is the date?")
+        self.shared[VERSION_KEY] = b"2"
+
+        self.assertEqual(self.get_embedding("What is the date?"), ([17.0], False))
+        self.assertEqual(self.embed.call_count, 2)
+
+    def test_least_recently_used_dropped(self):
+        for query in ("a", "bb", "a", "ccc"):
+            self.get_embedding(query)
+        self.shared.clear()
+
+        self.assertEqual(self.get_embedding("a"), ([1.0], True))
+        self.assertEqual(self.get_embedding("ccc"), ([3.0], True))
+        # Dropped from the process and no longer in Redis
+        self.assertEqual(self.get_embedding("bb"), ([2.0], False))
+
+    def test_embedding_without_redis(self):
+        self.redis.get.side_effect = RedisError("Connection refused")
+        self.redis.set.side_effect = RedisError("Connection refused")
+
+        self.assertEqual(self.get_embedding("What is the date?"), ([17.0], False))
+        self.assertEqual(self.get_embedding("What is the date?"), ([17.0], True))
+        self.embed.assert_called_once()
+
+
+class QueryEmbeddingUsageTests(unittest.TestCase):
+    def test_counts(self):
+        usage = QueryEmbeddingUsage()
+        for is_hit in (True, False, True):
+            usage.add(is_hit)
+
+        self.assertEqual(usage.to_dict(), {"cache_hits": 2, "cache_misses": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
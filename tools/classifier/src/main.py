@@ -1,16 +1,16 @@
 import sys
 from typing import Any, Optional
 
+import launcher  # type: ignore
 from helper import ClassifierHelper  # type: ignore
 from helper import ReservedBins
 from unstract.sdk.constants import LogLevel, LogState, MetadataKey, ToolSettingsKey
 from unstract.sdk.exceptions import SdkError
 from unstract.sdk.llm import LLM
 from unstract.sdk.tool.base import BaseTool
-from unstract.sdk.tool.entrypoint import ToolEntrypoint
 
 
-class UnstractClassifier(BaseTool):
+class UnstractClassifier(launcher.ResultFileMixin, BaseTool):
     def __init__(self, log_level: str = LogLevel.INFO) -> None:
         super().__init__(log_level)
 
@@ -142,5 +142,4 @@ class UnstractClassifier(BaseTool):
 
 if __name__ == "__main__":
     args = sys.argv[1:]
-    tool = UnstractClassifier.from_tool_args(args=args)
-    ToolEntrypoint.launch(tool=tool, args=args)
+    launcher.launch(tool_class=UnstractClassifier, args=args)
@@ -3,6 +3,12 @@ class SettingsKeys:
     PROMPT_REGISTRY_ID = "prompt_registry_id"
     PROMPT_HOST = "PROMPT_HOST"
     PROMPT_PORT = "PROMPT_PORT"
+    PLATFORM_SERVICE_API_KEY = "PLATFORM_SERVICE_API_KEY"
+    ANSWER_PROMPT = "answer-prompt"
+    NDJSON = "application/x-ndjson"
+    ANSWER = "answer"
+    PROMPT_KEY = "prompt_key"
+    OUTPUT = "output"
     TOOL_METADATA = "tool_metadata"
     TOOL_ID = "tool_id"
     OUTPUTS = "outputs"
@@ -64,6 +70,8 @@ class SettingsKeys:
     OK = "OK"
     FILE_NAME = "file_name"
     FILE_HASH = "file_hash"
+    INDEX_MARKERS = "index_markers"
+    INDEXED_AT = "indexed_at"
     ENABLE_HIGHLIGHT = "enable_highlight"
     NAME = "name"
     INCLUDE_METADATA = "include_metadata"
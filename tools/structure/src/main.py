@@ -1,20 +1,22 @@
 import json
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
+import launcher  # type: ignore [attr-defined]
+import requests
 from constants import SettingsKeys  # type: ignore [attr-defined]
 from unstract.sdk.constants import LogLevel, LogState, MetadataKey
 from unstract.sdk.index import Index
 from unstract.sdk.prompt import PromptTool
 from unstract.sdk.tool.base import BaseTool
-from unstract.sdk.tool.entrypoint import ToolEntrypoint
 from unstract.sdk.utils import ToolUtils
 from unstract.sdk.utils.common_utils import CommonUtils
 
 
-class StructureTool(BaseTool):
+class StructureTool(launcher.ResultFileMixin, BaseTool):
     def validate(self, input_file: str, settings: dict[str, Any]) -> None:
         pass
 
@@ -73,6 +75,9 @@ class StructureTool(BaseTool):
             self.get_env_or_die(SettingsKeys.EXECUTION_RUN_DATA_FOLDER)
         )
         run_id = CommonUtils.generate_uuid()
+        # When each document was indexed by doc ID, tells the prompt service
+        # how long writes to the vector DB might still be in flight
+        index_markers: dict[str, dict[str, float]] = {}
         # TODO : Resolve and pass log events ID
         payload = {
             SettingsKeys.RUN_ID: run_id,
@@ -81,6 +86,7 @@ class StructureTool(BaseTool):
             SettingsKeys.TOOL_ID: tool_id,
             SettingsKeys.FILE_HASH: file_hash,
             SettingsKeys.FILE_NAME: file_name,
+            SettingsKeys.INDEX_MARKERS: index_markers,
         }
         # TODO: Need to split extraction and indexing
         # to avoid unwanted indexing
@@ -98,7 +104,7 @@ class StructureTool(BaseTool):
             self.stream_log("Function 'process_text' is not found")
 
         if tool_settings[SettingsKeys.ENABLE_SINGLE_PASS_EXTRACTION]:
-            index.index(
+            doc_id = index.index(
                 tool_id=tool_id,
                 embedding_instance_id=tool_settings[SettingsKeys.EMBEDDING],
                 vector_db_instance_id=tool_settings[SettingsKeys.VECTOR_DB],
@@ -113,6 +119,7 @@ class StructureTool(BaseTool):
                 enable_highlight=enable_highlight,
                 process_text=process_text,
             )
+            index_markers[doc_id] = {SettingsKeys.INDEXED_AT: time.time()}
             if summarize_as_source:
                 summarize_file_hash = self._summarize_and_index(
                     tool_id=tool_id,
@@ -121,6 +128,7 @@ class StructureTool(BaseTool):
                     responder=responder,
                     outputs=outputs,
                     index=index,
+                    index_markers=index_markers,
                     usage_kwargs=usage_kwargs,
                     enable_highlight=enable_highlight,
                 )
@@ -136,7 +144,7 @@ class StructureTool(BaseTool):
                 reindex = True
                 for output in outputs:
                     if reindex or not summarize_as_source:
-                        index.index(
+                        doc_id = index.index(
                             tool_id=tool_metadata[SettingsKeys.TOOL_ID],
                             embedding_instance_id=output[SettingsKeys.EMBEDDING],
                             vector_db_instance_id=output[SettingsKeys.VECTOR_DB],
@@ -151,6 +159,7 @@ class StructureTool(BaseTool):
                             enable_highlight=enable_highlight,
                             process_text=process_text,
                         )
+                        index_markers[doc_id] = {SettingsKeys.INDEXED_AT: time.time()}
 
                     if summarize_as_source:
                         summarize_file_hash = self._summarize_and_index(
@@ -160,6 +169,7 @@ class StructureTool(BaseTool):
                             responder=responder,
                             outputs=outputs,
                             index=index,
+                            index_markers=index_markers,
                             usage_kwargs=usage_kwargs,
                         )
                         payload[SettingsKeys.OUTPUTS] = outputs
@@ -187,9 +197,7 @@ class StructureTool(BaseTool):
                     pass
 
             self.stream_log("Fetching responses for prompts...")
-            prompt_service_resp = responder.answer_prompt(
-                payload=payload,
-            )
+            prompt_service_resp = self._answer_prompt(payload=payload)
 
         # TODO: Make use of dataclasses
         if prompt_service_resp[SettingsKeys.STATUS] != SettingsKeys.OK:
@@ -238,6 +246,83 @@ class StructureTool(BaseTool):
             self.stream_error_and_exit(f"Error encoding JSON: {e}")
         self.write_tool_result(data=structured_output_dict)
 
+    def _answer_prompt(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Fetches answers like `PromptTool.answer_prompt`, streamed by the
+        prompt service as each prompt is answered and shown in the GUI as
+        they arrive.
+
+        Args:
+            payload (dict[str, Any]): Prompts to answer and their settings
+
+        Returns:
+            dict[str, Any]: Status of the request with its structured output
+                or error
+        """
+        prompt_host = self.get_env_or_die(SettingsKeys.PROMPT_HOST).rstrip("/")
+        prompt_port = self.get_env_or_die(SettingsKeys.PROMPT_PORT)
+        platform_key = self.get_env_or_die(SettingsKeys.PLATFORM_SERVICE_API_KEY)
+        result: dict[str, Any] = {
+            SettingsKeys.STATUS: "ERROR",
+            SettingsKeys.ERROR: "",
+            SettingsKeys.STRUCTURE_OUTPUT: "",
+        }
+        answers: dict[str, Any] = {}
+        try:
+            with requests.post(
+                url=f"{prompt_host}:{prompt_port}/{SettingsKeys.ANSWER_PROMPT}",
+                json=payload,
+                headers={
+                    "Authorization": f"Bearer {platform_key}",
+                    "Accept": SettingsKeys.NDJSON,
+                },
+                stream=True,
+            ) as response:
+                if not response.ok:
+                    try:
+                        result[SettingsKeys.ERROR] = response.json().get(
+                            SettingsKeys.ERROR, response.reason
+                        )
+                    except ValueError:
+                        result[SettingsKeys.ERROR] = response.reason
+                    return result
+                # Prompt services not streaming answers respond once with all
+                if response.headers.get("content-type") == "application/json":
+                    result[SettingsKeys.STATUS] = SettingsKeys.OK
+                    result[SettingsKeys.STRUCTURE_OUTPUT] = response.text
+                    return result
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    frame = json.loads(line)
+                    frame_type = frame.get(SettingsKeys.TYPE)
+                    if frame_type == SettingsKeys.ANSWER:
+                        answers.update(frame[SettingsKeys.OUTPUT])
+                        self.stream_log(
+                            f"Answered prompt '{frame[SettingsKeys.PROMPT_KEY]}'"
+                        )
+                        output_log = (
+                            f"### Parsed output:\n"
+                            f"```json\n{json.dumps(answers)}\n```\n\n"
+                        )
+                        self.stream_update(output_log, state=LogState.OUTPUT_UPDATE)
+                    elif frame_type == SettingsKeys.ERROR:
+                        result[SettingsKeys.ERROR] = frame.get(SettingsKeys.ERROR, "")
+                        return result
+                    else:
+                        result[SettingsKeys.STATUS] = SettingsKeys.OK
+                        result[SettingsKeys.STRUCTURE_OUTPUT] = json.dumps(
+                            {
+                                SettingsKeys.METADATA: frame[SettingsKeys.METADATA],
+                                SettingsKeys.OUTPUT: frame[SettingsKeys.OUTPUT],
+                            }
+                        )
+                        return result
+        except requests.RequestException as e:
+            result[SettingsKeys.ERROR] = str(e)
+            return result
+        result[SettingsKeys.ERROR] = "Prompt service ended without a response"
+        return result
+
     def _summarize_and_index(
         self,
         tool_id: str,
@@ -246,6 +331,7 @@ class StructureTool(BaseTool):
         responder: PromptTool,
         outputs: dict[str, Any],
         index: Index,
+        index_markers: dict[str, dict[str, float]],
         usage_kwargs: dict[Any, Any] = {},
         enable_highlight: bool = False,
     ) -> str:
@@ -259,6 +345,8 @@ class StructureTool(BaseTool):
             responder (PromptTool): Instance of a tool used to generate the summary.
             outputs (dict[str, Any]): Dictionary containing prompt details.
             index (Index): Instance used to index the summarized content.
+            index_markers (dict[str, dict[str, float]]): Records when the
+                summarized content was indexed
 
         Returns:
             str: The hash of the summarized file.
@@ -311,7 +399,7 @@ class StructureTool(BaseTool):
         summarize_file_hash: str = ToolUtils.get_hash_from_file(
             file_path=summarize_file_path
         )
-        index.index(
+        doc_id = index.index(
             tool_id=tool_id,
             embedding_instance_id=embedding_instance_id,
             vector_db_instance_id=vector_db_instance_id,
@@ -323,10 +411,10 @@ class StructureTool(BaseTool):
             usage_kwargs=usage_kwargs,
             enable_highlight=enable_highlight,
         )
+        index_markers[doc_id] = {SettingsKeys.INDEXED_AT: time.time()}
         return summarize_file_hash
 
 
 if __name__ == "__main__":
     args = sys.argv[1:]
-    tool = StructureTool.from_tool_args(args=args)
-    ToolEntrypoint.launch(tool=tool, args=args)
+    launcher.launch(tool_class=StructureTool, args=args)
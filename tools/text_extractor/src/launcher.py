@@ -0,0 +1,81 @@
+import argparse
+import json
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+from unstract.sdk.tool.base import BaseTool
+from unstract.sdk.tool.entrypoint import ToolEntrypoint
+
+
+class LaunchKey:
+    RESULT_FILE = "TOOL_RESULT_FILE"
+    TOOL_DATA_DIR = "TOOL_DATA_DIR"
+
+
+# Command that streams all the metadata of the tool in a single record
+METADATA_COMMAND = "METADATA"
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config")
+# Metadata keys and the config files they are read from
+METADATA_FILES = {
+    "spec": "spec.json",
+    "properties": "properties.json",
+    "variables": "runtime_variables.json",
+    "icon": "icon.svg",
+}
+
+
+class ResultFileMixin:
+    """Commits the result of a run to the file named in `TOOL_RESULT_FILE`
+    under `TOOL_DATA_DIR`, instead of streaming it along with the logs.
+
+    The result is written to a temporary file and renamed into place, so
+    readers never see a partial result.
+    """
+
+    def stream_result(self, result: dict[str, Any], **kwargs: Any) -> None:
+        result_file = os.environ.get(LaunchKey.RESULT_FILE)
+        if not result_file:
+            super().stream_result(result, **kwargs)  # type: ignore [misc]
+            return
+        result_path = os.path.join(os.environ[LaunchKey.TOOL_DATA_DIR], result_file)
+        temp_path = f"{result_path}.{os.getpid()}.part"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(result, file)
+        os.replace(temp_path, result_path)
+
+
+def launch(tool_class: type[BaseTool], args: list[str]) -> None:
+    """Runs a tool through the SDK entrypoint.
+
+    The METADATA command is answered from the config files of the tool
+    without creating it, other commands are handled by the SDK.
+
+    Args:
+        tool_class (type[BaseTool]): Tool to run
+        args (list[str]): Command line arguments of the tool
+    """
+    if _get_command(args) == METADATA_COMMAND:
+        _stream_metadata()
+        return
+    tool = tool_class.from_tool_args(args=args)
+    ToolEntrypoint.launch(tool=tool, args=args)
+
+
+def _get_command(args: list[str]) -> Optional[str]:
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--command", type=str.upper)
+    parsed_args, _ = parser.parse_known_args(args)
+    command: Optional[str] = parsed_args.command
+    return command
+
+
+def _stream_metadata() -> None:
+    """Streams the spec, properties, variables and icon of the tool in one
+    record, so that they are read with a single container run."""
+    record: dict[str, Any] = {"type": METADATA_COMMAND}
+    for key, file_name in METADATA_FILES.items():
+        with open(os.path.join(CONFIG_DIR, file_name), encoding="utf-8") as file:
+            record[key] = file.read() if key == "icon" else json.load(file)
+    record["emitted_at"] = datetime.now().isoformat()
+    print(json.dumps(record), flush=True)
@@ -3,13 +3,13 @@ import sys
 from pathlib import Path
 from typing import Any
 
+import launcher  # type: ignore
 from unstract.sdk.constants import LogState, MetadataKey
 from unstract.sdk.tool.base import BaseTool
-from unstract.sdk.tool.entrypoint import ToolEntrypoint
 from unstract.sdk.x2txt import TextExtractionResult, X2Text
 
 
-class TextExtractor(BaseTool):
+class TextExtractor(launcher.ResultFileMixin, BaseTool):
 
     def validate(self, input_file: str, settings: dict[str, Any]) -> None:
         """Validate the input file and settings.
@@ -100,5 +100,4 @@ class TextExtractor(BaseTool):
 
 if __name__ == "__main__":
     args = sys.argv[1:]
-    tool = TextExtractor.from_tool_args(args=args)
-    ToolEntrypoint.launch(tool=tool, args=args)
+    launcher.launch(tool_class=TextExtractor, args=args)
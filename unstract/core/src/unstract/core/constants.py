@@ -10,6 +10,7 @@ class LogFieldName:
 class LogEventArgument:
     EVENT = "event"
     MESSAGE = "message"
+    MESSAGES = "messages"
     USER_SESSION_ID = "user_session_id"
 
 
@@ -1,11 +1,14 @@
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from kombu import Connection
 
-from unstract.core.constants import LogEventArgument, LogProcessingTask
+from unstract.core.constants import LogEventArgument, LogFieldName, LogProcessingTask
 
 
 class LogPublisher:
@@ -92,12 +95,16 @@ class LogPublisher:
 
     @classmethod
     def _get_task_message(
-        cls, user_session_id: str, event: str, message: Any
+        cls,
+        user_session_id: str,
+        event: str,
+        message: Any,
+        message_key: str = LogEventArgument.MESSAGE,
     ) -> dict[str, Any]:
 
         task_kwargs = {
             LogEventArgument.EVENT: event,
-            LogEventArgument.MESSAGE: message,
+            message_key: message,
             LogEventArgument.USER_SESSION_ID: user_session_id,
         }
         task_message = {
@@ -140,3 +147,132 @@ class LogPublisher:
             logging.error(f"Failed to publish '{channel_id}' <= {payload}: {e}")
             return False
         return True
+
+    @classmethod
+    def publish_batch(cls, channel_id: str, payloads: list[dict[str, Any]]) -> bool:
+        """Publish messages of a channel to the queue as a single task."""
+        try:
+            with cls.kombu_conn.Producer(serializer="json") as producer:
+                event = f"logs:{channel_id}"
+                task_message = cls._get_task_message(
+                    user_session_id=channel_id,
+                    event=event,
+                    message=payloads,
+                    message_key=LogEventArgument.MESSAGES,
+                )
+                headers = cls._get_task_header(LogProcessingTask.TASK_NAME)
+                producer.publish(
+                    body=task_message,
+                    exchange="",
+                    headers=headers,
+                    routing_key=LogProcessingTask.QUEUE_NAME,
+                    compression=None,
+                    retry=True,
+                )
+                logging.debug(f"Published {len(payloads)} messages to '{channel_id}'")
+        except Exception as e:
+            logging.error(
+                f"Failed to publish {len(payloads)} messages to '{channel_id}': {e}"
+            )
+            return False
+        return True
+
+
+class BufferedLogPublisher:
+    """Publishes log messages in batches from a background thread.
+
+    Messages are buffered per channel and a channel's buffer is published as
+    a single task once it holds `batch_size` messages or every
+    `flush_interval` seconds. Callers never wait on the broker. DEBUG logs
+    over `debug_rate_limit` per second for an execution are dropped.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        debug_rate_limit: int = 0,
+        max_queue_size: int = 10000,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.debug_rate_limit = debug_rate_limit
+        # Items are (channel, payload) or (channel, event) for flush requests
+        self._queue: queue.Queue[tuple[str, Union[dict[str, Any], threading.Event]]] = (
+            queue.Queue(maxsize=max_queue_size)
+        )
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        # Start of the current second and count of DEBUG logs, by execution
+        self._debug_counts: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        threading.Thread(
+            target=self._publish_buffers, name="log-publisher", daemon=True
+        ).start()
+
+    def publish(self, channel_id: str, payload: dict[str, Any]) -> None:
+        """Queues a message to be published to a channel."""
+        if self._is_rate_limited(channel_id, payload):
+            return
+        try:
+            self._queue.put_nowait((channel_id, payload))
+        except queue.Full:
+            logging.warning(f"Log queue is full, dropped message for '{channel_id}'")
+
+    def flush(self, channel_id: str, timeout: Optional[float] = None) -> bool:
+        """Waits for the messages queued for a channel to be published.
+
+        Returns:
+            bool: False if the messages were not published within the timeout
+        """
+        flushed = threading.Event()
+        self._queue.put((channel_id, flushed))
+        return flushed.wait(timeout)
+
+    def _is_rate_limited(self, channel_id: str, payload: dict[str, Any]) -> bool:
+        if not self.debug_rate_limit or payload.get("level") != "DEBUG":
+            return False
+        execution_id = payload.get(LogFieldName.EXECUTION_ID) or channel_id
+        now = time.monotonic()
+        with self._lock:
+            window_start, count = self._debug_counts.get(execution_id, (now, 0))
+            if now - window_start >= 1:
+                window_start, count = now, 0
+            self._debug_counts[execution_id] = (window_start, count + 1)
+        return count >= self.debug_rate_limit
+
+    def _publish_buffers(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                channel_id, item = self._queue.get(
+                    timeout=max(0, next_flush - time.monotonic())
+                )
+            except queue.Empty:
+                channel_id, item = None, None
+            if isinstance(item, threading.Event):
+                self._publish_buffer(channel_id)
+                item.set()
+            elif item is not None:
+                buffer = self._buffers.setdefault(channel_id, [])
+                buffer.append(item)
+                if len(buffer) >= self.batch_size:
+                    self._publish_buffer(channel_id)
+            if time.monotonic() >= next_flush:
+                for buffered_channel_id in list(self._buffers):
+                    self._publish_buffer(buffered_channel_id)
+                self._remove_stale_debug_counts()
+                next_flush = time.monotonic() + self.flush_interval
+
+    def _publish_buffer(self, channel_id: str) -> None:
+        payloads = self._buffers.pop(channel_id, None)
+        if payloads:
+            LogPublisher.publish_batch(channel_id, payloads)
+
+    def _remove_stale_debug_counts(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._debug_counts = {
+                execution_id: (window_start, count)
+                for execution_id, (window_start, count) in self._debug_counts.items()
+                if now - window_start < 1
+            }
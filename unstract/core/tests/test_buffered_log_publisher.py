@@ -0,0 +1,114 @@
+import threading
+import unittest
+from unittest import mock
+
+from unstract.core.constants import LogFieldName
+from unstract.core.pubsub_helper import BufferedLogPublisher, LogPublisher
+
+
+def log(message: str, level: str = "INFO", execution_id: str = "exec-1") -> dict:
+    return {"level": level, "log": message, LogFieldName.EXECUTION_ID: execution_id}
+
+
+class BufferedLogPublisherTests(unittest.TestCase):
+    def setUp(self):
+        self.published: list[tuple[str, list[dict]]] = []
+        self.published_event = threading.Event()
+
+        def publish_batch(channel_id, payloads):
+            self.published.append((channel_id, payloads))
+            self.published_event.set()
+            return True
+
+        patcher = mock.patch.object(
+            LogPublisher, "publish_batch", side_effect=publish_batch
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_publish_full_batch(self):
+        publisher = BufferedLogPublisher(batch_size=2, flush_interval=60)
+        publisher.publish("channel", log("first"))
+        publisher.publish("channel", log("second"))
+
+        self.assertTrue(self.published_event.wait(5))
+        self.assertEqual(self.published, [("channel", [log("first"), log("second")])])
+
+    def test_publish_on_flush_interval(self):
+        publisher = BufferedLogPublisher(batch_size=100, flush_interval=0.05)
+        publisher.publish("channel", log("first"))
+
+        self.assertTrue(self.published_event.wait(5))
+        self.assertEqual(self.published, [("channel", [log("first")])])
+
+    def test_flush_publishes_buffered_messages(self):
+        publisher = BufferedLogPublisher(batch_size=100, flush_interval=60)
+        publisher.publish("channel", log("first"))
+        publisher.publish("other", log("other"))
+
+        self.assertTrue(publisher.flush("channel", timeout=5))
+        # Only the flushed channel is published
+        self.assertEqual(self.published, [("channel", [log("first")])])
+
+    def test_flush_without_messages(self):
+        publisher = BufferedLogPublisher(batch_size=100, flush_interval=60)
+
+        self.assertTrue(publisher.flush("channel", timeout=5))
+        self.assertEqual(self.published, [])
+
+    def test_debug_rate_limit(self):
+        publisher = BufferedLogPublisher(
+            batch_size=100, flush_interval=60, debug_rate_limit=2
+        )
+        with mock.patch("time.monotonic", return_value=0):
+            for index in range(4):
+                publisher.publish("channel", log(f"debug {index}", level="DEBUG"))
+            publisher.publish("channel", log("info"))
+            publisher.publish(
+                "channel", log("other", level="DEBUG", execution_id="exec-2")
+            )
+
+        self.assertTrue(publisher.flush("channel", timeout=5))
+        self.assertEqual(
+            self.published,
+            [
+                (
+                    "channel",
+                    [
+                        log("debug 0", level="DEBUG"),
+                        log("debug 1", level="DEBUG"),
+                        log("info"),
+                        log("other", level="DEBUG", execution_id="exec-2"),
+                    ],
+                )
+            ],
+        )
+
+    def test_debug_rate_limit_window(self):
+        publisher = BufferedLogPublisher(
+            batch_size=100, flush_interval=60, debug_rate_limit=1
+        )
+        # The publishing thread reads the same clock
+        with mock.patch("time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            publisher.publish("channel", log("first", level="DEBUG"))
+            monotonic.return_value = 0.5
+            publisher.publish("channel", log("dropped", level="DEBUG"))
+            # A new window starts a second later
+            monotonic.return_value = 1
+            publisher.publish("channel", log("next", level="DEBUG"))
+
+        self.assertTrue(publisher.flush("channel", timeout=5))
+        self.assertEqual(
+            self.published,
+            [
+                (
+                    "channel",
+                    [log("first", level="DEBUG"), log("next", level="DEBUG")],
+                )
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
+import copy
 import logging
-from typing import Any, Optional
+import os
+import threading
+from typing import Any, ClassVar, Optional
 
-from unstract.tool_registry.constants import PropKey
+from unstract.tool_registry.constants import PropKey, ToolJsonField
 from unstract.tool_registry.dto import Tool, ToolMeta
 from unstract.tool_registry.exceptions import (
     DuplicateURLException,
@@ -9,12 +12,41 @@ from unstract.tool_registry.exceptions import (
     RegistryNotFound,
 )
 from unstract.tool_registry.tool_utils import ToolUtils
+from unstract.tool_sandbox.constants import ToolCommandKey
 from unstract.tool_sandbox.tool_sandbox import ToolSandbox
 
 logger = logging.getLogger(__name__)
 
+# Inode, modification time and size of a file, None if it doesn't exist
+FileStamp = Optional[tuple[int, int, int]]
+
+
+class ToolsSnapshot:
+    """Tools loaded from the tool JSONs, with the stamps of the files they
+    were loaded from.
+
+    Args:
+        stamps (tuple[FileStamp, ...]): Stamps of the tool JSONs
+        tools (dict[str, dict[str, Any]]): Tool configurations by tool UID
+    """
+
+    def __init__(
+        self, stamps: tuple[FileStamp, ...], tools: dict[str, dict[str, Any]]
+    ) -> None:
+        self.stamps = stamps
+        self.tools = tools
+        self.tool_objects: dict[str, Tool] = {
+            tool_uid: Tool.from_dict(tool_uid, data)
+            for tool_uid, data in tools.items()
+            if data.get(ToolJsonField.PROPERTIES) or data.get(ToolJsonField.SPEC)
+        }
+
 
 class ToolRegistryHelper:
+    # Tools of the process by the paths of the tool JSONs they're loaded from
+    _snapshots: ClassVar[dict[tuple[str, ...], ToolsSnapshot]] = {}
+    _snapshot_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         registry: str,
@@ -153,6 +185,24 @@ class ToolRegistryHelper:
             return {}
         return variables
 
+    def get_tool_metadata(self, tool_meta: ToolMeta) -> Optional[dict[str, Any]]:
+        """Get spec, properties, icon and variables from docker in one run.
+
+        Args:
+            tool_meta (ToolMeta): _description_
+
+        Returns:
+            Optional[dict[str, Any]]: Metadata of the tool, None if the image
+            doesn't support fetching them together
+        """
+        tool_sandbox = ToolSandbox(
+            workflow_id="",
+            tool_guid="",
+            image_name=tool_meta.image_name,
+            image_tag=tool_meta.tag,
+        )
+        return tool_sandbox.get_metadata()
+
     def get_tool_data_by_image_url(self, image_url: str) -> Tool:
         """get_tool_data_by_image_url from docker.
 
@@ -166,10 +216,18 @@ class ToolRegistryHelper:
             ToolData: _description_
         """
         tool_metadata = ToolUtils.get_tool_meta_from_tool_url(registry_tool=image_url)
-        spec = self.get_tool_spec(tool_meta=tool_metadata)
-        properties = self.get_tool_properties(tool_meta=tool_metadata)
-        icon = self.get_tool_icon(tool_meta=tool_metadata)
-        variables = self.get_tool_variables(tool_meta=tool_metadata)
+        metadata = self.get_tool_metadata(tool_meta=tool_metadata)
+        if metadata and metadata[ToolCommandKey.PROPERTIES]:
+            spec = metadata[ToolCommandKey.SPEC]
+            properties = metadata[ToolCommandKey.PROPERTIES]
+            icon = metadata[ToolCommandKey.ICON]
+            variables = metadata[ToolCommandKey.VARIABLES]
+        else:
+            # Images built before the METADATA command are run per command
+            spec = self.get_tool_spec(tool_meta=tool_metadata)
+            properties = self.get_tool_properties(tool_meta=tool_metadata)
+            icon = self.get_tool_icon(tool_meta=tool_metadata)
+            variables = self.get_tool_variables(tool_meta=tool_metadata)
         tool_unique_id = self.get_tool_unique_id(properties)
         if not tool_unique_id:
             raise InvalidToolProperties(
@@ -292,9 +350,46 @@ class ToolRegistryHelper:
         """get_all_tools_from_disk.
 
         Returns:
-            dict[str, Any]: _description_
+            dict[str, Any]: Copy of the tools shared by the process
         """
-        tool_files = [self.private_tools_file, self.public_tools_file]
+        tools: dict[str, dict[str, Any]] = copy.deepcopy(
+            self.get_tools_snapshot().tools
+        )
+        return tools
+
+    def get_tools_snapshot(self) -> ToolsSnapshot:
+        """Get the tools of the tool JSONs, loading them again only when a
+        file is replaced or modified since they were last loaded.
+
+        Returns:
+            ToolsSnapshot: Tools shared by the process
+        """
+        tool_files = (self.private_tools_file, self.public_tools_file)
+        stamps = tuple(self._get_file_stamp(tool_file) for tool_file in tool_files)
+        snapshot = self._snapshots.get(tool_files)
+        if snapshot and snapshot.stamps == stamps:
+            return snapshot
+        with self._snapshot_lock:
+            snapshot = self._snapshots.get(tool_files)
+            if snapshot and snapshot.stamps == stamps:
+                return snapshot
+            snapshot = ToolsSnapshot(
+                stamps=stamps, tools=self._load_tools_from_disk(tool_files)
+            )
+            self._snapshots[tool_files] = snapshot
+        return snapshot
+
+    @staticmethod
+    def _get_file_stamp(file_path: str) -> FileStamp:
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load_tools_from_disk(
+        self, tool_files: tuple[str, ...]
+    ) -> dict[str, dict[str, Any]]:
         tools = {}
         for tool_file in tool_files:
             try:
@@ -319,10 +414,11 @@ class ToolRegistryHelper:
             tool_uid (str): _description_
 
         Returns:
-            dict[str, Any]: _description_
+            dict[str, Any]: Copy of the tool shared by the process
         """
-        tools: dict[str, Any] = self.get_all_tools_from_disk()
-        tool_data: dict[str, Any] = tools.pop(tool_uid, {})
+        tool_data: dict[str, Any] = copy.deepcopy(
+            self.get_tools_snapshot().tools.get(tool_uid, {})
+        )
         return tool_data
 
     def add_new_tool_to_disk_by_uid(self, uuid: str, data: dict[str, Any]) -> None:
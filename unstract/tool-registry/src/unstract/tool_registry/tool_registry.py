@@ -1,8 +1,9 @@
+import copy
 import logging
 import os
 from typing import Any, Optional
 
-from unstract.tool_registry.constants import PropKey, ToolJsonField, ToolKey
+from unstract.tool_registry.constants import PropKey, ToolKey
 from unstract.tool_registry.dto import Tool
 from unstract.tool_registry.exceptions import InvalidToolURLException
 from unstract.tool_registry.helper import ToolRegistryHelper
@@ -104,15 +105,8 @@ class ToolRegistry:
         Returns:
             list[dict[str, Any]]: Tools
         """
-        tools_list: list[Tool] = []
-        tools = self.helper.get_all_tools_from_disk()
-        for tool_uid, data in tools.items():
-            properties = data.get(ToolJsonField.PROPERTIES)
-            spec = data.get(ToolJsonField.SPEC)
-            if not properties and not spec:
-                continue
-            tool_data = Tool.from_dict(tool_uid, data)
-            tools_list.append(tool_data)
+        tools = self.helper.get_tools_snapshot().tool_objects
+        tools_list: list[Tool] = copy.deepcopy(list(tools.values()))
         return tools_list
 
     def get_tool_by_uid(self, uid: str) -> Optional[Tool]:
@@ -124,15 +118,11 @@ class ToolRegistry:
         Returns:
             list[dict[str, Any]]: Tools
         """
-        tools = self.helper.get_all_tools_from_disk()
-        data = tools.get(uid)
-        if not data:
+        tool = self.helper.get_tools_snapshot().tool_objects.get(uid)
+        if not tool:
             return None
-        properties = data.get(ToolJsonField.PROPERTIES)
-        spec = data.get(ToolJsonField.SPEC)
-        if not properties and not spec:
-            return None
-        tool_data = Tool.from_dict(uid, data)
+        # Copied since callers update the spec of the tool in place
+        tool_data: Tool = copy.deepcopy(tool)
         return tool_data
 
     def fetch_tools_descriptions(
@@ -266,8 +256,8 @@ class ToolRegistry:
         Returns:
             dict[str, Any]: _description_
         """
-        tools = self.helper.get_all_tools_from_disk()
-        spec: dict[str, Any] = tools.get(tool_id, {}).get("spec", {})
+        tool = self.helper.get_tool_data_by_id(tool_uid=tool_id)
+        spec: dict[str, Any] = tool.get("spec", {})
         return spec
 
     def get_tool_properties_by_tool_id(self, tool_id: str) -> dict[str, Any]:
@@ -279,8 +269,8 @@ class ToolRegistry:
         Returns:
             dict[str, Any]: _description_
         """
-        tools = self.helper.get_all_tools_from_disk()
-        properties: dict[str, Any] = tools.get(tool_id, {}).get("properties", {})
+        tool = self.helper.get_tool_data_by_id(tool_uid=tool_id)
+        properties: dict[str, Any] = tool.get("properties", {})
         return properties
 
     def get_tool_icon_by_tool_id(self, tool_id: str) -> dict[str, Any]:
@@ -292,8 +282,8 @@ class ToolRegistry:
         Returns:
             dict[str, Any]: _description_
         """
-        tools = self.helper.get_all_tools_from_disk()
-        icon: dict[str, Any] = tools.get(tool_id, {}).get("icon", {})
+        tool = self.helper.get_tool_data_by_id(tool_uid=tool_id)
+        icon: dict[str, Any] = tool.get("icon", {})
         return icon
 
     def is_image_available(self, tool_id: str) -> bool:
@@ -1,4 +1,6 @@
+import json
 import os
+import tempfile
 import unittest
 from typing import Any
 from unittest.mock import patch
@@ -7,6 +9,7 @@ import yaml
 from unstract.tool_registry import ToolRegistry
 from unstract.tool_registry.constants import Command
 from unstract.tool_registry.helper import ToolRegistryHelper
+from unstract.tool_registry.tool_utils import ToolUtils
 
 
 # TODO: Fix breaking test cases due to code restructuring
@@ -108,5 +111,94 @@ class TestToolRegistry(unittest.TestCase):
         self.assertEqual(len(tools2), 2)
 
 
+class TestToolsSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.private_tools_file = os.path.join(directory.name, "private_tools.json")
+        self.public_tools_file = os.path.join(directory.name, "public_tools.json")
+        registry_file = os.path.join(directory.name, "registry.yaml")
+        with open(registry_file, "w") as yaml_file:
+            yaml.dump({"tools": []}, yaml_file)
+        self.write_tools(self.private_tools_file, "private_tools", "0.0.1")
+        self.write_tools(self.public_tools_file, "public_tools", "0.0.1")
+
+        snapshots = patch.dict(ToolRegistryHelper._snapshots, clear=True)
+        snapshots.start()
+        self.addCleanup(snapshots.stop)
+        load = patch.object(
+            ToolUtils,
+            "get_all_tools_from_disk",
+            wraps=ToolUtils.get_all_tools_from_disk,
+        )
+        self.mock_load = load.start()
+        self.addCleanup(load.stop)
+        self.helper = ToolRegistryHelper(
+            registry=registry_file,
+            private_tools_file=self.private_tools_file,
+            public_tools_file=self.public_tools_file,
+        )
+
+    @staticmethod
+    def write_tools(file_path: str, tool_uid: str, tool_version: str) -> None:
+        tools = {
+            tool_uid: {
+                "properties": {"functionName": tool_uid, "toolVersion": tool_version},
+                "spec": {"title": tool_uid},
+            }
+        }
+        with open(file_path, "w") as json_file:
+            json.dump(tools, json_file)
+
+    def test_not_reloaded_when_unchanged(self) -> None:
+        snapshot = self.helper.get_tools_snapshot()
+
+        self.assertIs(self.helper.get_tools_snapshot(), snapshot)
+        self.assertEqual(self.mock_load.call_count, 2)
+        self.assertEqual(set(snapshot.tools), {"private_tools", "public_tools"})
+
+    def test_reloaded_when_size_changes(self) -> None:
+        self.helper.get_tools_snapshot()
+        self.write_tools(self.private_tools_file, "private_tools", "0.0.10")
+
+        tools = self.helper.get_tools_snapshot().tools
+        self.assertEqual(tools["private_tools"]["properties"]["toolVersion"], "0.0.10")
+        self.assertEqual(self.mock_load.call_count, 4)
+
+    def test_reloaded_when_modified(self) -> None:
+        self.helper.get_tools_snapshot()
+        stat = os.stat(self.public_tools_file)
+        self.write_tools(self.public_tools_file, "public_tools", "0.0.2")
+        os.utime(self.public_tools_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        tools = self.helper.get_tools_snapshot().tools
+        self.assertEqual(tools["public_tools"]["properties"]["toolVersion"], "0.0.2")
+        self.assertEqual(self.mock_load.call_count, 4)
+
+    def test_reloaded_when_replaced(self) -> None:
+        self.helper.get_tools_snapshot()
+        stat = os.stat(self.public_tools_file)
+        # Same size and modification time, only the inode differs
+        replacement = f"{self.public_tools_file}.new"
+        self.write_tools(replacement, "public_tools", "0.0.3")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, self.public_tools_file)
+
+        tools = self.helper.get_tools_snapshot().tools
+        self.assertEqual(tools["public_tools"]["properties"]["toolVersion"], "0.0.3")
+        self.assertEqual(self.mock_load.call_count, 4)
+
+    def test_tools_returned_as_copies(self) -> None:
+        tools = self.helper.get_all_tools_from_disk()
+        tools["public_tools"]["properties"]["toolVersion"] = "modified"
+        tool = self.helper.get_tool_data_by_id(tool_uid="private_tools")
+        tool["spec"]["title"] = "modified"
+
+        tools = self.helper.get_all_tools_from_disk()
+        self.assertEqual(tools["public_tools"]["properties"]["toolVersion"], "0.0.1")
+        self.assertEqual(tools["private_tools"]["spec"]["title"], "private_tools")
+        self.assertEqual(self.mock_load.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
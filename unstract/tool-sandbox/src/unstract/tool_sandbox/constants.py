@@ -5,6 +5,17 @@ class UnstractWorker:
     PROPERTIES_API_ENDPOINT = "/container/properties"
     ICON_API_ENDPOINT = "/container/icon"
     VARIABLES_API_ENDPOINT = "/container/variables"
+    METADATA_API_ENDPOINT = "/container/metadata"
+    # Responses of a worker without capacity for a run
+    RUN_REJECTED_STATUS_CODES = (429, 503)
+
+
+class ToolSandboxEnv:
+    RUNNER_HOST = "UNSTRACT_RUNNER_HOST"
+    RUNNER_PORT = "UNSTRACT_RUNNER_PORT"
+    RUNNER_API_TIMEOUT = "UNSTRACT_RUNNER_API_TIMEOUT"
+    RUNNER_API_RETRY_COUNT = "UNSTRACT_RUNNER_API_RETRY_COUNT"
+    RUNNER_API_BACKOFF_FACTOR = "UNSTRACT_RUNNER_API_BACKOFF_FACTOR"
 
 
 class ToolCommandKey:
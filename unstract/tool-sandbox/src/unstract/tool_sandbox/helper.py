@@ -1,10 +1,15 @@
 import json
 import logging
 import os
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Optional, Union
 
 import requests
-from unstract.tool_sandbox.constants import UnstractWorker
+from unstract.tool_sandbox.constants import ToolSandboxEnv, UnstractWorker
+from urllib3.exceptions import NewConnectionError
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +22,31 @@ class ToolSandboxHelper:
         execution_id: str,
         messaging_channel: str,
         environment_variables: dict[str, str],
+        execution_sub_dir: Optional[str] = None,
     ) -> None:
-        runner_host = os.environ.get("UNSTRACT_RUNNER_HOST")
-        runner_port = os.environ.get("UNSTRACT_RUNNER_PORT")
-        self.base_url = f"{runner_host}:{runner_port}{UnstractWorker.BASE_API_ENDPOINT}"
+        runner_hosts = os.environ.get(ToolSandboxEnv.RUNNER_HOST, "")
+        runner_port = os.environ.get(ToolSandboxEnv.RUNNER_PORT)
+        # Runs are spread across workers when several hosts are listed
+        self.base_urls = [
+            f"{runner_host.strip()}:{runner_port}{UnstractWorker.BASE_API_ENDPOINT}"
+            for runner_host in runner_hosts.split(",")
+        ]
+        self.base_url = random.choice(self.base_urls)
+        # Waits for a run to complete unless a read timeout is set
+        run_timeout = os.environ.get(ToolSandboxEnv.RUNNER_API_TIMEOUT)
+        self.run_timeout = float(run_timeout) if run_timeout else None
+        self.run_retry_count = int(
+            os.environ.get(ToolSandboxEnv.RUNNER_API_RETRY_COUNT, 5)
+        )
+        self.run_backoff_factor = float(
+            os.environ.get(ToolSandboxEnv.RUNNER_API_BACKOFF_FACTOR, 2)
+        )
         self.organization_id = str(organization_id)
         self.workflow_id = str(workflow_id)
         self.execution_id = str(execution_id)
         self.envs = environment_variables
         self.messaging_channel = str(messaging_channel)
+        self.execution_sub_dir = execution_sub_dir
 
     def convert_str_to_dict(self, data: Union[str, dict[str, Any]]) -> dict[str, Any]:
         if isinstance(data, str):
@@ -85,7 +106,6 @@ class ToolSandboxHelper:
         Returns:
             Optional[dict[str, Any]]: tool response
         """
-        url = f"{self.base_url}{UnstractWorker.RUN_API_ENDPOINT}"
         data = self.create_tool_request_data(
             run_id,
             image_name,
@@ -93,7 +113,14 @@ class ToolSandboxHelper:
             settings,
         )
 
-        response = requests.post(url, json=data)
+        try:
+            response = self._post_run_request(data)
+        except requests.ReadTimeout:
+            logger.error(
+                f"Error while calling tool {image_name}: run did not complete "
+                f"in {self.run_timeout} seconds"
+            )
+            return None
         result: Optional[dict[str, Any]] = None
         if response.status_code == 200:
             result = response.json()
@@ -108,6 +135,77 @@ class ToolSandboxHelper:
             )
         return result
 
+    def _post_run_request(self, data: dict[str, Any]) -> requests.Response:
+        """Posts a run to the workers, moving on to the next worker when one
+        can't be reached or has no capacity, and backing off once all of them
+        were tried.
+
+        Runs are not posted again after other connection errors, since the
+        worker might have started them.
+
+        Returns:
+            requests.Response: Response of the last worker tried
+        """
+        start = self.base_urls.index(self.base_url)
+        for attempt in range(self.run_retry_count + 1):
+            base_url = self.base_urls[(start + attempt) % len(self.base_urls)]
+            url = f"{base_url}{UnstractWorker.RUN_API_ENDPOINT}"
+            is_last_attempt = attempt == self.run_retry_count
+            retry_after = 0
+            try:
+                response = requests.post(url, json=data, timeout=(10, self.run_timeout))
+            except requests.ConnectionError as e:
+                if is_last_attempt or not self._is_worker_unreachable(e):
+                    raise
+                logger.warning(f"Error connecting to worker {base_url}: {e}")
+            else:
+                if (
+                    response.status_code not in UnstractWorker.RUN_REJECTED_STATUS_CODES
+                    or is_last_attempt
+                ):
+                    return response
+                logger.warning(
+                    f"Worker {base_url} rejected the run with status code "
+                    f"{response.status_code}: {response.text}"
+                )
+                retry_after = self._get_retry_after(response)
+            # Waits only once every worker was tried in this round
+            if (attempt + 1) % len(self.base_urls) == 0:
+                round_number = (attempt + 1) // len(self.base_urls)
+                time.sleep(
+                    max(retry_after, self.run_backoff_factor * 2 ** (round_number - 1))
+                )
+        return response
+
+    @staticmethod
+    def _is_worker_unreachable(error: requests.ConnectionError) -> bool:
+        """Checks if a run failed before reaching the worker, because the
+        connection timed out or was refused."""
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float:
+        """Gets the seconds to wait from the Retry-After header, which holds
+        either a number of seconds or an HTTP date."""
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return 0
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid Retry-After header: {retry_after}")
+            return 0
+        if not retry_at.tzinfo:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
     def create_tool_request_data(
         self,
         run_id: str,
@@ -125,5 +223,6 @@ class ToolSandboxHelper:
             "settings": settings,
             "envs": self.envs,
             "messaging_channel": self.messaging_channel,
+            "execution_sub_dir": self.execution_sub_dir,
         }
         return data
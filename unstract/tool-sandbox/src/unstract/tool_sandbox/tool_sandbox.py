@@ -16,6 +16,7 @@ class ToolSandbox:
         tool_instance_id: Optional[str] = None,
         environment_variables: dict[str, Any] = {},
         messaging_channel: Optional[str] = None,
+        execution_sub_dir: Optional[str] = None,
     ):
         """PLATFORM_SERVICE_API_KEY should be available in the environment."""
         self.messaging_channel = str(messaging_channel)
@@ -25,6 +26,7 @@ class ToolSandbox:
             execution_id=execution_id,
             messaging_channel=self.messaging_channel,
             environment_variables=environment_variables,
+            execution_sub_dir=execution_sub_dir,
         )
         self.tool_guid = tool_guid
         self.tool_instance_id = tool_instance_id
@@ -35,6 +37,9 @@ class ToolSandbox:
     def set_tool_instance_settings(self, tool_settings: dict[str, Any]) -> None:
         self.settings = tool_settings
 
+    def set_execution_sub_dir(self, execution_sub_dir: Optional[str]) -> None:
+        self.helper.execution_sub_dir = execution_sub_dir
+
     def get_tool_uid(self) -> str:
         return self.tool_guid
 
@@ -93,6 +98,34 @@ class ToolSandbox:
         )
         return result
 
+    def get_metadata(self) -> Optional[dict[str, Any]]:
+        """Gets the spec, properties, variables and icon of the tool with a
+        single run of its image.
+
+        Returns:
+            Optional[dict[str, Any]]: Metadata by `ToolCommandKey`, None if
+            the tool doesn't support the METADATA command
+        """
+        metadata = self.helper.make_get_request(
+            self.image_name,
+            self.image_tag,
+            UnstractWorker.METADATA_API_ENDPOINT,
+        )
+        if not metadata:
+            return None
+        return {
+            ToolCommandKey.SPEC: self.helper.convert_str_to_dict(
+                metadata.get(ToolCommandKey.SPEC) or {}
+            ),
+            ToolCommandKey.PROPERTIES: self.helper.convert_str_to_dict(
+                metadata.get(ToolCommandKey.PROPERTIES) or {}
+            ),
+            ToolCommandKey.VARIABLES: self.helper.convert_str_to_dict(
+                metadata.get(ToolCommandKey.VARIABLES) or {}
+            ),
+            ToolCommandKey.ICON: metadata.get(ToolCommandKey.ICON) or "",
+        }
+
     def run_tool(self, run_id: str) -> Optional[dict[str, Any]]:
         return self.helper.call_tool_handler(  # type: ignore
             run_id,
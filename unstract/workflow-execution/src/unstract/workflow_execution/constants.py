@@ -27,6 +27,7 @@ class WorkflowFileType:
     SOURCE = "SOURCE"
     INFILE = "INFILE"
     METADATA_JSON = "METADATA.json"
+    RESULT_JSON = "RESULT.json"
 
 
 class MetaDataKey:
@@ -18,19 +18,47 @@ logger = logging.getLogger(__name__)
 
 class ExecutionFileHandler:
     def __init__(
-        self, workflow_id: str, execution_id: str, organization_id: str
+        self,
+        workflow_id: str,
+        execution_id: str,
+        organization_id: str,
+        execution_sub_dir: Optional[str] = None,
     ) -> None:
         self.organization_id = organization_id
         self.workflow_id = workflow_id
         self.execution_id = execution_id
+        self.set_execution_sub_dir(execution_sub_dir)
+
+    def set_execution_sub_dir(self, execution_sub_dir: Optional[str]) -> None:
+        """Point the handler to a sub directory of the execution directory.
+
+        Args:
+            execution_sub_dir (Optional[str]): Directory under the execution
+                directory, None for the execution directory itself.
+        """
+        self.execution_sub_dir = execution_sub_dir
         self.execution_dir = self.create_execution_dir_path(
-            workflow_id, execution_id, organization_id
+            self.workflow_id,
+            self.execution_id,
+            self.organization_id,
+            execution_sub_dir=execution_sub_dir,
         )
         self.source_file = os.path.join(self.execution_dir, WorkflowFileType.SOURCE)
         self.infile = os.path.join(self.execution_dir, WorkflowFileType.INFILE)
         self.metadata_file = os.path.join(
             self.execution_dir, WorkflowFileType.METADATA_JSON
         )
+        self.result_file = os.path.join(
+            self.execution_dir, WorkflowFileType.RESULT_JSON
+        )
+
+    def remove_tool_result(self) -> None:
+        """Removes the result committed by the previous tool, so that it's
+        not mistaken for the result of the next one."""
+        try:
+            os.remove(self.result_file)
+        except FileNotFoundError:
+            pass
 
     def get_workflow_metadata(self) -> dict[str, Any]:
         """Get metadata for the workflow.
@@ -124,6 +152,7 @@ class ExecutionFileHandler:
         execution_id: str,
         organization_id: str,
         data_volume: Optional[str] = None,
+        execution_sub_dir: Optional[str] = None,
     ) -> str:
         """Create the directory path for storing execution-related files.
 
@@ -132,6 +161,8 @@ class ExecutionFileHandler:
         - execution_id (str): Identifier for the execution.
         - organization_id (Optional[str]):
             Identifier for the organization (default: None).
+        - execution_sub_dir (Optional[str]): Directory under the execution
+            directory, used by batches of a parallel execution (default: None).
 
         Returns:
         str: The directory path for the execution.
@@ -143,5 +174,7 @@ class ExecutionFileHandler:
         execution_dir = Path(
             data_volume, organization_id, str(workflow_id), str(execution_id)
         )
+        if execution_sub_dir:
+            execution_dir = execution_dir / execution_sub_dir
         execution_dir.mkdir(parents=True, exist_ok=True)
         return str(execution_dir)
@@ -82,7 +82,10 @@ class ToolsUtils:
         return tools
 
     def check_to_build(
-        self, tools: list[ToolInstance], execution_id: str
+        self,
+        tools: list[ToolInstance],
+        execution_id: str,
+        execution_sub_dir: Optional[str] = None,
     ) -> list[ToolSandbox]:
         """_summary_
 
@@ -96,6 +99,7 @@ class ToolsUtils:
             ]
         """
         tool_sandboxes: list[ToolSandbox] = []
+        tool_envs = self.get_tool_environment_variables()
         for tool_instance in tools:
             self.validate_tool_instance(tool_instance)
 
@@ -111,8 +115,6 @@ class ToolsUtils:
                 ),
             )
 
-            tool_envs = self.get_tool_environment_variables()
-            logger.info(f"Tool Environments are collected for tool {tool_uid}")
             image_name = tool_instance.image_name
             image_tag = tool_instance.image_tag
 
@@ -135,6 +137,7 @@ class ToolsUtils:
                 image_tag=image_tag,
                 environment_variables=tool_envs,
                 messaging_channel=self.messaging_channel,
+                execution_sub_dir=execution_sub_dir,
             )
             tool_sandbox.set_tool_instance_settings(tool_instance.metadata)
             tool_sandboxes.append(tool_sandbox)
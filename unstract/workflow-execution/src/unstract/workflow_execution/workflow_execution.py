@@ -45,9 +45,11 @@ class WorkflowExecutionService:
         tool_instances: list[ToolInstance],
         platform_service_api_key: str,
         ignore_processed_entities: bool = False,
+        execution_sub_dir: Optional[str] = None,
     ) -> None:
         self.organization_id = organization_id
         self.workflow_id = workflow_id
+        self.execution_sub_dir = execution_sub_dir
 
         self.tool_instances = tool_instances
         self.tool_utils = ToolsUtils(
@@ -69,6 +71,20 @@ class WorkflowExecutionService:
         self.messaging_channel = messaging_channel
         self.tool_utils.set_messaging_channel(messaging_channel)
 
+    def set_execution_sub_dir(self, execution_sub_dir: Optional[str]) -> None:
+        """Point the tools of the workflow to a sub directory of the execution
+        directory, letting files of an execution be run from their own
+        directories.
+
+        Args:
+            execution_sub_dir (Optional[str]): Directory under the execution
+                directory, None for the execution directory itself.
+        """
+        self.execution_sub_dir = execution_sub_dir
+        self.file_handler.set_execution_sub_dir(execution_sub_dir)
+        for tool_sandbox in self.tool_sandboxes:
+            tool_sandbox.set_execution_sub_dir(execution_sub_dir)
+
     def compile_workflow(self, execution_id: str) -> dict[str, Any]:
         """Compiling workflow Validating all steps and tool instances.
 
@@ -89,7 +105,10 @@ class WorkflowExecutionService:
         try:
             self.execution_id = str(execution_id)
             self.file_handler = ExecutionFileHandler(
-                self.workflow_id, self.execution_id, self.organization_id
+                self.workflow_id,
+                self.execution_id,
+                self.organization_id,
+                execution_sub_dir=self.execution_sub_dir,
             )
 
             logger.info(f"Execution {execution_id}: compilation completed")
@@ -124,7 +143,9 @@ class WorkflowExecutionService:
 
         try:
             self.tool_sandboxes = self.tool_utils.check_to_build(
-                tools=self.tool_instances, execution_id=self.execution_id
+                tools=self.tool_instances,
+                execution_id=self.execution_id,
+                execution_sub_dir=self.execution_sub_dir,
             )
 
             log_message = (
@@ -221,6 +242,7 @@ class WorkflowExecutionService:
                 message="Ready for execution",
                 component=tool_instance_id,
             )
+            self.file_handler.remove_tool_result()
             result = self.tool_utils.run_tool(run_id=run_id, tool_sandbox=sandbox)
             if result and result.get("error"):
                 raise ToolOutputNotFoundException(result.get("error"))
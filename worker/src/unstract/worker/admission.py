@@ -0,0 +1,210 @@
+import fcntl
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, Any, Optional
+
+from unstract.worker.constants import Env
+from unstract.worker.exception import RunRejectedException
+
+logger = logging.getLogger(__name__)
+
+
+class RunAdmission:
+    """Admission control for the tool runs of a worker.
+
+    At most `max_running` runs go on at a time, up to `max_queued` more wait
+    for a slot for `queue_timeout` seconds. Runs beyond that are rejected
+    with a 429, and runs arriving while the host is over its CPU load or
+    under its available memory limits are rejected with a 503. Callers can
+    back off and retry, or try another worker.
+
+    Run and queue slots are files locked in `lock_dir`, so the limits are
+    shared by all the processes of the worker (gunicorn `--workers`) and a
+    slot is released by the OS if its process dies.
+    """
+
+    # Seconds callers are asked to wait before retrying a rejected run
+    RETRY_AFTER_SEC = 5
+    # Seconds between attempts of a queued run to take a run slot
+    POLL_INTERVAL_SEC = 0.1
+    RUN_SLOT = "run"
+    QUEUE_SLOT = "queued"
+
+    def __init__(
+        self,
+        max_running: int,
+        max_queued: int,
+        queue_timeout: float,
+        max_cpu_load: float = 0,
+        min_memory_available: float = 0,
+        lock_dir: Optional[str] = None,
+    ) -> None:
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.max_cpu_load = max_cpu_load
+        self.min_memory_available = min_memory_available
+        self.lock_dir = lock_dir or os.path.join(
+            tempfile.gettempdir(), "unstract-worker-runs"
+        )
+        os.makedirs(self.lock_dir, exist_ok=True)
+
+    @staticmethod
+    def from_env() -> "RunAdmission":
+        return RunAdmission(
+            max_running=int(os.getenv(Env.MAX_CONCURRENT_RUNS, 0)),
+            max_queued=int(os.getenv(Env.MAX_QUEUED_RUNS, 0)),
+            queue_timeout=float(os.getenv(Env.RUN_QUEUE_TIMEOUT, 30)),
+            max_cpu_load=float(os.getenv(Env.RUN_ADMISSION_MAX_CPU_LOAD, 0)),
+            min_memory_available=float(
+                os.getenv(Env.RUN_ADMISSION_MIN_MEMORY_AVAILABLE, 0)
+            ),
+            lock_dir=os.getenv(Env.RUN_ADMISSION_LOCK_DIR),
+        )
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """Holds a run slot for the duration of a run.
+
+        Raises:
+            RunRejectedException: If the run is not admitted
+        """
+        overload = self._get_overload()
+        if overload:
+            raise RunRejectedException(
+                overload, status_code=503, retry_after=self.RETRY_AFTER_SEC
+            )
+        if self.max_running < 1:
+            yield
+            return
+
+        run_slot = self._lock_slot(self.RUN_SLOT, self.max_running)
+        if not run_slot:
+            queue_slot = self._lock_slot(self.QUEUE_SLOT, self.max_queued)
+            if not queue_slot:
+                raise RunRejectedException(
+                    "Worker is at capacity",
+                    status_code=429,
+                    retry_after=self.RETRY_AFTER_SEC,
+                )
+            try:
+                deadline = time.monotonic() + self.queue_timeout
+                while not run_slot and time.monotonic() < deadline:
+                    time.sleep(self.POLL_INTERVAL_SEC)
+                    run_slot = self._lock_slot(self.RUN_SLOT, self.max_running)
+            finally:
+                queue_slot.close()
+            if not run_slot:
+                raise RunRejectedException(
+                    "Timed out waiting for a run slot",
+                    status_code=429,
+                    retry_after=self.RETRY_AFTER_SEC,
+                )
+        try:
+            yield
+        finally:
+            run_slot.close()
+
+    def get_status(self) -> dict[str, Any]:
+        """Reports the capacity of the worker and the load of the host.
+
+        Runs are counted only when their number is limited.
+        """
+        running = self._count_locked_slots(self.RUN_SLOT, self.max_running)
+        queued = self._count_locked_slots(self.QUEUE_SLOT, self.max_queued)
+        return {
+            "running": running,
+            "queued": queued,
+            "max_running": self.max_running,
+            "max_queued": self.max_queued,
+            "cpu_load": self._get_cpu_load(),
+            "memory_available": self._get_memory_available(),
+            "accepting": not self._get_overload()
+            and (
+                self.max_running < 1
+                or running < self.max_running
+                or queued < self.max_queued
+            ),
+        }
+
+    @contextmanager
+    def _lock_slots(self) -> Iterator[None]:
+        """Keeps the slots from being taken while they are looked at."""
+        with open(os.path.join(self.lock_dir, "slots.lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _lock_slot(self, kind: str, count: int) -> Optional[IO[str]]:
+        """Locks the first free slot of a kind, the slot is released by
+        closing the returned file."""
+        with self._lock_slots():
+            for index in range(count):
+                slot = self._lock_slot_at(kind, index)
+                if slot:
+                    return slot
+        return None
+
+    def _lock_slot_at(self, kind: str, index: int) -> Optional[IO[str]]:
+        slot = open(os.path.join(self.lock_dir, f"{kind}-{index}.lock"), "a")
+        try:
+            fcntl.flock(slot, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            slot.close()
+            return None
+        return slot
+
+    def _count_locked_slots(self, kind: str, count: int) -> int:
+        locked = 0
+        with self._lock_slots():
+            for index in range(count):
+                slot = self._lock_slot_at(kind, index)
+                if slot:
+                    slot.close()
+                else:
+                    locked += 1
+        return locked
+
+    def _get_overload(self) -> Optional[str]:
+        if self.max_cpu_load > 0:
+            cpu_load = self._get_cpu_load()
+            if cpu_load is not None and cpu_load > self.max_cpu_load:
+                return f"CPU load {cpu_load:.2f} is over {self.max_cpu_load}"
+        if self.min_memory_available > 0:
+            memory_available = self._get_memory_available()
+            if (
+                memory_available is not None
+                and memory_available < self.min_memory_available
+            ):
+                return (
+                    f"Available memory {memory_available:.1f}% is under "
+                    f"{self.min_memory_available}%"
+                )
+        return None
+
+    @staticmethod
+    def _get_cpu_load() -> Optional[float]:
+        """Load average of the last minute per CPU."""
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _get_memory_available() -> Optional[float]:
+        """Percentage of the host's memory available, from /proc/meminfo."""
+        meminfo: dict[str, int] = {}
+        try:
+            with open("/proc/meminfo", encoding="utf-8") as file:
+                for line in file:
+                    key, value = line.split(":", 1)
+                    meminfo[key] = int(value.split()[0])
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unable to read memory info: {e}")
+            return None
+        if not meminfo.get("MemTotal") or "MemAvailable" not in meminfo:
+            return None
+        return meminfo["MemAvailable"] * 100 / meminfo["MemTotal"]
@@ -17,6 +17,16 @@ class ToolKey:
     TOOL_INSTANCE_ID = "tool_instance_id"
 
 
+class ToolCommand:
+    # Spec, properties, variables and icon of a tool in a single run
+    METADATA = "METADATA"
+
+
+class ToolResult:
+    # Tools commit the result of a run to this file in TOOL_DATA_DIR
+    FILE_NAME = "RESULT.json"
+
+
 class Env:
     TOOL_CONTAINER_NETWORK = "TOOL_CONTAINER_NETWORK"
     TOOL_CONTAINER_LABELS = "TOOL_CONTAINER_LABELS"
@@ -29,3 +39,20 @@ class Env:
     PRIVATE_REGISTRY_URL = "PRIVATE_REGISTRY_URL"
     LOG_LEVEL = "LOG_LEVEL"
     REMOVE_CONTAINER_ON_EXIT = "REMOVE_CONTAINER_ON_EXIT"
+    TOOL_CONTAINER_POOL_SIZE = "TOOL_CONTAINER_POOL_SIZE"
+    TOOL_CONTAINER_POOL_IDLE_TIMEOUT = "TOOL_CONTAINER_POOL_IDLE_TIMEOUT"
+    TOOL_CONTAINER_POOL_MAX_RUNS = "TOOL_CONTAINER_POOL_MAX_RUNS"
+    TOOL_RESULT_FILE = "TOOL_RESULT_FILE"
+    TOOL_REGISTRY_CONFIG_PATH = "TOOL_REGISTRY_CONFIG_PATH"
+    TOOL_IMAGE_REFRESH_INTERVAL = "TOOL_IMAGE_REFRESH_INTERVAL"
+    TOOL_IMAGE_PULL_WORKERS = "TOOL_IMAGE_PULL_WORKERS"
+    TOOL_METADATA_CACHE_SIZE = "TOOL_METADATA_CACHE_SIZE"
+    LOG_PUBLISH_BATCH_SIZE = "LOG_PUBLISH_BATCH_SIZE"
+    LOG_PUBLISH_FLUSH_INTERVAL = "LOG_PUBLISH_FLUSH_INTERVAL"
+    LOG_PUBLISH_DEBUG_RATE_LIMIT = "LOG_PUBLISH_DEBUG_RATE_LIMIT"
+    MAX_CONCURRENT_RUNS = "MAX_CONCURRENT_RUNS"
+    MAX_QUEUED_RUNS = "MAX_QUEUED_RUNS"
+    RUN_QUEUE_TIMEOUT = "RUN_QUEUE_TIMEOUT"
+    RUN_ADMISSION_MAX_CPU_LOAD = "RUN_ADMISSION_MAX_CPU_LOAD"
+    RUN_ADMISSION_MIN_MEMORY_AVAILABLE = "RUN_ADMISSION_MIN_MEMORY_AVAILABLE"
+    RUN_ADMISSION_LOCK_DIR = "RUN_ADMISSION_LOCK_DIR"
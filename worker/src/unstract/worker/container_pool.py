@@ -0,0 +1,257 @@
+import atexit
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from docker.errors import DockerException
+from docker.models.containers import Container
+from unstract.worker.constants import Env
+
+from docker import DockerClient
+from unstract.core.utilities import UnstractUtils
+
+# Image name, image tag and the execution directory mounted in the container
+PoolKey = tuple[str, str, str]
+
+
+@dataclass
+class PooledContainer:
+    """A long-lived tool container that runs tool commands through `docker
+    exec`."""
+
+    key: PoolKey
+    container: Container
+    # Entrypoint of the tool image, the tool commands are appended to it
+    entrypoint: list[str]
+    runs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def name(self) -> str:
+        return str(self.container.name)
+
+
+class ToolContainerPool:
+    """Pool of pre-started tool containers per image and execution directory.
+
+    A pooled container is created from the config of a one-off run, so it
+    mounts only the directory of that execution and is reused by the runs of
+    the same tool image on the files of the execution. It stays idle between
+    runs, each run execs the tool entrypoint in it. This saves creating,
+    starting and removing a container for every file and tool step.
+
+    Containers are recycled after `max_runs` runs, removed once idle for
+    `idle_timeout` seconds and checked to be running before being reused.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        idle_timeout: int,
+        max_runs: int,
+        logger: logging.Logger,
+    ) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_runs = max_runs
+        self.logger = logger
+        self.client = DockerClient.from_env()
+        self._idle: dict[PoolKey, list[PooledContainer]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._evictor = threading.Thread(
+            target=self._evict_idle_containers, name="tool-pool-evictor", daemon=True
+        )
+        self._evictor.start()
+        atexit.register(self.shutdown)
+
+    @staticmethod
+    def from_env(logger: logging.Logger) -> Optional["ToolContainerPool"]:
+        """Creates the pool when enabled with `TOOL_CONTAINER_POOL_SIZE`."""
+        max_size = int(os.getenv(Env.TOOL_CONTAINER_POOL_SIZE, 0))
+        if max_size < 1:
+            return None
+        return ToolContainerPool(
+            max_size=max_size,
+            idle_timeout=int(os.getenv(Env.TOOL_CONTAINER_POOL_IDLE_TIMEOUT, 60)),
+            max_runs=int(os.getenv(Env.TOOL_CONTAINER_POOL_MAX_RUNS, 100)),
+            logger=logger,
+        )
+
+    @staticmethod
+    def get_key(
+        image_name: str, image_tag: str, container_config: dict[str, Any]
+    ) -> Optional[PoolKey]:
+        """Gets the key of the containers a run can be pooled in.
+
+        Args:
+            image_name (str): Name of the tool image
+            image_tag (str): Tag of the tool image
+            container_config (dict[str, Any]): Config of a one-off container
+                for the run
+
+        Returns:
+            Optional[PoolKey]: None if the run has no execution directory
+            mounted, such runs are not pooled
+        """
+        mounts = container_config.get("mounts") or []
+        if len(mounts) != 1:
+            return None
+        return image_name, image_tag, mounts[0]["source"]
+
+    def acquire(
+        self, key: PoolKey, container_config: dict[str, Any]
+    ) -> Optional[PooledContainer]:
+        """Gets an idle container for the image and execution directory,
+        starting a new one if the pool has room left.
+
+        Args:
+            key (PoolKey): Key returned by `get_key()` for the run
+            container_config (dict[str, Any]): Config of a one-off container
+                for the run, the pooled container is derived from it
+
+        Returns:
+            Optional[PooledContainer]: Container reserved for the caller, None
+            if the pool is full
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                pooled = idle.pop() if idle else None
+                if not pooled:
+                    if self._size >= self.max_size:
+                        return None
+                    self._size += 1
+                    break
+            if self._is_healthy(pooled):
+                return pooled
+            self._remove(pooled)
+
+        try:
+            return self._start_container(key, container_config)
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+
+    def release(self, pooled: PooledContainer, healthy: bool = True) -> None:
+        """Returns a container to the pool after a run.
+
+        Args:
+            pooled (PooledContainer): Container returned by `acquire()`
+            healthy (bool): False if the run left the container in an unknown
+                state, it's removed instead of being reused
+        """
+        pooled.runs += 1
+        pooled.last_used = time.monotonic()
+        if not healthy or pooled.runs >= self.max_runs or self._stopped.is_set():
+            self._remove(pooled)
+            return
+        with self._lock:
+            self._idle.setdefault(pooled.key, []).append(pooled)
+
+    def run(
+        self, pooled: PooledContainer, command: list[str], environment: dict[str, Any]
+    ) -> Iterator[str]:
+        """Runs a tool command in a pooled container.
+
+        Args:
+            pooled (PooledContainer): Container returned by `acquire()`
+            command (list[str]): Arguments to the tool entrypoint
+            environment (dict[str, Any]): Environment of the run
+
+        Yields:
+            Iterator[str]: Output of the run line by line
+        """
+        exec_id = self.client.api.exec_create(
+            pooled.container.id,
+            cmd=pooled.entrypoint + command,
+            environment={key: str(value) for key, value in environment.items()},
+        )["Id"]
+        pending = ""
+        for chunk in self.client.api.exec_start(exec_id, stream=True):
+            pending += chunk.decode(errors="replace")
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.strip()
+        if pending.strip():
+            yield pending.strip()
+        exit_code = self.client.api.exec_inspect(exec_id).get("ExitCode")
+        if exit_code:
+            raise DockerException(
+                f"Tool run in container {pooled.name} exited with code {exit_code}"
+            )
+
+    def shutdown(self) -> None:
+        """Removes all idle containers, busy ones are removed on release."""
+        self._stopped.set()
+        with self._lock:
+            idle = [pooled for pool in self._idle.values() for pooled in pool]
+            self._idle.clear()
+        for pooled in idle:
+            self._remove(pooled)
+
+    def _start_container(
+        self, key: PoolKey, container_config: dict[str, Any]
+    ) -> PooledContainer:
+        image_name, image_tag, _ = key
+        image = self.client.images.get(container_config["image"])
+        entrypoint = image.attrs["Config"]["Entrypoint"]
+        config = {
+            **container_config,
+            "name": UnstractUtils.build_tool_container_name(
+                tool_image=image_name,
+                tool_version=image_tag,
+                run_id=f"pool-{uuid.uuid4()}",
+            ),
+            # Kept alive doing nothing, tools are run with `docker exec`
+            "entrypoint": ["sleep", "infinity"],
+            "command": [],
+            "auto_remove": False,
+            # Set for each run instead
+            "environment": {},
+        }
+        container = self.client.containers.run(**config)
+        self.logger.info(f"Started pooled tool container {container.name}")
+        return PooledContainer(key=key, container=container, entrypoint=entrypoint)
+
+    def _is_healthy(self, pooled: PooledContainer) -> bool:
+        try:
+            pooled.container.reload()
+        except DockerException as e:
+            self.logger.warning(f"Pooled container {pooled.name} is not found: {e}")
+            return False
+        return pooled.container.status == "running"
+
+    def _remove(self, pooled: PooledContainer) -> None:
+        with self._lock:
+            self._size -= 1
+        try:
+            pooled.container.remove(force=True)
+            self.logger.info(f"Removed pooled tool container {pooled.name}")
+        except DockerException as e:
+            self.logger.warning(f"Failed to remove pooled container {pooled.name}: {e}")
+
+    def evict_idle_containers(self) -> None:
+        """Removes the containers idle for more than `idle_timeout` seconds."""
+        expired: list[PooledContainer] = []
+        deadline = time.monotonic() - self.idle_timeout
+        with self._lock:
+            for key, idle in self._idle.items():
+                expired.extend(pooled for pooled in idle if pooled.last_used < deadline)
+                self._idle[key] = [
+                    pooled for pooled in idle if pooled.last_used >= deadline
+                ]
+        for pooled in expired:
+            self._remove(pooled)
+
+    def _evict_idle_containers(self) -> None:
+        interval = max(1, min(self.idle_timeout, 60))
+        while not self._stopped.wait(interval):
+            self.evict_idle_containers()
@@ -2,3 +2,11 @@ class ToolRunException(Exception):
     def __init__(self, message):
         self.message = message
         super().__init__(self.message)
+
+
+class RunRejectedException(Exception):
+    def __init__(self, message: str, status_code: int, retry_after: int) -> None:
+        self.message = message
+        self.status_code = status_code
+        self.retry_after = retry_after
+        super().__init__(self.message)
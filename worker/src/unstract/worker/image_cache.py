@@ -0,0 +1,201 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import yaml
+from docker.errors import DockerException
+from unstract.worker.constants import Env
+
+from docker import DockerClient
+
+
+class RegistryFile:
+    REGISTRY = "registry.yaml"
+    PUBLIC_TOOLS = "public_tools.json"
+    PRIVATE_TOOLS = "private_tools.json"
+
+
+class ToolImageCache:
+    """Keeps the images of the tool registry pulled and remembers their
+    resolved IDs.
+
+    Images listed in the registry are pulled concurrently at start so that
+    the first run of a tool does not wait on a pull. Runs of cached images
+    skip looking the image up in the daemon. A background refresher pulls the
+    cached tags again to pick up images pushed under an existing tag.
+    """
+
+    def __init__(
+        self,
+        registry_path: str,
+        refresh_interval: int,
+        max_workers: int,
+        logger: logging.Logger,
+    ) -> None:
+        self.registry_path = registry_path
+        self.refresh_interval = refresh_interval
+        self.max_workers = max_workers
+        self.logger = logger
+        self.client = DockerClient.from_env()
+        # Image IDs by image name and tag
+        self._images: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    @staticmethod
+    def from_env(logger: logging.Logger) -> Optional["ToolImageCache"]:
+        """Creates the cache when `TOOL_REGISTRY_CONFIG_PATH` is set."""
+        registry_path = os.getenv(Env.TOOL_REGISTRY_CONFIG_PATH)
+        if not registry_path:
+            return None
+        return ToolImageCache(
+            registry_path=registry_path,
+            refresh_interval=int(os.getenv(Env.TOOL_IMAGE_REFRESH_INTERVAL, 3600)),
+            max_workers=int(os.getenv(Env.TOOL_IMAGE_PULL_WORKERS, 4)),
+            logger=logger,
+        )
+
+    def start(self) -> None:
+        """Pulls the registry's images and keeps them refreshed in the
+        background."""
+        threading.Thread(
+            target=self._warm_up_and_refresh, name="tool-image-cache", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def get_image(self, image_name: str, image_tag: str) -> Optional[str]:
+        """Gets a pulled image.
+
+        Args:
+            image_name (str): Name of the image
+            image_tag (str): Tag of the image
+
+        Returns:
+            Optional[str]: ID of the image last pulled for the tag, so that a
+            run is not affected by a tag moved meanwhile. None if it is not
+            cached yet
+        """
+        with self._lock:
+            return self._images.get((image_name, image_tag))
+
+    def add_image(self, image_name: str, image_tag: str) -> None:
+        """Caches an image pulled outside the cache, e.g. of a tool missing
+        from the registry, so that it's refreshed along with the others."""
+        image_name_with_tag = f"{image_name}:{image_tag}"
+        try:
+            image_id = self.client.images.get(image_name_with_tag).id
+        except DockerException as e:
+            self.logger.warning(f"Failed to cache image {image_name_with_tag}: {e}")
+            return
+        with self._lock:
+            self._images[(image_name, image_tag)] = image_id
+
+    def get_registry_images(self) -> set[tuple[str, str]]:
+        """Lists the images of the tools in the registry files.
+
+        Returns:
+            set[tuple[str, str]]: Name and tag of each image
+        """
+        images: set[tuple[str, str]] = set()
+        registry = self._load_file(RegistryFile.REGISTRY) or {}
+        for tool_url in registry.get("tools") or []:
+            # Tool URLs look like docker:<image_name>[:<image_tag>]
+            scheme, _, image = tool_url.partition(":")
+            if scheme != "docker" or not image:
+                continue
+            images.add(self.split_image(image))
+        for tools_file in (RegistryFile.PUBLIC_TOOLS, RegistryFile.PRIVATE_TOOLS):
+            tools = self._load_file(tools_file) or {}
+            for tool in tools.values():
+                if tool.get("image_name"):
+                    images.add((tool["image_name"], tool.get("image_tag") or "latest"))
+        return images
+
+    @staticmethod
+    def split_image(image: str) -> tuple[str, str]:
+        """Splits an image into its name and tag, the image name might have
+        a registry host with a port like `localhost:5000/tool`.
+
+        Args:
+            image (str): Image name with an optional tag
+
+        Returns:
+            tuple[str, str]: Name and tag of the image, `latest` if untagged
+        """
+        image_name, separator, image_tag = image.rpartition(":")
+        if not separator or "/" in image_tag:
+            return image, "latest"
+        return image_name, image_tag
+
+    def refresh(self, images: set[tuple[str, str]]) -> None:
+        """Pulls images concurrently, recording their current IDs.
+
+        Args:
+            images (set[tuple[str, str]]): Name and tag of each image
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for image_name, image_tag in images:
+                executor.submit(self._pull, image_name, image_tag)
+
+    def _warm_up_and_refresh(self) -> None:
+        images = self.get_registry_images()
+        self.logger.info(f"Pulling {len(images)} tool images from the registry")
+        self.refresh(images)
+        if self.refresh_interval < 1:
+            return
+        while not self._stopped.wait(self.refresh_interval):
+            with self._lock:
+                cached = set(self._images)
+            self.refresh(cached | self.get_registry_images())
+
+    def _pull(self, image_name: str, image_tag: str) -> None:
+        image_name_with_tag = f"{image_name}:{image_tag}"
+        try:
+            self.client.api.pull(
+                repository=image_name,
+                tag=image_tag,
+                auth_config=self._get_auth_config(image_name),
+            )
+            image_id = self.client.images.get(image_name_with_tag).id
+        except (DockerException, OSError) as e:
+            self.logger.warning(f"Failed to pull image {image_name_with_tag}: {e}")
+            return
+        with self._lock:
+            previous_id = self._images.get((image_name, image_tag))
+            self._images[(image_name, image_tag)] = image_id
+        if previous_id and previous_id != image_id:
+            self.logger.info(f"Image {image_name_with_tag} updated to {image_id}")
+
+    def _get_auth_config(self, image_name: str) -> Optional[dict[str, str]]:
+        registry_url = os.getenv(Env.PRIVATE_REGISTRY_URL)
+        credential_path = os.getenv(Env.PRIVATE_REGISTRY_CREDENTIAL_PATH)
+        if not (
+            registry_url and credential_path and image_name.startswith(registry_url)
+        ):
+            return None
+        with open(credential_path, encoding="utf-8") as file:
+            password = file.read()
+        return {
+            "username": os.getenv(Env.PRIVATE_REGISTRY_USERNAME, ""),
+            "password": password,
+        }
+
+    def _load_file(self, file_name: str) -> Optional[dict[str, Any]]:
+        file_path = os.path.join(self.registry_path, file_name)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, encoding="utf-8") as file:
+                if file_name.endswith(".yaml"):
+                    data = yaml.safe_load(file)
+                else:
+                    data = json.load(file)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            self.logger.warning(f"Failed to read tool registry file {file_path}: {e}")
+            return None
+        return data if isinstance(data, dict) else None
@@ -1,14 +1,44 @@
+import os
 from typing import Any, Optional
 
 from flask import Blueprint, Flask, Response, abort, jsonify, request
 from unstract.worker import UnstractWorker
+from unstract.worker.admission import RunAdmission
+from unstract.worker.constants import Env
+from unstract.worker.container_pool import ToolContainerPool
+from unstract.worker.exception import RunRejectedException
+from unstract.worker.image_cache import ToolImageCache
+from unstract.worker.metadata_cache import ToolMetadataCache
 from unstract.worker.utils import Utils
 
+from unstract.core.pubsub_helper import BufferedLogPublisher
+
 app = Flask(__name__)
 
 log_level = Utils.get_log_level()
 app.logger.setLevel(log_level.value)
 
+# Pulls the images of the tool registry ahead of their first run, if enabled
+image_cache = ToolImageCache.from_env(app.logger)
+if image_cache:
+    image_cache.start()
+
+# Metadata of tool images by image ID, to inspect each image only once
+metadata_cache = ToolMetadataCache.from_env(app.logger)
+
+# Publishes the logs of tool runs in batches, off the threads following them
+log_publisher = BufferedLogPublisher(
+    batch_size=int(os.getenv(Env.LOG_PUBLISH_BATCH_SIZE, 100)),
+    flush_interval=float(os.getenv(Env.LOG_PUBLISH_FLUSH_INTERVAL, 0.5)),
+    debug_rate_limit=int(os.getenv(Env.LOG_PUBLISH_DEBUG_RATE_LIMIT, 0)),
+)
+
+# Warm tool containers shared by the runs handled by this process, if enabled
+container_pool = ToolContainerPool.from_env(app.logger)
+
+# Limits the runs going on and waiting, across the processes of the worker
+run_admission = RunAdmission.from_env()
+
 # Define a Blueprint with a root URL path
 bp = Blueprint("v1", __name__, url_prefix="/v1/api")
 
@@ -19,6 +49,12 @@ def get_items() -> Response:
     return jsonify({"message": "pong!!!"})
 
 
+# Reports capacity, to spread runs across workers
+@bp.route("/status", methods=["GET"])
+def get_status() -> Response:
+    return jsonify(run_admission.get_status())
+
+
 # Run container
 @bp.route("container/run", methods=["POST"])
 def run_container() -> Optional[Any]:
@@ -32,17 +68,34 @@ def run_container() -> Optional[Any]:
     settings = data["settings"]
     envs = data["envs"]
     messaging_channel = data["messaging_channel"]
-
-    worker = UnstractWorker(image_name, image_tag, app)
-    result = worker.run_container(
-        organization_id=organization_id,
-        workflow_id=workflow_id,
-        execution_id=execution_id,
-        run_id=run_id,
-        settings=settings,
-        envs=envs,
-        messaging_channel=messaging_channel,
-    )
+    execution_sub_dir = data.get("execution_sub_dir")
+
+    try:
+        with run_admission.admit():
+            worker = UnstractWorker(
+                image_name,
+                image_tag,
+                app,
+                image_cache=image_cache,
+                log_publisher=log_publisher,
+                container_pool=container_pool,
+            )
+            result = worker.run_container(
+                organization_id=organization_id,
+                workflow_id=workflow_id,
+                execution_id=execution_id,
+                run_id=run_id,
+                settings=settings,
+                envs=envs,
+                messaging_channel=messaging_channel,
+                execution_sub_dir=execution_sub_dir,
+            )
+    except RunRejectedException as e:
+        app.logger.warning(f"Execution ID: {execution_id}, run rejected: {e.message}")
+        response = jsonify({"error": e.message})
+        response.status_code = e.status_code
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response
     return result
 
 
@@ -51,17 +104,17 @@ def run_command(command: str) -> Optional[Any]:
     """Endpoint which will can execute any of the below commands.
 
     Args:
-        command (str): AnyOf("properties","spec","variables","icon")
+        command (str): AnyOf("properties","spec","variables","icon","metadata")
 
     Returns:
         Optional[Any]: Response from container for the specific command.
                        Returns None in case of error.
     """
-    if command not in {"properties", "spec", "variables", "icon"}:
+    if command not in {"properties", "spec", "variables", "icon", "metadata"}:
         abort(404)
     image_name = request.args.get("image_name")
     image_tag = request.args.get("image_tag")
-    worker = UnstractWorker(image_name, image_tag, app)
+    worker = UnstractWorker(image_name, image_tag, app, metadata_cache=metadata_cache)
 
     return worker.run_command(command)
 
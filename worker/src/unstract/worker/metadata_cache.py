@@ -0,0 +1,69 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from docker.errors import DockerException
+from unstract.worker.constants import Env
+
+from docker import DockerClient
+
+
+class ToolMetadataCache:
+    """Metadata of tool images by image ID.
+
+    The ID of an image is the digest of its config, so it changes whenever the
+    image is rebuilt. Metadata cached for an ID never goes stale and tools are
+    inspected again only when their image changes, however often the tool
+    registry is reloaded. The least recently used entries are dropped beyond
+    `max_size` images.
+
+    Images of tools which do not answer METADATA are cached with empty
+    metadata, so that they are not run again to find that out.
+    """
+
+    def __init__(self, max_size: int, logger: logging.Logger) -> None:
+        self.max_size = max_size
+        self.logger = logger
+        self.client = DockerClient.from_env()
+        self._metadata: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_env(logger: logging.Logger) -> Optional["ToolMetadataCache"]:
+        """Creates the cache unless disabled with `TOOL_METADATA_CACHE_SIZE`."""
+        max_size = int(os.getenv(Env.TOOL_METADATA_CACHE_SIZE, 256))
+        if max_size < 1:
+            return None
+        return ToolMetadataCache(max_size=max_size, logger=logger)
+
+    def get_image_id(self, image_name_with_tag: str) -> Optional[str]:
+        """Gets the ID of a local image.
+
+        Args:
+            image_name_with_tag (str): Image name with tag
+
+        Returns:
+            Optional[str]: ID of the image, None if it can't be inspected
+        """
+        try:
+            image_id: str = self.client.images.get(image_name_with_tag).id
+        except DockerException as e:
+            self.logger.warning(f"Failed to inspect image {image_name_with_tag}: {e}")
+            return None
+        return image_id
+
+    def get(self, image_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            metadata = self._metadata.get(image_id)
+            if metadata is not None:
+                self._metadata.move_to_end(image_id)
+        return metadata
+
+    def set(self, image_id: str, metadata: dict[str, Any]) -> None:
+        with self._lock:
+            self._metadata[image_id] = metadata
+            self._metadata.move_to_end(image_id)
+            while len(self._metadata) > self.max_size:
+                self._metadata.popitem(last=False)
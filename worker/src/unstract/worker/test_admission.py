@@ -0,0 +1,113 @@
+import multiprocessing
+import threading
+import time
+
+import pytest
+from unstract.worker.admission import RunAdmission
+from unstract.worker.exception import RunRejectedException
+
+
+@pytest.fixture
+def admission(tmp_path):
+    return RunAdmission(
+        max_running=1, max_queued=1, queue_timeout=5, lock_dir=str(tmp_path)
+    )
+
+
+def hold_run(lock_dir, running, done):
+    admission = RunAdmission(
+        max_running=1, max_queued=0, queue_timeout=0, lock_dir=lock_dir
+    )
+    with admission.admit():
+        running.set()
+        done.wait(10)
+
+
+def test_admit_without_limit(tmp_path):
+    """Test runs are not limited when max_running is 0."""
+    admission = RunAdmission(
+        max_running=0, max_queued=0, queue_timeout=0, lock_dir=str(tmp_path)
+    )
+    with admission.admit(), admission.admit():
+        assert admission.get_status()["accepting"]
+
+
+def test_admit_over_capacity(admission):
+    """Test runs beyond the running and queued limits are rejected."""
+
+    def queued_run():
+        with admission.admit():
+            pass
+
+    with admission.admit():
+        assert admission.get_status()["running"] == 1
+        thread = threading.Thread(target=queued_run)
+        thread.start()
+        # Wait for the queued run to take its queue slot
+        for _ in range(50):
+            if admission.get_status()["queued"] == 1:
+                break
+            time.sleep(0.1)
+        status = admission.get_status()
+        assert status["queued"] == 1
+        assert not status["accepting"]
+
+        with pytest.raises(RunRejectedException) as error:
+            with admission.admit():
+                pass
+        assert error.value.status_code == 429
+        assert error.value.retry_after == RunAdmission.RETRY_AFTER_SEC
+    thread.join(5)
+
+    # Slots are released once the runs complete
+    status = admission.get_status()
+    assert (status["running"], status["queued"]) == (0, 0)
+    assert status["accepting"]
+
+
+def test_admit_queue_timeout(tmp_path):
+    """Test a queued run is rejected when no slot frees up in time."""
+    admission = RunAdmission(
+        max_running=1, max_queued=1, queue_timeout=0.2, lock_dir=str(tmp_path)
+    )
+    with admission.admit():
+        with pytest.raises(RunRejectedException, match="Timed out"):
+            with admission.admit():
+                pass
+    assert admission.get_status()["queued"] == 0
+
+
+def test_admit_shared_by_processes(tmp_path):
+    """Test slots held by another process count against the limits."""
+    admission = RunAdmission(
+        max_running=1, max_queued=0, queue_timeout=0, lock_dir=str(tmp_path)
+    )
+    context = multiprocessing.get_context("spawn")
+    running, done = context.Event(), context.Event()
+    process = context.Process(target=hold_run, args=(str(tmp_path), running, done))
+    process.start()
+    try:
+        assert running.wait(30)
+        assert admission.get_status()["running"] == 1
+        with pytest.raises(RunRejectedException):
+            with admission.admit():
+                pass
+    finally:
+        done.set()
+        process.join(10)
+
+    # The slot is free once the other process is done
+    with admission.admit():
+        assert admission.get_status()["running"] == 1
+
+
+def test_admit_overloaded(admission, mocker):
+    """Test runs are rejected with a 503 while the host is overloaded."""
+    admission.max_cpu_load = 0.8
+    mocker.patch.object(RunAdmission, "_get_cpu_load", return_value=0.9)
+
+    with pytest.raises(RunRejectedException) as error:
+        with admission.admit():
+            pass
+    assert error.value.status_code == 503
+    assert not admission.get_status()["accepting"]
@@ -0,0 +1,154 @@
+import logging
+import time
+
+import pytest
+from docker.errors import DockerException
+from unstract.worker.container_pool import ToolContainerPool
+
+POOL_MODULE = "unstract.worker.container_pool"
+EXECUTION_DIR = "/workflow_data/org/workflow/execution"
+
+
+def get_container_config(execution_dir=EXECUTION_DIR):
+    return {
+        "name": "tool-run",
+        "image": "tool:1.0",
+        "command": ["--command", "RUN"],
+        "auto_remove": True,
+        "environment": {"TOOL_DATA_DIR": "/data"},
+        "mounts": [{"type": "bind", "source": execution_dir, "target": "/data"}],
+    }
+
+
+@pytest.fixture
+def docker_client(mocker):
+    docker_client = mocker.patch(f"{POOL_MODULE}.DockerClient").from_env.return_value
+    docker_client.images.get.return_value.attrs = {
+        "Config": {"Entrypoint": ["python", "main.py"]}
+    }
+
+    def run_container(**config):
+        container = mocker.MagicMock(status="running")
+        container.name = config["name"]
+        return container
+
+    docker_client.containers.run.side_effect = run_container
+    return docker_client
+
+
+@pytest.fixture
+def pool(docker_client):
+    pool = ToolContainerPool(
+        max_size=2, idle_timeout=60, max_runs=3, logger=logging.getLogger("test")
+    )
+    yield pool
+    pool.shutdown()
+
+
+def acquire(pool, execution_dir=EXECUTION_DIR):
+    config = get_container_config(execution_dir)
+    key = ToolContainerPool.get_key("tool", "1.0", config)
+    return pool.acquire(key=key, container_config=config)
+
+
+def test_get_key():
+    """Test runs are pooled by image and mounted execution directory."""
+    config = get_container_config()
+
+    assert ToolContainerPool.get_key("tool", "1.0", config) == (
+        "tool",
+        "1.0",
+        EXECUTION_DIR,
+    )
+    assert ToolContainerPool.get_key("tool", "1.0", {**config, "mounts": []}) is None
+
+
+def test_started_container_mounts_execution_dir(pool, docker_client):
+    """Test pooled containers mount only the directory of the execution."""
+    pooled = acquire(pool)
+
+    config = docker_client.containers.run.call_args.kwargs
+    assert config["mounts"] == get_container_config()["mounts"]
+    assert config["entrypoint"] == ["sleep", "infinity"]
+    assert config["environment"] == {}
+    assert not config["auto_remove"]
+    assert pooled.entrypoint == ["python", "main.py"]
+
+
+def test_container_reused(pool, docker_client):
+    """Test a released container is reused for the same execution only."""
+    pooled = acquire(pool)
+    pool.release(pooled)
+
+    assert acquire(pool) is pooled
+    other = acquire(pool, execution_dir=f"{EXECUTION_DIR}-other")
+    assert other is not pooled
+    assert docker_client.containers.run.call_count == 2
+
+
+def test_pool_full(pool):
+    """Test no container is handed out beyond the maximum size."""
+    acquire(pool)
+    acquire(pool)
+
+    assert acquire(pool) is None
+
+
+def test_container_recycled(pool, docker_client):
+    """Test containers are replaced after the maximum runs."""
+    pooled = acquire(pool)
+    for _ in range(3):
+        pool.release(pooled)
+        if pooled.runs < 3:
+            assert acquire(pool) is pooled
+
+    pooled.container.remove.assert_called_once_with(force=True)
+    assert acquire(pool) is not pooled
+
+
+def test_unhealthy_container_replaced(pool):
+    """Test containers not running or failed runs are not reused."""
+    pooled = acquire(pool)
+    pool.release(pooled)
+    pooled.container.status = "exited"
+    assert acquire(pool) is not pooled
+
+    failed = acquire(pool, execution_dir=f"{EXECUTION_DIR}-other")
+    pool.release(failed, healthy=False)
+    failed.container.remove.assert_called_once_with(force=True)
+
+
+def test_idle_containers_evicted(pool):
+    """Test containers idle beyond the timeout are removed."""
+    idle = acquire(pool)
+    recent = acquire(pool, execution_dir=f"{EXECUTION_DIR}-other")
+    pool.release(idle)
+    pool.release(recent)
+    idle.last_used = time.monotonic() - 120
+
+    pool.evict_idle_containers()
+
+    idle.container.remove.assert_called_once_with(force=True)
+    recent.container.remove.assert_not_called()
+    assert acquire(pool, execution_dir=f"{EXECUTION_DIR}-other") is recent
+
+
+def test_run(pool, docker_client):
+    """Test the output of a run is split into lines and failures raised."""
+    pooled = acquire(pool)
+    docker_client.api.exec_create.return_value = {"Id": "exec"}
+    docker_client.api.exec_start.return_value = [b'{"type": "LOG"}\n{"ty', b'pe": 1}']
+    docker_client.api.exec_inspect.return_value = {"ExitCode": 0}
+
+    lines = list(pool.run(pooled, command=["--command", "RUN"], environment={"A": 1}))
+
+    assert lines == ['{"type": "LOG"}', '{"type": 1}']
+    docker_client.api.exec_create.assert_called_once_with(
+        pooled.container.id,
+        cmd=["python", "main.py", "--command", "RUN"],
+        environment={"A": "1"},
+    )
+
+    docker_client.api.exec_inspect.return_value = {"ExitCode": 1}
+    with pytest.raises(DockerException):
+        list(pool.run(pooled, command=["--command", "RUN"], environment={}))
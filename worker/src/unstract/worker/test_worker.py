@@ -0,0 +1,63 @@
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from unstract.worker.metadata_cache import ToolMetadataCache
+from unstract.worker.worker import UnstractWorker
+
+IMAGE_ID = "sha256:1234"
+METADATA = {"type": "METADATA", "spec": {}, "properties": {}}
+
+
+@pytest.fixture
+def metadata_cache(mocker):
+    mocker.patch("unstract.worker.metadata_cache.DockerClient")
+    cache = ToolMetadataCache(max_size=2, logger=logging.getLogger("test-logger"))
+    mocker.patch.object(cache, "get_image_id", return_value=IMAGE_ID)
+    return cache
+
+
+@pytest.fixture
+def worker(metadata_cache, mocker):
+    mocker.patch("unstract.worker.worker.client_class")
+    return UnstractWorker(
+        "test-image", "latest", Flask(__name__), metadata_cache=metadata_cache
+    )
+
+
+def set_tool_output(worker, lines):
+    container = MagicMock()
+    container.logs.return_value = lines
+    worker.client.run_container.return_value = container
+
+
+def test_run_command_metadata_cached(worker, metadata_cache):
+    """Test the metadata of an image is fetched from its tool only once."""
+    set_tool_output(worker, ["starting", json.dumps(METADATA)])
+
+    assert worker.run_command("metadata") == METADATA
+    assert worker.run_command("metadata") == METADATA
+    assert worker.client.run_container.call_count == 1
+    assert metadata_cache.get(IMAGE_ID) == METADATA
+
+
+def test_run_command_metadata_unsupported(worker, metadata_cache):
+    """Test images whose tools do not answer METADATA are run only once."""
+    set_tool_output(worker, ['{"type": "LOG", "log": "Unknown command"}'])
+
+    assert worker.run_command("metadata") is None
+    assert worker.run_command("metadata") is None
+    assert worker.client.run_container.call_count == 1
+    assert metadata_cache.get(IMAGE_ID) == {}
+
+
+def test_run_command_metadata_failed(worker, metadata_cache):
+    """Test failures to run a tool are not cached."""
+    worker.client.run_container.side_effect = RuntimeError("No such network")
+
+    assert worker.run_command("metadata") is None
+    assert worker.run_command("metadata") is None
+    assert worker.client.run_container.call_count == 2
+    assert metadata_cache.get(IMAGE_ID) is None
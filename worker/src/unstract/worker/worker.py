@@ -1,6 +1,7 @@
 import ast
 import json
 import os
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -11,19 +12,40 @@ from unstract.worker.clients.interface import (
     ContainerClientInterface,
     ContainerInterface,
 )
-from unstract.worker.constants import Env, LogLevel, LogType, ToolKey
+from unstract.worker.constants import (
+    Env,
+    LogLevel,
+    LogType,
+    ToolCommand,
+    ToolKey,
+    ToolResult,
+)
+from unstract.worker.container_pool import ToolContainerPool
 from unstract.worker.exception import ToolRunException
+from unstract.worker.image_cache import ToolImageCache
+from unstract.worker.metadata_cache import ToolMetadataCache
 
 from unstract.core.constants import LogFieldName
-from unstract.core.pubsub_helper import LogPublisher
+from unstract.core.pubsub_helper import BufferedLogPublisher, LogPublisher
 
 load_dotenv()
 # Loads the container clinet class.
 client_class = ContainerClientHelper.get_container_client()
+# Maximum time to wait for the logs of a run to be published
+LOG_FLUSH_TIMEOUT_SEC = 10
 
 
 class UnstractWorker:
-    def __init__(self, image_name: str, image_tag: str, app: Flask) -> None:
+    def __init__(
+        self,
+        image_name: str,
+        image_tag: str,
+        app: Flask,
+        image_cache: Optional[ToolImageCache] = None,
+        log_publisher: Optional[BufferedLogPublisher] = None,
+        metadata_cache: Optional[ToolMetadataCache] = None,
+        container_pool: Optional[ToolContainerPool] = None,
+    ) -> None:
         self.image_name = image_name
         # If no image_tag is provided will assume the `latest` tag
         self.image_tag = image_tag or "latest"
@@ -31,6 +53,10 @@ class UnstractWorker:
         self.client: ContainerClientInterface = client_class(
             self.image_name, self.image_tag, self.logger
         )
+        self.image_cache = image_cache
+        self.log_publisher = log_publisher
+        self.metadata_cache = metadata_cache
+        self.container_pool = container_pool
 
     # Function to stream logs
     def stream_logs(
@@ -41,9 +67,27 @@ class UnstractWorker:
         organization_id: str,
         channel: Optional[str] = None,
     ) -> None:
-        for line in container.logs(follow=True):
+        self.process_logs(
+            logs=container.logs(follow=True),
+            container_name=container.name,
+            tool_instance_id=tool_instance_id,
+            channel=channel,
+            execution_id=execution_id,
+            organization_id=organization_id,
+        )
+
+    def process_logs(
+        self,
+        logs: Iterator[str],
+        container_name: str,
+        tool_instance_id: str,
+        execution_id: str,
+        organization_id: str,
+        channel: Optional[str] = None,
+    ) -> None:
+        for line in logs:
             log_message = line
-            self.logger.debug(f"[{container.name}] - {log_message}")
+            self.logger.debug(f"[{container_name}] - {log_message}")
             self.process_log_message(
                 log_message=log_message,
                 tool_instance_id=tool_instance_id,
@@ -61,6 +105,9 @@ class UnstractWorker:
         Returns:
             Optional[dict[str, Any]]: json message
         """
+        # Skips parsing plain text output of tools
+        if not log_message.startswith("{"):
+            return None
         try:
             log_dict = json.loads(log_message)
             if isinstance(log_dict, dict):
@@ -98,7 +145,10 @@ class UnstractWorker:
             log_dict[LogFieldName.TIMESTAMP] = datetime.now(timezone.utc).timestamp()
 
             # Publish to channel of socket io
-            LogPublisher.publish(channel, log_dict)
+            if self.log_publisher:
+                self.log_publisher.publish(channel, log_dict)
+            else:
+                LogPublisher.publish(channel, log_dict)
         return None
 
     def is_valid_log_type(self, log_type: Optional[str]) -> bool:
@@ -134,6 +184,13 @@ class UnstractWorker:
             Optional[Any]: Response from container or None if error occures.
         """
         command = command.upper()
+        image_id: Optional[str] = None
+        if command == ToolCommand.METADATA and self.metadata_cache:
+            image_id = self.metadata_cache.get_image_id(self.client.get_image())
+            metadata = self.metadata_cache.get(image_id) if image_id else None
+            if metadata is not None:
+                # Empty for images which do not support the command
+                return metadata or None
         container_config = self.client.get_container_run_config(
             command=["--command", command],
             organization_id="",
@@ -150,7 +207,13 @@ class UnstractWorker:
             for text in container.logs(follow=True):
                 self.logger.info(f"[{container.name}] - {text}")
                 if f'"type": "{command}"' in text:
-                    return json.loads(text)
+                    response = json.loads(text)
+                    if image_id and self.metadata_cache:
+                        self.metadata_cache.set(image_id, response)
+                    return response
+            if image_id and self.metadata_cache:
+                self.logger.info(f"Image {image_id} does not support {command}")
+                self.metadata_cache.set(image_id, {})
         except Exception as e:
             self.logger.error(
                 f"Failed to run docker container: {e}", stack_info=True, exc_info=True
@@ -168,6 +231,7 @@ class UnstractWorker:
         settings: dict[str, Any],
         envs: dict[str, Any],
         messaging_channel: Optional[str] = None,
+        execution_sub_dir: Optional[str] = None,
     ) -> Optional[Any]:
         """RUN container With RUN Command.
 
@@ -177,12 +241,30 @@ class UnstractWorker:
             settings (dict[str, Any]): Tool settings
             envs (dict[str, Any]): Tool env
             messaging_channel (Optional[str], optional): socket io channel
+            execution_sub_dir (Optional[str], optional): Directory under the
+                execution directory to mount for the tool, used when files of
+                an execution are processed in parallel batches
 
         Returns:
             Optional[Any]: _description_
         """
         tool_data_dir = os.getenv(Env.TOOL_DATA_DIR, "/data")
         envs[Env.TOOL_DATA_DIR] = tool_data_dir
+        # Results are read from the data directory instead of the logs
+        envs[Env.TOOL_RESULT_FILE] = ToolResult.FILE_NAME
+        # Batches of a parallel execution get their own directory so that
+        # their tool runs do not share the SOURCE / INFILE / METADATA files
+        execution_dir = (
+            os.path.join(execution_id, execution_sub_dir)
+            if execution_sub_dir
+            else execution_id
+        )
+        # Images pulled by the cache skip being looked up in the daemon
+        image = (
+            self.image_cache.get_image(self.image_name, self.image_tag)
+            if self.image_cache
+            else None
+        )
         container_config = self.client.get_container_run_config(
             command=[
                 "--command",
@@ -194,10 +276,14 @@ class UnstractWorker:
             ],
             organization_id=organization_id,
             workflow_id=workflow_id,
-            execution_id=execution_id,
+            execution_id=execution_dir,
             run_id=run_id,
             envs=envs,
+            image=image,
         )
+        if self.image_cache and not image:
+            # Image of a tool missing from the registry, pulled for this run
+            self.image_cache.add_image(self.image_name, self.image_tag)
         # Add labels to container for logging with Loki.
         # This only required for observability.
         try:
@@ -208,22 +294,56 @@ class UnstractWorker:
 
         # Run the Docker container
         container = None
+        pooled_container = None
+        is_pooled_run_complete = False
         result = {"type": "RESULT", "result": None}
         try:
-            self.logger.info(
-                f"Execution ID: {execution_id}, running docker "
-                f"container: {container_config.get('name')}"
-            )
-            container: ContainerInterface = self.client.run_container(container_config)
             tool_instance_id = str(settings.get(ToolKey.TOOL_INSTANCE_ID))
-            # Stream logs
-            self.stream_logs(
-                container=container,
-                tool_instance_id=tool_instance_id,
-                channel=messaging_channel,
-                execution_id=execution_id,
-                organization_id=organization_id,
+            pool_key = (
+                ToolContainerPool.get_key(
+                    self.image_name, self.image_tag, container_config
+                )
+                if self.container_pool
+                else None
             )
+            if pool_key:
+                pooled_container = self.container_pool.acquire(
+                    key=pool_key, container_config=container_config
+                )
+            if pooled_container:
+                self.logger.info(
+                    f"Execution ID: {execution_id}, running tool in pooled "
+                    f"container: {pooled_container.name}"
+                )
+                self.process_logs(
+                    logs=self.container_pool.run(
+                        pooled_container,
+                        command=container_config["command"],
+                        environment=container_config["environment"],
+                    ),
+                    container_name=pooled_container.name,
+                    tool_instance_id=tool_instance_id,
+                    channel=messaging_channel,
+                    execution_id=execution_id,
+                    organization_id=organization_id,
+                )
+                is_pooled_run_complete = True
+            else:
+                self.logger.info(
+                    f"Execution ID: {execution_id}, running docker "
+                    f"container: {container_config.get('name')}"
+                )
+                container: ContainerInterface = self.client.run_container(
+                    container_config
+                )
+                # Stream logs
+                self.stream_logs(
+                    container=container,
+                    tool_instance_id=tool_instance_id,
+                    channel=messaging_channel,
+                    execution_id=execution_id,
+                    organization_id=organization_id,
+                )
         except ToolRunException as te:
             self.logger.error(
                 "Error while running docker container"
@@ -239,4 +359,17 @@ class UnstractWorker:
             result = {"type": "RESULT", "result": None, "error": str(e)}
         if container:
             container.cleanup()
+        if pooled_container:
+            # A run stopped midway might still be going on in the container
+            self.container_pool.release(
+                pooled_container, healthy=is_pooled_run_complete
+            )
+        if self.log_publisher and messaging_channel:
+            # Logs of the run are published before its result is returned
+            if not self.log_publisher.flush(
+                messaging_channel, timeout=LOG_FLUSH_TIMEOUT_SEC
+            ):
+                self.logger.warning(
+                    f"Execution ID: {execution_id}, timed out publishing logs"
+                )
         return result